@@ -5,7 +5,7 @@ Provides WebSocket and REST API endpoints for frontend
 
 import asyncio
 import json
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Optional
 from datetime import datetime
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
@@ -16,6 +16,12 @@ from core.memory import load_thoughts
 from core.learning_memory import load_learning_memory
 from hackathon_config import CAPITAL
 
+# Optional: orjson encodes/decodes WebSocket messages several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Global state
 dashboard_data: Dict[str, Any] = {
     "iteration": 0,
@@ -33,6 +39,19 @@ dashboard_data: Dict[str, Any] = {
     "last_update": datetime.now().isoformat()
 }
 
+def encode_message(message: dict) -> str:
+    """Serialize a WebSocket message to compact JSON text"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+        except TypeError:
+            pass  # Type orjson doesn't know - let the stdlib encoder handle it
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+def decode_message(message: str) -> Any:
+    """Parse an incoming WebSocket text message"""
+    return orjson.loads(message) if orjson is not None else json.loads(message)
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
@@ -52,10 +71,13 @@ class ConnectionManager:
         if not self.active_connections:
             return
         
+        # Serialize once for every client
+        payload = encode_message(message)
         disconnected = set()
-        for connection in self.active_connections:
+        # Snapshot - clients can connect/disconnect while a send is awaited
+        for connection in list(self.active_connections):
             try:
-                await connection.send_json(message)
+                await connection.send_text(payload)
             except Exception as e:
                 print(f"⚠️  Error sending to client: {e}")
                 disconnected.add(connection)
@@ -65,6 +87,15 @@ class ConnectionManager:
 
 manager = ConnectionManager()
 
+# Event loop uvicorn serves on (set at startup). The trading loop runs on its own
+# thread and hands broadcasts to this loop instead of needing one of its own.
+_server_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Pending dashboard updates, drained by one broadcaster task (oldest dropped when full)
+DASHBOARD_QUEUE_SIZE = 64
+_dashboard_queue: Optional[asyncio.Queue] = None
+_broadcaster_task: Optional[asyncio.Task] = None
+
 # FastAPI app
 app = FastAPI(
     title="Alpha Arena Trading API",
@@ -176,26 +207,26 @@ async def websocket_endpoint(websocket: WebSocket):
     
     try:
         # Send initial data
-        await websocket.send_json({
+        await websocket.send_text(encode_message({
             "type": "initial",
             "data": dashboard_data
-        })
+        }))
         
         # Keep connection alive and handle incoming messages
         while True:
             try:
                 # Receive message (ping/pong or requests)
                 message = await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-                data = json.loads(message)
+                data = decode_message(message)
                 
                 # Handle different message types
                 if data.get("type") == "ping":
-                    await websocket.send_json({"type": "pong"})
+                    await websocket.send_text(encode_message({"type": "pong"}))
                 elif data.get("type") == "get_data":
-                    await websocket.send_json({
+                    await websocket.send_text(encode_message({
                         "type": "update",
                         "data": dashboard_data
-                    })
+                    }))
                 elif data.get("type") == "get_llm_memory":
                     # Load current thoughts (AI decisions)
                     thoughts = load_thoughts()
@@ -203,18 +234,18 @@ async def websocket_endpoint(websocket: WebSocket):
                     # Load learning memory (performance data)
                     learning_memory = load_learning_memory()
                     
-                    await websocket.send_json({
+                    await websocket.send_text(encode_message({
                         "type": "llm_memory",
                         "data": {
                             "thoughts": thoughts,
                             "learning_memory": learning_memory,
                             "timestamp": datetime.now().isoformat()
                         }
-                    })
+                    }))
                     
             except asyncio.TimeoutError:
                 # Send heartbeat if no message received
-                await websocket.send_json({"type": "heartbeat"})
+                await websocket.send_text(encode_message({"type": "heartbeat"}))
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -231,39 +262,59 @@ def update_dashboard_data(data: Dict[str, Any]):
         "last_update": datetime.now().isoformat()
     }
     
-    # Broadcast to all WebSocket clients (if event loop exists)
+    # Queue a broadcast on the server loop (thread-safe)
+    loop = _server_loop
+    if loop is None or loop.is_closed():
+        return  # API server not running - nothing to broadcast to
     try:
-        import asyncio
-        # Check if there's a running event loop
-        try:
-            loop = asyncio.get_running_loop()
-            # If there is, create task
-            loop.create_task(manager.broadcast({
-                "type": "update",
-                "data": dashboard_data
-            }))
-        except RuntimeError:
-            # No event loop running, ignore broadcast
-            pass
-    except Exception:
-        # If anything fails, just continue without broadcasting
+        loop.call_soon_threadsafe(_enqueue_update, {
+            "type": "update",
+            "data": dashboard_data
+        })
+    except RuntimeError:
+        # Loop shutting down, skip this broadcast
         pass
 
-# Background task for periodic updates (optional)
-async def periodic_broadcast():
-    """Periodically broadcast data to connected clients"""
+def _enqueue_update(message: dict):
+    """Queue a dashboard update (runs on the server loop)"""
+    queue = _dashboard_queue
+    if queue is None:
+        return
+    if queue.full():
+        queue.get_nowait()  # Clients only need the latest state
+    queue.put_nowait(message)
+
+async def dashboard_broadcaster():
+    """Broadcast queued dashboard updates as they arrive"""
     while True:
-        await asyncio.sleep(2)  # Broadcast every 2 seconds
-        if manager.active_connections:
-            await manager.broadcast({
-                "type": "update",
-                "data": dashboard_data
-            })
+        message = await _dashboard_queue.get()
+        # One failed broadcast must not end the task and stall every later update
+        try:
+            await manager.broadcast(message)
+        except Exception as e:
+            print(f"⚠️  Dashboard broadcast failed: {e}")
+
+async def start_dashboard_broadcaster():
+    """Bind broadcasting to the running loop and start the broadcaster task"""
+    global _server_loop, _dashboard_queue, _broadcaster_task
+    _dashboard_queue = asyncio.Queue(maxsize=DASHBOARD_QUEUE_SIZE)
+    _broadcaster_task = asyncio.create_task(dashboard_broadcaster())
+    _server_loop = asyncio.get_running_loop()
+
+async def stop_dashboard_broadcaster():
+    """Stop accepting updates and cancel the broadcaster task"""
+    global _server_loop, _dashboard_queue, _broadcaster_task
+    _server_loop = None
+    if _broadcaster_task is not None:
+        _broadcaster_task.cancel()
+    _broadcaster_task = None
+    _dashboard_queue = None
 
 # Startup event
 @app.on_event("startup")
 async def startup_event():
     """Initialize on startup"""
+    await start_dashboard_broadcaster()
     print("\n" + "="*80)
     print("🚀 FastAPI Server Starting...")
     print("="*80)
@@ -276,6 +327,7 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
+    await stop_dashboard_broadcaster()
     print("\n🛑 FastAPI Server shutting down...")
     for connection in list(manager.active_connections):
         await connection.close()
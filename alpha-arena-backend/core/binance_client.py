@@ -6,10 +6,22 @@ Uses python-binance library to connect to Binance Futures Testnet.
 import os
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Dict, Any, List, Tuple
 from dotenv import load_dotenv
 from binance.client import Client
+from binance.exceptions import BinanceAPIException, BinanceRequestException
 from decimal import Decimal, ROUND_DOWN
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from core.binance_error_handler import call_with_backoff
+
+# Optional: orjson parses position/order/mark-price payloads several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize logging
 logger = logging.getLogger("binance_client")
@@ -35,6 +47,102 @@ else:
 
 IS_TESTNET = BINANCE_TESTNET
 
+# Keep-alive pool shared by every thread using the client (agents, live monitor,
+# API server). requests' default pool keeps only 10 connections per host.
+HTTP_POOL_SIZE = 64
+_http_adapter: Optional[HTTPAdapter] = None
+
+# Market/limit orders go over the futures WebSocket API (one persistent signed
+# socket, no per-order HTTP request) unless BINANCE_WS_ORDERS is off.
+# python-binance binds that socket to the event loop of the thread that opened
+# it, so every WebSocket call runs on one dedicated worker thread.
+WS_ORDERS_ENABLED = (os.getenv("BINANCE_WS_ORDERS") or "true").strip().lower() in ["1", "true", "yes", "on"]
+WS_ORDER_TIMEOUT_SEC = 10.0
+# After a timeout, how long to let the socket call finish before giving up on the order
+WS_ORDER_SETTLE_SEC = 30.0
+_ws_order_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="binance-ws-api")
+_ws_orders_failed = False
+
+
+class FuturesClient(Client):
+    """python-binance Client that parses REST responses with orjson when it is installed"""
+    
+    @staticmethod
+    def _handle_response(response):
+        if orjson is None:
+            return Client._handle_response(response)
+        if not (200 <= response.status_code < 300):
+            raise BinanceAPIException(response, response.status_code, response.text)
+        if not response.content:
+            return {}
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            raise BinanceRequestException("Invalid Response: %s" % response.text)
+
+
+def _create_futures_order(client: Client, **params) -> Dict[str, Any]:
+    """
+    futures_create_order() over the WebSocket API, falling back to REST.
+    
+    If the socket fails, the order is looked up by its client order id before
+    being resent over REST, so an order that did reach the exchange is never
+    submitted twice. A timed-out socket call is allowed to finish first; if it
+    still hasn't, the order fails rather than being resent. After the first
+    socket failure all orders use REST.
+    """
+    global _ws_orders_failed
+    
+    if not WS_ORDERS_ENABLED or _ws_orders_failed or not hasattr(client, "ws_futures_create_order"):
+        return client.futures_create_order(**params)
+    
+    client_order_id = params.setdefault("newClientOrderId", client.CONTRACT_ORDER_PREFIX + client.uuid22())
+    future = _ws_order_executor.submit(client.ws_futures_create_order, **params)
+    try:
+        return future.result(WS_ORDER_TIMEOUT_SEC)
+    except BinanceAPIException:
+        raise  # Exchange rejected the order - same outcome over REST
+    except Exception as e:
+        _ws_orders_failed = True
+        logger.warning(f"⚠️ WebSocket order API failed, using REST for orders: {e}")
+    
+    if not future.done():
+        # The request may still reach the exchange - a lookup now could miss it
+        wait([future], timeout=WS_ORDER_SETTLE_SEC)
+        if not future.done():
+            raise RuntimeError(
+                f"WebSocket order {client_order_id} unresolved after "
+                f"{WS_ORDER_TIMEOUT_SEC + WS_ORDER_SETTLE_SEC:.0f}s, not resending over REST"
+            )
+        error = future.exception()
+        if error is None:
+            return future.result()
+        if isinstance(error, BinanceAPIException):
+            raise error
+    
+    try:
+        return client.futures_get_order(symbol=params["symbol"], origClientOrderId=client_order_id)
+    except BinanceAPIException:
+        pass  # Never reached the exchange
+    return client.futures_create_order(**params)
+
+
+def _tune_session(client: Client) -> None:
+    """
+    Mount the shared keep-alive connection pool with connect/5xx retries on the client session.
+    
+    Every client (manager, bootstrap, tools) mounts the same adapter, so a second
+    client reuses already-handshaked TLS connections instead of opening its own pool.
+    """
+    global _http_adapter
+    if _http_adapter is None:
+        # Only reads are retried - a retried order POST/DELETE could double-submit
+        retries = Retry(total=2, connect=2, backoff_factor=0.2, allowed_methods=frozenset({"GET"}),
+                        status_forcelist=(502, 503, 504), raise_on_status=False)
+        _http_adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+    client.session.mount("https://", _http_adapter)
+    client.session.headers["Connection"] = "keep-alive"
+
 
 class BinanceClientManager:
     """Centralized manager for Binance Futures connections using python-binance"""
@@ -56,7 +164,9 @@ class BinanceClientManager:
         """Create and initialize Binance Futures client"""
         try:
             # Initialize Binance client
-            client = Client(self.api_key, self.api_secret)
+            # testnet=True also points the WebSocket order API at the testnet
+            client = FuturesClient(self.api_key, self.api_secret, testnet=self.is_testnet)
+            _tune_session(client)
             
             # Switch to testnet URL if needed
             if self.is_testnet:
@@ -216,7 +326,8 @@ def make_binance_futures_client() -> Optional[Client]:
         testnet = _env_mode in ["demo", "testnet"] or True
 
     try:
-        client = Client(api_key, api_secret)
+        client = FuturesClient(api_key, api_secret, testnet=testnet)
+        _tune_session(client)
         
         if testnet:
             client.FUTURES_URL = "https://testnet.binancefuture.com/fapi"
@@ -385,7 +496,7 @@ def get_full_balance(client: Optional[Client] = None) -> Dict[str, float]:
         raise Exception("Binance client not initialized")
     
     try:
-        balances = client.futures_account_balance()
+        balances = call_with_backoff(client.futures_account_balance)
         usdt_balance = 0.0
         for b in balances:
             if b["asset"] == "USDT":
@@ -393,7 +504,7 @@ def get_full_balance(client: Optional[Client] = None) -> Dict[str, float]:
                 break
         
         # Get account info for more details
-        account = client.futures_account()
+        account = call_with_backoff(client.futures_account)
         
         return {
             'free': float(account.get('availableBalance', 0)),
@@ -455,7 +566,8 @@ def place_order(
         
         # Create order
         if order_type.upper() == "MARKET":
-            order = client.futures_create_order(
+            order = _create_futures_order(
+                client,
                 symbol=symbol,
                 side=normalized_side,
                 type="MARKET",
@@ -466,7 +578,8 @@ def place_order(
             # LIMIT or other order types require price
             if adj_price is None:
                 raise Exception(f"{order_type} orders require a 'price' argument")
-            order = client.futures_create_order(
+            order = _create_futures_order(
+                client,
                 symbol=symbol,
                 side=normalized_side,
                 type=order_type.upper(),
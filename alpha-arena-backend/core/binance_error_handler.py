@@ -3,13 +3,149 @@ Binance Error Handler - Maps and handles common Binance API errors gracefully
 Implements item #8 from bulletproof improvements
 """
 
+import time
+import random
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Set
+import requests
 # Use the same import as order_manager.py for consistency
 from binance.exceptions import BinanceAPIException
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses Binance uses for request-weight limits: 429 = throttled,
+# 418 = IP auto-banned after ignoring 429s
+RATE_LIMIT_STATUSES = (418, 429)
+
+# Monotonic deadline before which REST calls should not be made
+_ban_until = 0.0
+
+
+def note_rate_limit(error: Exception) -> Optional[float]:
+    """
+    Record a 429/418 rate-limit response so callers can stop polling until it lifts.
+    
+    Returns:
+        Seconds to wait (from Retry-After, default 1s), or None if not a rate limit
+    """
+    global _ban_until
+    if not isinstance(error, BinanceAPIException) or error.status_code not in RATE_LIMIT_STATUSES:
+        return None
+    
+    try:
+        retry_after = float(error.response.headers.get("Retry-After", 1))
+    except (AttributeError, TypeError, ValueError):
+        retry_after = 1.0
+    _ban_until = max(_ban_until, time.monotonic() + retry_after)
+    logger.warning(f"[BinanceError] Rate limited (HTTP {error.status_code}), backing off {retry_after:.0f}s")
+    return retry_after
+
+
+def rate_limit_remaining() -> float:
+    """Seconds until the last recorded rate limit lifts (0 if not limited)"""
+    return max(0.0, _ban_until - time.monotonic())
+
+
+# Backoff for REST calls that hit a 429/418 rate limit
+RATE_LIMIT_RETRIES = 2
+MAX_INLINE_BACKOFF_SEC = 10.0  # Longer bans abort the call; pollers skip passes instead
+
+
+def call_with_backoff(fn, *args, **kwargs):
+    """
+    Call a client.futures_* method, backing off exponentially on rate-limit responses.
+    
+    Waits for Retry-After, or a full-jitter exponential delay if that is longer.
+    Re-raises once retries are exhausted, the ban is longer than
+    MAX_INLINE_BACKOFF_SEC, or the error is not a rate limit. Safe for order
+    placement: a 429/418 is returned before the order is processed.
+    """
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            return fn(*args, **kwargs)
+        except BinanceAPIException as e:
+            retry_after = note_rate_limit(e)
+            if retry_after is None or attempt == RATE_LIMIT_RETRIES:
+                raise
+            delay = max(retry_after, random.uniform(0, 2.0 ** attempt))
+            if delay > MAX_INLINE_BACKOFF_SEC:
+                raise
+            time.sleep(delay)
+
+
+# Per-endpoint outage breaker: after OUTAGE_FAILURE_THRESHOLD consecutive
+# 5xx/network failures an endpoint fails fast for OUTAGE_RECOVERY_SEC, then a
+# single probe call is let through to test recovery
+OUTAGE_FAILURE_THRESHOLD = 5
+OUTAGE_RECOVERY_SEC = 30.0
+
+_outage_lock = threading.Lock()
+_outage_failures: Dict[str, int] = {}
+_outage_open_until: Dict[str, float] = {}
+_outage_probing: Set[str] = set()
+
+# Bulkheads: cap in-flight guarded calls so a burst (close-all, cancel-all,
+# many agents at once) queues here instead of tripping Binance order/weight limits
+ORDER_MAX_IN_FLIGHT = 10
+READ_MAX_IN_FLIGHT = 20
+_order_slots = threading.BoundedSemaphore(ORDER_MAX_IN_FLIGHT)
+_read_slots = threading.BoundedSemaphore(READ_MAX_IN_FLIGHT)
+_ORDER_ENDPOINTS = {"order", "cancel"}
+
+
+class EndpointUnavailable(Exception):
+    """Raised instead of calling Binance while an endpoint's breaker is open"""
+
+
+def _is_outage(error: Exception) -> bool:
+    """True for errors that mean Binance is degraded rather than rejecting the request"""
+    if isinstance(error, BinanceAPIException):
+        return error.status_code >= 500
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _record_outcome(endpoint: str, outage: bool) -> None:
+    with _outage_lock:
+        _outage_probing.discard(endpoint)
+        if not outage:
+            _outage_failures.pop(endpoint, None)
+            _outage_open_until.pop(endpoint, None)
+            return
+        failures = _outage_failures.get(endpoint, 0) + 1
+        _outage_failures[endpoint] = failures
+        if failures >= OUTAGE_FAILURE_THRESHOLD:
+            _outage_open_until[endpoint] = time.monotonic() + OUTAGE_RECOVERY_SEC
+            logger.warning(f"[BinanceError] {endpoint} failing ({failures} in a row), pausing calls for {OUTAGE_RECOVERY_SEC:.0f}s")
+
+
+def guarded_call(endpoint: str, fn, *args, **kwargs):
+    """
+    call_with_backoff() behind the endpoint's outage breaker and bulkhead.
+    
+    "order" and "cancel" share the order bulkhead; every other endpoint
+    counts against the read bulkhead.
+    
+    Raises:
+        EndpointUnavailable: breaker open (or another caller is probing) - Binance was not called
+    """
+    with _outage_lock:
+        open_until = _outage_open_until.get(endpoint)
+        if open_until is not None:
+            if time.monotonic() < open_until or endpoint in _outage_probing:
+                raise EndpointUnavailable(f"Binance {endpoint} endpoint unavailable (circuit open)")
+            _outage_probing.add(endpoint)  # Half-open: this call is the probe
+    
+    slots = _order_slots if endpoint in _ORDER_ENDPOINTS else _read_slots
+    try:
+        with slots:
+            result = call_with_backoff(fn, *args, **kwargs)
+    except Exception as e:
+        _record_outcome(endpoint, _is_outage(e))
+        raise
+    _record_outcome(endpoint, False)
+    return result
+
 
 def handle_binance_error(error: Exception, context: str = "", symbol: str = "") -> Dict[str, Any]:
     """
@@ -1,15 +1,17 @@
 """
 Comprehensive CSV Logging System with Buffering
 Stores all trading decisions, errors, trades, and learning data in CSV files.
-Buffered writes for optimal performance (flushed every 5-10 cycles).
+Rows are queued and written in batches by a background writer thread, so
+trading threads never block on disk I/O.
 """
 
 import csv
 import os
 import time
+import queue
 import logging
-from typing import Dict, Any, Optional, List
-from collections import deque
+import threading
+from typing import Dict, Any, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +22,15 @@ TRADES_LOG = os.path.join(CSV_DIR, "trades_log.csv")
 ERRORS_LOG = os.path.join(CSV_DIR, "errors_log.csv")
 LEARNING_LOG = os.path.join(CSV_DIR, "learning_log.csv")
 
-# In-memory buffers (flushed every N cycles)
-_decisions_buffer: deque = deque(maxlen=1000)
-_trades_buffer: deque = deque(maxlen=1000)
-_errors_buffer: deque = deque(maxlen=1000)
-_learning_buffer: deque = deque(maxlen=1000)
+# Background writer: rows are batched and appended every N rows or M seconds
+_WRITE_BATCH_ROWS = 100
+_WRITE_BATCH_SEC = 2.0
+_FLUSH_TIMEOUT_SEC = 5.0
 
-# Flush counter
-_flush_counter = 0
-_FLUSH_INTERVAL = 7  # Flush every 7 cycles (between 5-10)
+_write_queue: "queue.Queue" = queue.Queue()
+_writer_thread: Optional[threading.Thread] = None
+_writer_start_lock = threading.Lock()
+_checked_headers: set = set()  # Paths whose on-disk header was verified (writer thread only)
 
 
 def ensure_csv_dir():
@@ -36,60 +38,103 @@ def ensure_csv_dir():
     os.makedirs(CSV_DIR, exist_ok=True)
 
 
-def _append_to_csv(file_path: str, header: List[str], row: List[Any], buffer: deque):
-    """Append row to buffer (will be flushed to CSV later)"""
-    buffer.append(row)
+def _ensure_writer():
+    """Start the background writer thread if it is not running"""
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_start_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(target=_writer_loop, name="csv-writer", daemon=True)
+            _writer_thread.start()
 
 
-def flush_all_csvs():
-    """Flush all buffers to CSV files (called every 5-10 cycles)"""
-    global _flush_counter
-    _flush_counter += 1
-    
-    if _flush_counter < _FLUSH_INTERVAL:
-        return  # Not time to flush yet
-    
-    _flush_counter = 0  # Reset counter
+def _append_to_csv(file_path: str, header: List[str], row: List[Any]):
+    """Queue row for the background writer"""
+    _ensure_writer()
+    _write_queue.put((file_path, header, row))
+
+
+def _writer_loop():
+    """Drain the write queue, appending rows in per-file batches"""
+    pending: Dict[str, Tuple[List[str], List[List[Any]]]] = {}
+    pending_rows = 0
+    deadline = None
     
-    try:
-        ensure_csv_dir()
-        
-        # Flush decisions
-        if _decisions_buffer:
-            _flush_buffer(DECISIONS_LOG, _decisions_buffer, _get_decisions_header())
-            _decisions_buffer.clear()
-        
-        # Flush trades
-        if _trades_buffer:
-            _flush_buffer(TRADES_LOG, _trades_buffer, _get_trades_header())
-            _trades_buffer.clear()
+    while True:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            item = _write_queue.get(timeout=timeout)
+        except queue.Empty:
+            item = None  # Batch window elapsed
         
-        # Flush errors
-        if _errors_buffer:
-            _flush_buffer(ERRORS_LOG, _errors_buffer, _get_errors_header())
-            _errors_buffer.clear()
+        flush_done = None
+        if isinstance(item, threading.Event):
+            flush_done = item
+        elif item is not None:
+            file_path, header, row = item
+            pending.setdefault(file_path, (header, []))[1].append(row)
+            pending_rows += 1
+            if deadline is None:
+                deadline = time.monotonic() + _WRITE_BATCH_SEC
+            if pending_rows < _WRITE_BATCH_ROWS and time.monotonic() < deadline:
+                continue
         
-        # Flush learning
-        if _learning_buffer:
-            _flush_buffer(LEARNING_LOG, _learning_buffer, _get_learning_header())
-            _learning_buffer.clear()
-            
-        logger.debug(f"✅ Flushed all CSV buffers to disk")
+        if pending:
+            _write_pending(pending)
+            pending = {}
+            pending_rows = 0
+        deadline = None
+        if flush_done is not None:
+            flush_done.set()
+
+
+def _write_pending(pending: Dict[str, Tuple[List[str], List[List[Any]]]]):
+    """Append every pending batch to its CSV file"""
+    try:
+        ensure_csv_dir()
     except Exception as e:
-        logger.error(f"❌ Error flushing CSV buffers: {e}")
+        logger.error(f"❌ Error creating CSV directory: {e}")
+        return
+    
+    for file_path, (header, rows) in pending.items():
+        try:
+            _flush_buffer(file_path, rows, header)
+        except Exception as e:
+            logger.error(f"❌ Error writing {len(rows)} rows to {file_path}: {e}")
+
+
+def flush_all_csvs():
+    """Per-cycle hook; rows are written by the background writer, this only keeps it alive"""
+    _ensure_writer()
 
 
-def _flush_buffer(file_path: str, buffer: deque, header: List[str]):
-    """Write buffer to CSV file"""
+def _flush_buffer(file_path: str, rows: List[List[Any]], header: List[str]):
+    """Write rows to CSV file"""
+    if file_path not in _checked_headers:
+        _rotate_if_header_changed(file_path, header)
+        _checked_headers.add(file_path)
+    
     file_exists = os.path.exists(file_path)
     
-    with open(file_path, "a", newline="", encoding="utf-8") as f:
+    with open(file_path, "a", newline="", encoding="utf-8", buffering=1 << 16) as f:
         writer = csv.writer(f)
         if not file_exists:
             writer.writerow(header)
-        
-        for row in buffer:
-            writer.writerow(row)
+        writer.writerows(rows)
+
+
+def _rotate_if_header_changed(file_path: str, header: List[str]):
+    """Move aside an existing CSV written with a different schema so columns never drift"""
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, newline="", encoding="utf-8") as f:
+        existing = next(csv.reader(f), None)
+    if existing is not None and existing != header:
+        root, ext = os.path.splitext(file_path)
+        rotated = f"{root}_{int(time.time())}{ext}"
+        os.replace(file_path, rotated)
+        logger.warning(f"⚠️ CSV schema changed for {file_path}, previous log moved to {rotated}")
 
 
 def _get_decisions_header() -> List[str]:
@@ -180,7 +225,7 @@ def log_decision(
         "true" if confidence_check_passed else "false"
     ]
     
-    _append_to_csv(DECISIONS_LOG, _get_decisions_header(), row, _decisions_buffer)
+    _append_to_csv(DECISIONS_LOG, _get_decisions_header(), row)
 
 
 # ============================================================================
@@ -238,7 +283,7 @@ def log_trade(
         f"{hold_duration_sec:.2f}" if hold_duration_sec > 0 else ""
     ]
     
-    _append_to_csv(TRADES_LOG, _get_trades_header(), row, _trades_buffer)
+    _append_to_csv(TRADES_LOG, _get_trades_header(), row)
 
 
 # ============================================================================
@@ -270,7 +315,7 @@ def log_error(
         order_id
     ]
     
-    _append_to_csv(ERRORS_LOG, _get_errors_header(), row, _errors_buffer)
+    _append_to_csv(ERRORS_LOG, _get_errors_header(), row)
 
 
 # ============================================================================
@@ -314,7 +359,7 @@ def log_learning(
         f"{hold_duration_sec:.2f}" if hold_duration_sec > 0 else ""
     ]
     
-    _append_to_csv(LEARNING_LOG, _get_learning_header(), row, _learning_buffer)
+    _append_to_csv(LEARNING_LOG, _get_learning_header(), row)
 
 
 # ============================================================================
@@ -322,8 +367,10 @@ def log_learning(
 # ============================================================================
 
 def force_flush_all():
-    """Force flush all buffers immediately (call on shutdown)"""
-    global _flush_counter
-    _flush_counter = _FLUSH_INTERVAL  # Trigger flush
-    flush_all_csvs()
+    """Force flush all queued rows immediately (call on shutdown)"""
+    _ensure_writer()
+    done = threading.Event()
+    _write_queue.put(done)
+    if not done.wait(_FLUSH_TIMEOUT_SEC):
+        logger.warning("⚠️ Timed out waiting for CSV writer to flush")
 
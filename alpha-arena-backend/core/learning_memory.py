@@ -4,11 +4,24 @@ Learning Memory Module - Tracks trading performance and enables adaptive learnin
 import json
 import os
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 LEARNING_LOG = "db/learning_memory.json"
 
+# Bumped on every learning-memory write so derived caches (strategy weights)
+# can tell when they are stale without recomputing
+_weights_epoch = 0
+
+def bump_weights_epoch() -> None:
+    """Mark strategy weights derived from learning memory as stale"""
+    global _weights_epoch
+    _weights_epoch += 1
+
+def get_weights_epoch() -> int:
+    """Current learning-memory write epoch"""
+    return _weights_epoch
+
 def load_learning_memory() -> Dict[str, Any]:
     """Load learning memory from file"""
     if not os.path.exists(LEARNING_LOG):
@@ -62,7 +75,14 @@ def update_learning_memory(symbol: str, decision: Dict[str, Any], outcome: Dict[
         if len(learning_data[symbol]) > 1000:
             learning_data[symbol] = learning_data[symbol][-1000:]
         
-        return save_learning_memory(learning_data)
+        saved = save_learning_memory(learning_data)
+        bump_weights_epoch()
+        
+        # Lazy import to avoid a circular dependency with strategy_analytics
+        from core.strategy_analytics import invalidate_strategy_cache
+        invalidate_strategy_cache()
+        
+        return saved
     except Exception:
         return False
 
@@ -179,14 +199,18 @@ def analyze_strategy_performance(hours: int = 168) -> Dict[str, Any]:
     
     return strategy_stats
 
-def get_strategy_weights() -> Dict[str, float]:
+def get_strategy_weights(strategy_stats: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
     """
     Get adaptive strategy weights based on recent performance
     
+    Args:
+        strategy_stats: Precomputed output of analyze_strategy_performance (optional)
+    
     Returns:
         Dict mapping strategy names to weight multipliers
     """
-    strategy_stats = analyze_strategy_performance()
+    if strategy_stats is None:
+        strategy_stats = analyze_strategy_performance()
     weights = {}
     
     # Base weights - all strategies start equal
@@ -0,0 +1,348 @@
+"""
+Market Stream - WebSocket mark prices and position updates
+Keeps a process-local cache of Binance Futures mark prices (!markPrice@arr@1s),
+last traded prices (!ticker@arr), positions (user-data ACCOUNT_UPDATE events) and open orders (ORDER_TRADE_UPDATE
+events) so the live monitor can react to pushes instead of polling REST every
+few seconds.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Any
+
+logger = logging.getLogger("market_stream")
+
+# Mark prices older than this are treated as a dropped stream (REST fallback)
+STREAM_STALE_SEC = 10.0
+# Re-seed the position mirror from REST at least this often as a safety net
+POSITION_RESYNC_SEC = 60.0
+
+_state_lock = threading.Lock()
+_mark_prices: Dict[str, float] = {}
+_mark_updated_at = 0.0
+# Last traded prices: {symbol: (price, event_time_ms)}
+_last_prices: Dict[str, tuple] = {}
+_ticker_updated_at = 0.0
+_positions: Dict[str, Dict[str, Any]] = {}
+_positions_seeded_at: Optional[float] = None
+# Open orders: {symbol: {orderId: REST-shaped order dict}}
+_open_orders: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+_orders_seeded_at: Optional[float] = None
+
+# Order statuses that take an order off the book
+_ORDER_DONE_STATUSES = {"FILLED", "CANCELED", "EXPIRED", "REJECTED", "EXPIRED_IN_MATCH"}
+
+# TP/SL trigger levels pushed by the live monitor: {symbol: (is_long, tp_price, sl_price)}
+_tpsl_triggers: Dict[str, tuple] = {}
+_fired_triggers: set = set()
+
+# Set whenever the monitor should run a pass early (position change or TP/SL crossed)
+_wakeup = threading.Event()
+
+_twm = None
+
+
+def start_streams(api_key: str, api_secret: str, testnet: bool = False) -> bool:
+    """
+    Start the mark-price, ticker and user-data streams.
+
+    Returns:
+        True if both sockets were started, False if callers should keep polling REST
+    """
+    global _twm
+
+    if _twm is not None:
+        return True
+
+    try:
+        from binance import ThreadedWebsocketManager
+    except ImportError:
+        logger.warning("⚠️ [MarketStream] python-binance websocket support unavailable, using REST polling")
+        return False
+
+    try:
+        twm = ThreadedWebsocketManager(api_key=api_key, api_secret=api_secret, testnet=testnet)
+        twm.start()
+        twm.start_all_mark_price_socket(callback=_handle_mark_prices)
+        twm.start_all_ticker_futures_socket(callback=_handle_tickers)
+        twm.start_futures_user_socket(callback=_handle_user_event)
+    except Exception as e:
+        logger.warning("⚠️ [MarketStream] Failed to start streams, using REST polling: %s", e)
+        return False
+
+    _twm = twm
+    logger.info("✅ [MarketStream] Mark-price and user-data streams started")
+    return True
+
+
+def stop_streams() -> None:
+    """Stop the streams and drop all cached state."""
+    global _twm, _mark_updated_at, _ticker_updated_at, _positions_seeded_at, _orders_seeded_at
+
+    twm = _twm
+    _twm = None
+    if twm is not None:
+        try:
+            twm.stop()
+        except Exception as e:
+            logger.debug("[MarketStream] Error stopping streams: %s", e)
+
+    with _state_lock:
+        _mark_prices.clear()
+        _mark_updated_at = 0.0
+        _last_prices.clear()
+        _ticker_updated_at = 0.0
+        _positions.clear()
+        _positions_seeded_at = None
+        _open_orders.clear()
+        _orders_seeded_at = None
+        _tpsl_triggers.clear()
+        _fired_triggers.clear()
+    _wakeup.set()
+
+
+def _handle_mark_prices(msg) -> None:
+    """Callback for !markPrice@arr: update prices and wake the monitor on TP/SL crossings."""
+    global _mark_updated_at
+
+    if isinstance(msg, dict):
+        if msg.get("e") == "error":
+            logger.warning("⚠️ [MarketStream] Mark-price stream error: %s", msg.get('m'))
+            with _state_lock:
+                _mark_updated_at = 0.0
+            return
+        msg = msg.get("data", [])
+
+    crossed = False
+    with _state_lock:
+        for item in msg:
+            symbol = item.get("s")
+            try:
+                price = float(item.get("p", 0))
+            except (TypeError, ValueError):
+                continue
+            if not symbol or price <= 0:
+                continue
+            _mark_prices[symbol] = price
+
+            trigger = _tpsl_triggers.get(symbol)
+            if trigger is None:
+                continue
+            is_long, tp_price, sl_price = trigger
+            if is_long:
+                hit = price >= tp_price or price <= sl_price
+            else:
+                hit = price <= tp_price or price >= sl_price
+            if hit and symbol not in _fired_triggers:
+                _fired_triggers.add(symbol)
+                crossed = True
+            elif not hit:
+                _fired_triggers.discard(symbol)
+        _mark_updated_at = time.monotonic()
+
+    if crossed:
+        _wakeup.set()
+
+
+def _handle_tickers(msg) -> None:
+    """Callback for !ticker@arr: cache last traded prices."""
+    global _ticker_updated_at
+
+    if isinstance(msg, dict):
+        if msg.get("e") == "error":
+            logger.warning("⚠️ [MarketStream] Ticker stream error: %s", msg.get('m'))
+            with _state_lock:
+                _ticker_updated_at = 0.0
+            return
+        msg = msg.get("data", [])
+
+    with _state_lock:
+        for item in msg:
+            symbol = item.get("s")
+            try:
+                price = float(item.get("c", 0))
+            except (TypeError, ValueError):
+                continue
+            if symbol and price > 0:
+                _last_prices[symbol] = (price, item.get("E"))
+        _ticker_updated_at = time.monotonic()
+
+
+def _handle_user_event(msg) -> None:
+    """Callback for the futures user-data stream: mirror position and order changes."""
+    global _positions_seeded_at, _orders_seeded_at
+
+    event = msg.get("e") if isinstance(msg, dict) else None
+    if event == "error" or event == "listenKeyExpired":
+        logger.warning("⚠️ [MarketStream] User-data stream interrupted (%s), re-seeding from REST", event)
+        with _state_lock:
+            _positions_seeded_at = None
+            _orders_seeded_at = None
+        _wakeup.set()
+        return
+    if event == "ORDER_TRADE_UPDATE":
+        _apply_order_update(msg.get("o", {}))
+        return
+    if event != "ACCOUNT_UPDATE":
+        return
+
+    with _state_lock:
+        for pos in msg.get("a", {}).get("P", []):
+            symbol = pos.get("s")
+            if not symbol:
+                continue
+            if float(pos.get("pa", 0)) == 0.0:
+                _positions.pop(symbol, None)
+                _tpsl_triggers.pop(symbol, None)
+                _fired_triggers.discard(symbol)
+            else:
+                mirrored = {
+                    "symbol": symbol,
+                    "positionAmt": pos.get("pa"),
+                    "entryPrice": pos.get("ep"),
+                    "unRealizedProfit": pos.get("up", "0"),
+                }
+                # ACCOUNT_UPDATE doesn't carry leverage; keep the REST-seeded value
+                previous = _positions.get(symbol)
+                if previous is not None and "leverage" in previous:
+                    mirrored["leverage"] = previous["leverage"]
+                _positions[symbol] = mirrored
+    _wakeup.set()
+
+
+def _apply_order_update(order: Dict[str, Any]) -> None:
+    """Add or drop one order from the open-order mirror."""
+    symbol = order.get("s")
+    order_id = order.get("i")
+    if not symbol or order_id is None:
+        return
+
+    with _state_lock:
+        if order.get("X") in _ORDER_DONE_STATUSES:
+            orders = _open_orders.get(symbol)
+            if orders is not None:
+                orders.pop(order_id, None)
+                if not orders:
+                    del _open_orders[symbol]
+        else:
+            _open_orders.setdefault(symbol, {})[order_id] = {
+                "symbol": symbol,
+                "orderId": order_id,
+                "type": order.get("o"),
+                "side": order.get("S"),
+                "stopPrice": order.get("sp"),
+                "reduceOnly": order.get("R", False),
+                "closePosition": order.get("cp", False),
+                "status": order.get("X"),
+            }
+
+
+def seed_positions(positions: List[Dict[str, Any]]) -> None:
+    """
+    Replace the position mirror with a REST futures_position_information() snapshot.
+
+    When the mirror was already live, differences from the snapshot are logged
+    as stream drift (missed or out-of-order user-data events).
+    """
+    global _positions_seeded_at
+
+    fresh = {
+        pos["symbol"]: pos for pos in positions
+        if float(pos.get("positionAmt", 0)) != 0.0
+    }
+    with _state_lock:
+        drift = []
+        if _positions_seeded_at is not None:
+            for symbol in _positions.keys() | fresh.keys():
+                mirrored = _positions.get(symbol)
+                actual = fresh.get(symbol)
+                mirrored_amt = float(mirrored.get("positionAmt", 0)) if mirrored else 0.0
+                actual_amt = float(actual.get("positionAmt", 0)) if actual else 0.0
+                if mirrored_amt != actual_amt:
+                    drift.append((symbol, mirrored_amt, actual_amt))
+        _positions.clear()
+        _positions.update(fresh)
+        _positions_seeded_at = time.monotonic()
+
+    for symbol, mirrored_amt, actual_amt in drift:
+        logger.warning(
+            "⚠️ [MarketStream] Position mirror drift on %s: stream=%s rest=%s",
+            symbol, mirrored_amt, actual_amt
+        )
+
+
+def seed_open_orders(orders: List[Dict[str, Any]]) -> None:
+    """Replace the open-order mirror with a REST futures_get_open_orders() snapshot."""
+    global _orders_seeded_at
+
+    with _state_lock:
+        _open_orders.clear()
+        for order in orders:
+            _open_orders.setdefault(order["symbol"], {})[order["orderId"]] = order
+        _orders_seeded_at = time.monotonic()
+
+
+def get_positions() -> Optional[List[Dict[str, Any]]]:
+    """
+    Get open positions from the stream mirror.
+
+    Returns:
+        List of REST-shaped position dicts, or None when the mirror needs a REST re-seed
+    """
+    with _state_lock:
+        now = time.monotonic()
+        if _positions_seeded_at is None or now - _positions_seeded_at > POSITION_RESYNC_SEC:
+            return None
+        if now - _mark_updated_at > STREAM_STALE_SEC:
+            return None
+        return list(_positions.values())
+
+
+def get_mark_price(symbol: str) -> Optional[float]:
+    """Get the streamed mark price for a symbol, or None if missing or stale."""
+    with _state_lock:
+        if time.monotonic() - _mark_updated_at > STREAM_STALE_SEC:
+            return None
+        return _mark_prices.get(symbol)
+
+
+def get_last_price(symbol: str) -> Optional[tuple]:
+    """Get the streamed (last price, event time ms) for a symbol, or None if missing or stale."""
+    with _state_lock:
+        if time.monotonic() - _ticker_updated_at > STREAM_STALE_SEC:
+            return None
+        return _last_prices.get(symbol)
+
+
+def get_open_orders(symbol: str) -> Optional[List[Dict[str, Any]]]:
+    """Get mirrored open orders for a symbol, or None when the mirror needs a REST re-seed."""
+    with _state_lock:
+        if _orders_seeded_at is None or time.monotonic() - _orders_seeded_at > POSITION_RESYNC_SEC:
+            return None
+        return list(_open_orders.get(symbol, {}).values())
+
+
+def set_tpsl_trigger(symbol: str, is_long: bool, tp_price: float, sl_price: float) -> None:
+    """Register TP/SL levels so a crossing mark price wakes the monitor immediately."""
+    with _state_lock:
+        _tpsl_triggers[symbol] = (is_long, tp_price, sl_price)
+
+
+def clear_tpsl_trigger(symbol: str) -> None:
+    """Forget TP/SL levels for a closed position."""
+    with _state_lock:
+        _tpsl_triggers.pop(symbol, None)
+        _fired_triggers.discard(symbol)
+
+
+def wait_for_event(timeout: float) -> bool:
+    """
+    Block until a stream event asks for an early pass or the timeout elapses.
+
+    Returns:
+        True if woken by an event, False on timeout
+    """
+    woken = _wakeup.wait(timeout)
+    _wakeup.clear()
+    return woken
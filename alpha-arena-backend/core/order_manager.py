@@ -1881,7 +1881,7 @@ def place_take_profit_and_stop_loss(client: Client, symbol: str, side: str, qty:
         tpsl_hash = generate_tpsl_hash(binance_symbol, normalized_side, tp_price, sl_price)
         
         if is_tpsl_duplicate(binance_symbol, tpsl_hash):
-            logger.info(f"[TPSL Dedupe] Skipping duplicate TP/SL for {binance_symbol} (hash: {tpsl_hash[:20]}...)")
+            logger.info(f"[TPSL Dedupe] Skipping duplicate TP/SL for {binance_symbol} (hash: {tpsl_hash:x})")
             # Still return existing orders if found
             try:
                 existing_orders = _retryable_futures_get_open_orders(client, symbol=binance_symbol)
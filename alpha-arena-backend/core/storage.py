@@ -1,13 +1,84 @@
-import sqlite3, time, os
-from typing import Optional, Dict, Any, List
+import sqlite3, time, os, threading
+from typing import Optional, Dict, Any, List, Tuple
 from hackathon_config import MAIN_DB
 
+# WAL checkpointing runs on a dedicated background connection so the
+# committing (trading) thread never pays for an in-commit checkpoint.
+WAL_CHECKPOINT_INTERVAL_SEC = 30
+_checkpoint_thread: Optional[threading.Thread] = None
+_checkpoint_stop = threading.Event()
+
+# In-process cache of open positions keyed by (symbol, agent_id). A cached
+# None means "known to have no open position". All writes to open_positions
+# go through this module, so entries are kept in sync without a TTL.
+_open_pos_cache: Dict[tuple, Optional[Dict[str, Any]]] = {}
+_open_pos_cache_lock = threading.Lock()
+# Bumped by every write; a read-through fill is dropped if a write raced its SELECT
+_open_pos_cache_gen = 0
+
+
+def _connect() -> sqlite3.Connection:
+    """Open a connection with the in-commit autocheckpointer disabled"""
+    con = sqlite3.connect(MAIN_DB)
+    # wal_autocheckpoint is per-connection, so it must be set on every connection
+    con.execute("PRAGMA wal_autocheckpoint=0")
+    return con
+
+
+def _checkpoint_loop(interval: float):
+    """Periodically run a PASSIVE checkpoint until stopped"""
+    con = sqlite3.connect(MAIN_DB, check_same_thread=False)
+    try:
+        while not _checkpoint_stop.wait(interval):
+            try:
+                con.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error as e:
+                print(f"Error running WAL checkpoint: {e}")
+    finally:
+        con.close()
+
+
+def start_wal_checkpointer(interval: float = WAL_CHECKPOINT_INTERVAL_SEC) -> threading.Thread:
+    """Start the background WAL checkpoint thread (idempotent)"""
+    global _checkpoint_thread
+
+    if _checkpoint_thread is not None and _checkpoint_thread.is_alive():
+        return _checkpoint_thread
+
+    _checkpoint_stop.clear()
+    _checkpoint_thread = threading.Thread(
+        target=_checkpoint_loop, args=(interval,), name="wal-checkpointer", daemon=True
+    )
+    _checkpoint_thread.start()
+    return _checkpoint_thread
+
+
+def stop_wal_checkpointer():
+    """Stop the checkpoint thread and truncate the WAL file to bound its size"""
+    global _checkpoint_thread
+
+    _checkpoint_stop.set()
+    if _checkpoint_thread is not None:
+        _checkpoint_thread.join(timeout=5)
+        _checkpoint_thread = None
+
+    try:
+        con = sqlite3.connect(MAIN_DB)
+        con.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        con.close()
+    except sqlite3.Error as e:
+        print(f"Error truncating WAL: {e}")
+
+
 def init_db():
     """Initialize main database with trades, equity, positions, and order tracking"""
     os.makedirs("db", exist_ok=True)
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     
+    # WAL lets readers proceed during writes; checkpoints run off-thread
+    cur.execute("PRAGMA journal_mode=WAL")
+    
     # Trades table (completed trades)
     cur.execute("""CREATE TABLE IF NOT EXISTS trades(
         ts REAL, agent_id TEXT, symbol TEXT, side TEXT, qty REAL, 
@@ -68,11 +139,13 @@ def init_db():
     
     con.commit()
     con.close()
+    
+    start_wal_checkpointer()
 
 def log_trade(agent_id: str, symbol: str, side: str, qty: float, entry: float, 
               exit: float, pnl: float, confidence: float, reasoning: str = ""):
     """Log a completed trade to database"""
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     cur.execute("INSERT INTO trades (ts, agent_id, symbol, side, qty, entry, exit, pnl, confidence, reasoning) VALUES(?,?,?,?,?,?,?,?,?,?)",
                 (time.time(), agent_id, symbol, side, qty, entry, exit, pnl, confidence, reasoning))
@@ -81,16 +154,27 @@ def log_trade(agent_id: str, symbol: str, side: str, qty: float, entry: float,
 
 def log_equity(agent_id: str, equity: float):
     """Log current equity for an agent"""
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     cur.execute("INSERT INTO equity_history (ts, agent_id, equity) VALUES(?,?,?)",
                 (time.time(), agent_id, equity))
     con.commit()
     con.close()
 
+def log_equity_bulk(rows: List[Tuple[str, float]]):
+    """Log (agent_id, equity) rows for several agents in one transaction (one fsync)"""
+    if not rows:
+        return
+    ts = time.time()
+    con = _connect()
+    with con:
+        con.executemany("INSERT INTO equity_history (ts, agent_id, equity) VALUES(?,?,?)",
+                        [(ts, agent_id, equity) for agent_id, equity in rows])
+    con.close()
+
 def get_trades(agent_id: str = None, limit: int = 100):
     """Retrieve trades, optionally filtered by agent"""
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     
     if agent_id:
@@ -105,7 +189,7 @@ def get_trades(agent_id: str = None, limit: int = 100):
 
 def get_equity_history(agent_id: str):
     """Retrieve equity history for an agent"""
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     cur.execute("SELECT ts, equity FROM equity_history WHERE agent_id = ? ORDER BY ts", 
                (agent_id,))
@@ -130,23 +214,45 @@ def log_position_open(
     exchange_order_id: str = None
 ) -> Optional[int]:
     """Log opening of a new position"""
+    global _open_pos_cache_gen
     try:
-        con = sqlite3.connect(MAIN_DB)
+        now = time.time()
+        con = _connect()
         cur = con.cursor()
         cur.execute(
             """INSERT INTO open_positions 
             (symbol, agent_id, side, quantity, entry_price, leverage, opened_at, 
              confidence, reasoning, exchange_order_id, status, last_verified) 
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'open', ?)""",
-            (symbol, agent_id, side, quantity, entry_price, leverage, time.time(),
-             confidence, reasoning, exchange_order_id, time.time())
+            (symbol, agent_id, side, quantity, entry_price, leverage, now,
+             confidence, reasoning, exchange_order_id, now)
         )
         position_id = cur.lastrowid
         con.commit()
         con.close()
+        
+        with _open_pos_cache_lock:
+            _open_pos_cache_gen += 1
+            _open_pos_cache[(symbol, agent_id)] = {
+                'id': position_id,
+                'symbol': symbol,
+                'agent_id': agent_id,
+                'side': side,
+                'quantity': quantity,
+                'entry_price': entry_price,
+                'leverage': leverage,
+                'opened_at': now,
+                'confidence': confidence,
+                'reasoning': reasoning,
+                'exchange_order_id': exchange_order_id,
+                'last_verified': now
+            }
         return position_id
     except sqlite3.IntegrityError:
-        # Position already exists
+        # Position already exists - let the next read reload it from the database
+        with _open_pos_cache_lock:
+            _open_pos_cache_gen += 1
+            _open_pos_cache.pop((symbol, agent_id), None)
         return None
     except Exception as e:
         print(f"Error logging position open: {e}")
@@ -155,7 +261,14 @@ def log_position_open(
 
 def get_open_position(symbol: str, agent_id: str) -> Optional[Dict[str, Any]]:
     """Get open position for symbol and agent (fast local check)"""
-    con = sqlite3.connect(MAIN_DB)
+    key = (symbol, agent_id)
+    with _open_pos_cache_lock:
+        if key in _open_pos_cache:
+            cached = _open_pos_cache[key]
+            return dict(cached) if cached is not None else None
+        generation = _open_pos_cache_gen
+    
+    con = _connect()
     cur = con.cursor()
     cur.execute(
         """SELECT id, symbol, agent_id, side, quantity, entry_price, leverage, 
@@ -167,8 +280,9 @@ def get_open_position(symbol: str, agent_id: str) -> Optional[Dict[str, Any]]:
     row = cur.fetchone()
     con.close()
     
+    position = None
     if row:
-        return {
+        position = {
             'id': row[0],
             'symbol': row[1],
             'agent_id': row[2],
@@ -182,12 +296,17 @@ def get_open_position(symbol: str, agent_id: str) -> Optional[Dict[str, Any]]:
             'exchange_order_id': row[10],
             'last_verified': row[11]
         }
-    return None
+    
+    with _open_pos_cache_lock:
+        # Only fill if no write landed while the lock wasn't held
+        if _open_pos_cache_gen == generation and key not in _open_pos_cache:
+            _open_pos_cache[key] = position
+    return dict(position) if position is not None else None
 
 
 def get_all_open_positions() -> List[Dict[str, Any]]:
     """Get all open positions (for restart recovery)"""
-    con = sqlite3.connect(MAIN_DB)
+    con = _connect()
     cur = con.cursor()
     cur.execute(
         """SELECT id, symbol, agent_id, side, quantity, entry_price, leverage, 
@@ -225,8 +344,9 @@ def mark_position_closed(
     close_reason: str = "manual"
 ) -> bool:
     """Mark a position as closed"""
+    global _open_pos_cache_gen
     try:
-        con = sqlite3.connect(MAIN_DB)
+        con = _connect()
         cur = con.cursor()
         
         if position_id:
@@ -248,6 +368,15 @@ def mark_position_closed(
         
         con.commit()
         con.close()
+        
+        with _open_pos_cache_lock:
+            _open_pos_cache_gen += 1
+            if position_id:
+                for key, cached in _open_pos_cache.items():
+                    if cached is not None and cached['id'] == position_id:
+                        _open_pos_cache[key] = None
+            else:
+                _open_pos_cache[(symbol, agent_id)] = None
         return True
     except Exception as e:
         print(f"Error marking position closed: {e}")
@@ -256,15 +385,23 @@ def mark_position_closed(
 
 def update_position_verified(position_id: int) -> bool:
     """Update last_verified timestamp for a position"""
+    global _open_pos_cache_gen
     try:
-        con = sqlite3.connect(MAIN_DB)
+        now = time.time()
+        con = _connect()
         cur = con.cursor()
         cur.execute(
             "UPDATE open_positions SET last_verified = ? WHERE id = ?",
-            (time.time(), position_id)
+            (now, position_id)
         )
         con.commit()
         con.close()
+        
+        with _open_pos_cache_lock:
+            _open_pos_cache_gen += 1
+            for cached in _open_pos_cache.values():
+                if cached is not None and cached['id'] == position_id:
+                    cached['last_verified'] = now
         return True
     except Exception as e:
         print(f"Error updating position verified: {e}")
@@ -286,7 +423,7 @@ def log_order(
 ) -> None:
     """Log all order attempts (success, skipped, error)"""
     try:
-        con = sqlite3.connect(MAIN_DB)
+        con = _connect()
         cur = con.cursor()
         cur.execute(
             """INSERT INTO order_history 
@@ -310,7 +447,7 @@ def log_api_call(
 ) -> None:
     """Log API call metrics for monitoring"""
     try:
-        con = sqlite3.connect(MAIN_DB)
+        con = _connect()
         cur = con.cursor()
         cur.execute(
             "INSERT INTO api_metrics (timestamp, endpoint, duration_ms, status, error) VALUES (?, ?, ?, ?, ?)",
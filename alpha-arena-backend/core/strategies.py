@@ -8,6 +8,31 @@ import numpy as np
 from typing import Dict, Tuple
 
 
+# Precompiled reasoning templates (filled with str.format on the matching branch only)
+_TF_BUY_TMPL = "Trend Following BUY: Price ${price:.2f} > EMA20 ${ema:.2f}, MACD bullish ({macd:.4f} > {sig:.4f}), RSI healthy at {rsi:.2f}"
+_TF_SELL_TMPL = "Trend Following SELL: Price ${price:.2f} < EMA20 ${ema:.2f}, MACD bearish ({macd:.4f} < {sig:.4f}), RSI at {rsi:.2f}"
+_TF_HOLD_TMPL = "Trend Following HOLD: Mixed signals - Price vs EMA20: {above_ema}, MACD: {macd_bullish}, RSI: {rsi:.2f}"
+_TF_HOLD_SHORT = "Trend Following HOLD"
+
+_MR_BUY_TMPL = "Mean Reversion BUY: RSI oversold at {rsi:.2f}, Price ${price:.2f} near BB lower ${band:.2f}, Volume: {vol_ratio:.2f}x avg"
+_MR_SELL_TMPL = "Mean Reversion SELL: RSI overbought at {rsi:.2f}, Price ${price:.2f} near BB upper ${band:.2f}, Volume: {vol_ratio:.2f}x avg"
+_MR_HOLD_TMPL = "Mean Reversion HOLD: RSI {rsi:.2f} in neutral zone, Price between BB bands"
+
+_BO_BUY_TMPL = "Breakout BUY: Price ${price:.2f} broke above BB upper ${band:.2f}, Volume {vol_ratio:.2f}x avg, RSI {rsi:.2f}"
+_BO_SELL_TMPL = "Breakout SELL: Price ${price:.2f} broke below BB lower ${band:.2f}, Volume {vol_ratio:.2f}x avg, RSI {rsi:.2f}"
+_BO_HOLD = "Breakout HOLD: No breakout detected, Price within BB bands"
+
+_MACD_BUY_TMPL = "MACD Momentum BUY: MACD crossed above signal ({macd:.4f} > {sig:.4f}), Histogram {hist:.4f}, Price ${price:.2f} > EMA20 ${ema:.2f}"
+_MACD_SELL_TMPL = "MACD Momentum SELL: MACD crossed below signal ({macd:.4f} < {sig:.4f}), Histogram {hist:.4f}, Price ${price:.2f} < EMA20 ${ema:.2f}"
+_MACD_HOLD_TMPL = "MACD Momentum HOLD: No clear crossover signal, MACD {macd:.4f} vs Signal {sig:.4f}"
+
+_MTF_BUY_TMPL = "Multi-TF BUY: All timeframes bullish - Price ${price:.2f} > EMA20 ${ema20:.2f} > EMA50 ${ema50:.2f}, RSI {rsi:.2f}, MACD bullish"
+_MTF_SELL_TMPL = "Multi-TF SELL: All timeframes bearish - Price ${price:.2f} < EMA20 ${ema20:.2f} < EMA50 ${ema50:.2f}, RSI {rsi:.2f}, MACD bearish"
+_MTF_PARTIAL_BUY_TMPL = "Multi-TF BUY (partial): 2/3 timeframes bullish, Price ${price:.2f}, RSI {rsi:.2f}"
+_MTF_PARTIAL_SELL_TMPL = "Multi-TF SELL (partial): 2/3 timeframes bearish, Price ${price:.2f}, RSI {rsi:.2f}"
+_MTF_HOLD = "Multi-TF HOLD: Timeframes not aligned, mixed signals"
+
+
 class TradingStrategies:
     """
     Professional trading strategies implementation
@@ -36,6 +61,7 @@ class TradingStrategies:
                 - rsi_buy_max: RSI upper bound for buy (default 70)
                 - rsi_sell_min: RSI lower bound for sell (default 30)
                 - rsi_sell_max: RSI upper bound for sell (default 60)
+                - verbose: If False, HOLD returns a short constant reasoning (default True)
         
         Returns:
             (signal, confidence, reasoning)
@@ -73,7 +99,7 @@ class TradingStrategies:
                 signals.append("rsi_healthy")
                 confidence += 0.30
             
-            reasoning = f"Trend Following BUY: Price ${price:.2f} > EMA20 ${ema_20:.2f}, MACD bullish ({macd:.4f} > {macd_signal:.4f}), RSI healthy at {rsi:.2f}"
+            reasoning = _TF_BUY_TMPL.format(price=price, ema=ema_20, macd=macd, sig=macd_signal, rsi=rsi)
             return "long", min(confidence, 0.95), reasoning
         
         # SELL conditions
@@ -89,11 +115,13 @@ class TradingStrategies:
                 signals.append("rsi_healthy")
                 confidence += 0.30
             
-            reasoning = f"Trend Following SELL: Price ${price:.2f} < EMA20 ${ema_20:.2f}, MACD bearish ({macd:.4f} < {macd_signal:.4f}), RSI at {rsi:.2f}"
+            reasoning = _TF_SELL_TMPL.format(price=price, ema=ema_20, macd=macd, sig=macd_signal, rsi=rsi)
             return "short", min(confidence, 0.95), reasoning
         
         else:
-            reasoning = f"Trend Following HOLD: Mixed signals - Price vs EMA20: {price > ema_20}, MACD: {macd > macd_signal}, RSI: {rsi:.2f}"
+            if params.get('verbose') is False:
+                return "hold", 0.3, _TF_HOLD_SHORT
+            reasoning = _TF_HOLD_TMPL.format(above_ema=price > ema_20, macd_bullish=macd > macd_signal, rsi=rsi)
             return "hold", 0.3, reasoning
     
     @staticmethod
@@ -134,7 +162,7 @@ class TradingStrategies:
             if volume > avg_volume:
                 confidence += 0.2  # Volume confirmation
             
-            reasoning = f"Mean Reversion BUY: RSI oversold at {rsi:.2f}, Price ${price:.2f} near BB lower ${bb_lower:.2f}, Volume: {volume/avg_volume:.2f}x avg"
+            reasoning = _MR_BUY_TMPL.format(rsi=rsi, price=price, band=bb_lower, vol_ratio=volume / avg_volume)
             return "long", min(confidence, 0.95), reasoning
         
         # SELL conditions (overbought + near upper band)
@@ -147,11 +175,11 @@ class TradingStrategies:
             if volume < avg_volume:
                 confidence += 0.2  # Volume confirmation (decreasing)
             
-            reasoning = f"Mean Reversion SELL: RSI overbought at {rsi:.2f}, Price ${price:.2f} near BB upper ${bb_upper:.2f}, Volume: {volume/avg_volume:.2f}x avg"
+            reasoning = _MR_SELL_TMPL.format(rsi=rsi, price=price, band=bb_upper, vol_ratio=volume / avg_volume)
             return "short", min(confidence, 0.95), reasoning
         
         else:
-            reasoning = f"Mean Reversion HOLD: RSI {rsi:.2f} in neutral zone, Price between BB bands"
+            reasoning = _MR_HOLD_TMPL.format(rsi=rsi)
             return "hold", 0.3, reasoning
     
     @staticmethod
@@ -198,7 +226,7 @@ class TradingStrategies:
             if rsi < 65:
                 confidence += 0.1  # Room to run
             
-            reasoning = f"Breakout BUY: Price ${price:.2f} broke above BB upper ${bb_upper:.2f}, Volume {volume/avg_volume:.2f}x avg, RSI {rsi:.2f}"
+            reasoning = _BO_BUY_TMPL.format(price=price, band=bb_upper, vol_ratio=volume / avg_volume, rsi=rsi)
             return "long", min(confidence, 0.95), reasoning
         
         # SELL conditions (breakdown below lower band)
@@ -214,12 +242,11 @@ class TradingStrategies:
             if rsi > 35:
                 confidence += 0.1  # Room to fall
             
-            reasoning = f"Breakout SELL: Price ${price:.2f} broke below BB lower ${bb_lower:.2f}, Volume {volume/avg_volume:.2f}x avg, RSI {rsi:.2f}"
+            reasoning = _BO_SELL_TMPL.format(price=price, band=bb_lower, vol_ratio=volume / avg_volume, rsi=rsi)
             return "short", min(confidence, 0.95), reasoning
         
         else:
-            reasoning = f"Breakout HOLD: No breakout detected, Price within BB bands"
-            return "hold", 0.3, reasoning
+            return "hold", 0.3, _BO_HOLD
     
     @staticmethod
     def macd_momentum(df: pd.DataFrame) -> Tuple[str, float, str]:
@@ -267,7 +294,7 @@ class TradingStrategies:
             if price > ema_20:
                 confidence += 0.1  # Price confirmation
             
-            reasoning = f"MACD Momentum BUY: MACD crossed above signal ({macd:.4f} > {macd_signal:.4f}), Histogram {macd_histogram:.4f}, Price ${price:.2f} > EMA20 ${ema_20:.2f}"
+            reasoning = _MACD_BUY_TMPL.format(macd=macd, sig=macd_signal, hist=macd_histogram, price=price, ema=ema_20)
             return "long", min(confidence, 0.95), reasoning
         
         # SELL conditions (bearish MACD cross)
@@ -284,11 +311,11 @@ class TradingStrategies:
             if price < ema_20:
                 confidence += 0.1  # Price confirmation
             
-            reasoning = f"MACD Momentum SELL: MACD crossed below signal ({macd:.4f} < {macd_signal:.4f}), Histogram {macd_histogram:.4f}, Price ${price:.2f} < EMA20 ${ema_20:.2f}"
+            reasoning = _MACD_SELL_TMPL.format(macd=macd, sig=macd_signal, hist=macd_histogram, price=price, ema=ema_20)
             return "short", min(confidence, 0.95), reasoning
         
         else:
-            reasoning = f"MACD Momentum HOLD: No clear crossover signal, MACD {macd:.4f} vs Signal {macd_signal:.4f}"
+            reasoning = _MACD_HOLD_TMPL.format(macd=macd, sig=macd_signal)
             return "hold", 0.3, reasoning
     
     @staticmethod
@@ -338,29 +365,28 @@ class TradingStrategies:
         # BUY conditions (all timeframes align bullish)
         if short_term_bullish and medium_term_bullish and long_term_bullish:
             confidence = 0.9  # All timeframes aligned
-            reasoning = f"Multi-TF BUY: All timeframes bullish - Price ${price:.2f} > EMA20 ${ema_20:.2f} > EMA50 ${ema_50:.2f}, RSI {rsi:.2f}, MACD bullish"
+            reasoning = _MTF_BUY_TMPL.format(price=price, ema20=ema_20, ema50=ema_50, rsi=rsi)
             return "long", confidence, reasoning
         
         # SELL conditions (all timeframes align bearish)
         elif short_term_bearish and medium_term_bearish and long_term_bearish:
             confidence = 0.9  # All timeframes aligned
-            reasoning = f"Multi-TF SELL: All timeframes bearish - Price ${price:.2f} < EMA20 ${ema_20:.2f} < EMA50 ${ema_50:.2f}, RSI {rsi:.2f}, MACD bearish"
+            reasoning = _MTF_SELL_TMPL.format(price=price, ema20=ema_20, ema50=ema_50, rsi=rsi)
             return "short", confidence, reasoning
         
         # Partial alignment
         elif short_term_bullish and (medium_term_bullish or long_term_bullish):
             confidence = 0.6
-            reasoning = f"Multi-TF BUY (partial): 2/3 timeframes bullish, Price ${price:.2f}, RSI {rsi:.2f}"
+            reasoning = _MTF_PARTIAL_BUY_TMPL.format(price=price, rsi=rsi)
             return "long", confidence, reasoning
         
         elif short_term_bearish and (medium_term_bearish or long_term_bearish):
             confidence = 0.6
-            reasoning = f"Multi-TF SELL (partial): 2/3 timeframes bearish, Price ${price:.2f}, RSI {rsi:.2f}"
+            reasoning = _MTF_PARTIAL_SELL_TMPL.format(price=price, rsi=rsi)
             return "short", confidence, reasoning
         
         else:
-            reasoning = f"Multi-TF HOLD: Timeframes not aligned, mixed signals"
-            return "hold", 0.3, reasoning
+            return "hold", 0.3, _MTF_HOLD
 
 
 def apply_strategy(strategy_name: str, df: pd.DataFrame, symbol: str = None, mtf_data: Dict = None, params: Dict = None) -> Dict[str, any]:
@@ -1,8 +1,80 @@
 """
 Strategy Analytics Module - Analyzes strategy performance and provides adaptive weighting
 """
-from typing import Dict, Any, List
-from core.learning_memory import analyze_strategy_performance, get_strategy_weights
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from core.learning_memory import analyze_strategy_performance, get_strategy_weights, get_weights_epoch
+
+# Short-lived cache so a burst of analytics calls (e.g. one dashboard render)
+# shares a single learning-memory scan: (computed_at, strategy_stats)
+STATS_CACHE_TTL_SEC = 5.0
+_cached_stats: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Recommendation thresholds
+LOW_WIN_RATE = 0.4
+HIGH_WIN_RATE = 0.6
+REDUCE_USAGE_ADJUSTMENT = 0.5
+INCREASE_USAGE_ADJUSTMENT = 1.5
+
+_SUMMARY_HEADER = ("Strategy Performance Summary:", "=" * 50)
+
+# Adaptive weights change when learning memory is written, and as trades age out
+# of the rolling performance window, so they are cached until learning_memory's
+# write epoch moves or the TTL lapses
+WEIGHTS_CACHE_TTL_SEC = 300.0
+_weights_cache: Optional[Dict[str, float]] = None
+_weights_seen_epoch = -1
+_weights_computed_at = 0.0
+
+# Request-scoped coalescing: inside analytics_scope() every entry point sees
+# the same stats snapshot, fetched at most once per scope
+_stats_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar("strategy_stats_scope", default=None)
+
+def _get_stats(ttl: float = STATS_CACHE_TTL_SEC) -> Dict[str, Any]:
+    """Return strategy stats, recomputing them at most once per ttl seconds"""
+    global _cached_stats
+    
+    cached = _cached_stats
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
+    strategy_stats = analyze_strategy_performance()
+    _cached_stats = (now, strategy_stats)
+    return strategy_stats
+
+def _stats() -> Dict[str, Any]:
+    """Return the scope's stats snapshot if inside analytics_scope(), else the TTL-cached stats"""
+    scope = _stats_var.get()
+    if scope is None:
+        return _get_stats()
+    if "stats" not in scope:
+        scope["stats"] = _get_stats()
+    return scope["stats"]
+
+@contextmanager
+def analytics_scope() -> Iterator[None]:
+    """
+    Coalesce analytics calls made within one request/cycle so they share a
+    single strategy-stats snapshot.
+    
+    Example:
+        with analytics_scope():
+            effectiveness = analyze_strategy_effectiveness()
+            recommendations = recommend_strategy_adjustments()
+    """
+    token = _stats_var.set({})
+    try:
+        yield
+    finally:
+        _stats_var.reset(token)
+
+def invalidate_strategy_cache() -> None:
+    """Drop cached strategy stats (call after recording a new trade)"""
+    global _cached_stats
+    _cached_stats = None
 
 def get_adaptive_strategy_weights() -> Dict[str, float]:
     """
@@ -11,7 +83,21 @@ def get_adaptive_strategy_weights() -> Dict[str, float]:
     Returns:
         Dict mapping strategy names to weight multipliers
     """
-    return get_strategy_weights()
+    if (_weights_cache is not None and _weights_seen_epoch == get_weights_epoch()
+            and time.monotonic() - _weights_computed_at < WEIGHTS_CACHE_TTL_SEC):
+        return _weights_cache
+    return _refresh_weights()
+
+def _refresh_weights() -> Dict[str, float]:
+    """Recompute adaptive weights and record the epoch they belong to"""
+    global _weights_cache, _weights_seen_epoch, _weights_computed_at
+    
+    epoch = get_weights_epoch()
+    computed_at = time.monotonic()
+    _weights_cache = get_strategy_weights(_stats())
+    _weights_seen_epoch = epoch
+    _weights_computed_at = computed_at
+    return _weights_cache
 
 def analyze_strategy_effectiveness() -> Dict[str, Any]:
     """
@@ -20,7 +106,7 @@ def analyze_strategy_effectiveness() -> Dict[str, Any]:
     Returns:
         Dict with strategy performance statistics
     """
-    return analyze_strategy_performance()
+    return _stats()
 
 def recommend_strategy_adjustments() -> List[Dict[str, Any]]:
     """
@@ -29,25 +115,27 @@ def recommend_strategy_adjustments() -> List[Dict[str, Any]]:
     Returns:
         List of adjustment recommendations
     """
-    strategy_stats = analyze_strategy_performance()
+    strategy_stats = _stats()
     recommendations = []
     
     for strategy, stats in strategy_stats.items():
+        win_rate = stats.get("win_rate", 0.0)
+        
         # Recommend reducing usage of poor performers
-        if stats.get("win_rate", 0) < 0.4:
+        if win_rate < LOW_WIN_RATE:
             recommendations.append({
                 "strategy": strategy,
                 "action": "reduce_usage",
-                "reason": f"Low win rate: {stats.get('win_rate', 0):.2f}",
-                "adjustment": 0.5
+                "reason": f"Low win rate: {win_rate:.2f}",
+                "adjustment": REDUCE_USAGE_ADJUSTMENT
             })
         # Recommend increasing usage of top performers
-        elif stats.get("win_rate", 0) > 0.6 and stats.get("avg_pnl", 0) > 0:
+        elif win_rate > HIGH_WIN_RATE and stats.get("avg_pnl", 0.0) > 0:
             recommendations.append({
                 "strategy": strategy,
                 "action": "increase_usage",
-                "reason": f"High win rate: {stats.get('win_rate', 0):.2f} with positive PnL",
-                "adjustment": 1.5
+                "reason": f"High win rate: {win_rate:.2f} with positive PnL",
+                "adjustment": INCREASE_USAGE_ADJUSTMENT
             })
     
     return recommendations
@@ -59,21 +147,21 @@ def get_strategy_performance_summary() -> str:
     Returns:
         Formatted string summary
     """
-    strategy_stats = analyze_strategy_performance()
+    strategy_stats = _stats()
     
     if not strategy_stats:
         return "No strategy performance data available."
     
-    summary_lines = ["Strategy Performance Summary:"]
-    summary_lines.append("=" * 50)
+    summary_lines = list(_SUMMARY_HEADER)
     
     for strategy, stats in strategy_stats.items():
-        summary_lines.append(f"{strategy}:")
-        summary_lines.append(f"  Trades: {stats.get('trades', 0)}")
-        summary_lines.append(f"  Win Rate: {stats.get('win_rate', 0):.2f}")
-        summary_lines.append(f"  Avg PnL: ${stats.get('avg_pnl', 0):+.2f}")
-        summary_lines.append(f"  Avg PnL%: {stats.get('avg_pnl_pct', 0):+.2f}%")
-        summary_lines.append(f"  Confidence Accuracy: {stats.get('avg_confidence_accuracy', 0):.2f}")
-        summary_lines.append("")
+        summary_lines.append(
+            f"{strategy}:\n"
+            f"  Trades: {stats.get('trades', 0)}\n"
+            f"  Win Rate: {stats.get('win_rate', 0):.2f}\n"
+            f"  Avg PnL: ${stats.get('avg_pnl', 0):+.2f}\n"
+            f"  Avg PnL%: {stats.get('avg_pnl_pct', 0):+.2f}%\n"
+            f"  Confidence Accuracy: {stats.get('avg_confidence_accuracy', 0):.2f}\n"
+        )
     
-    return "\n".join(summary_lines)
\ No newline at end of file
+    return "\n".join(summary_lines)
@@ -3,27 +3,93 @@ Symbol Lock Mechanism for Multi-Agent Conflict Prevention
 Prevents multiple agents from entering the same symbol simultaneously.
 """
 
+import sys
 import time
+import heapq
 import threading
 import logging
-from typing import Dict, Set, Any
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Set, Tuple, Any
 
 logger = logging.getLogger(__name__)
 
-# Global lock for thread safety
-_lock = threading.Lock()
+# Bound once so the hot paths avoid a module attribute lookup per call.
+# All timestamps and cooldown expiries are monotonic so NTP steps or wall-clock
+# adjustments cannot shorten or extend a cooldown.
+_monotonic = time.monotonic
+# Public entry points intern the symbol so shard lookups on the small, closed
+# set of exchange symbols compare keys by identity
+_intern = sys.intern
 
-# Active positions tracker
-_active_positions: Dict[str, Dict[str, Any]] = {}
+# Lock striping: each symbol maps to one of _STRIPES locks and shards, so
+# agents working on different symbols never contend on the same mutex.
+# Acquire/release of a position lock are lock-free; the stripe locks guard
+# cooldown writes, expiry cleanup and bulk operations.
+_STRIPES = 64  # must be a power of two
+_stripe_locks = [threading.Lock() for _ in range(_STRIPES)]
 
-# Cooldown tracker
-_cooldown_tracker: Dict[str, float] = {}
+# Lock entry for a held symbol: a namedtuple is far smaller than a dict and
+# carries no per-entry hash table.
+PositionEntry = namedtuple("PositionEntry", ["agent_id", "acquired_at"])
+
+# Active positions tracker (sharded by stripe)
+_active_shards: List[Dict[str, PositionEntry]] = [{} for _ in range(_STRIPES)]
+
+# Cooldown tracker (sharded by stripe). Each shard is insertion-ordered and
+# capped so symbol churn cannot grow it without bound.
+MAX_COOLDOWNS = 4096
+_MAX_COOLDOWNS_PER_STRIPE = MAX_COOLDOWNS // _STRIPES
+_cooldown_shards: List["OrderedDict[str, float]"] = [OrderedDict() for _ in range(_STRIPES)]
+
+# Min-heap of (expiry, symbol) per stripe so expiry cleanup only touches
+# expired entries. The shard dict stays authoritative: heap entries whose
+# expiry no longer matches the dict (re-scheduled or evicted) are stale and
+# are dropped lazily when they surface.
+_cooldown_heaps: List[List[Tuple[float, str]]] = [[] for _ in range(_STRIPES)]
+
+# Startup sync: concurrent Binance position checks
+SYNC_MAX_WORKERS = 8
+SYNC_TIMEOUT_SEC = 30  # overall bound; on timeout hung checks are abandoned and all locks cleared
+
+
+def _stripe(symbol: str) -> int:
+    """Return the stripe index owning a symbol."""
+    return hash(symbol) & (_STRIPES - 1)
+
+
+def _clear_expired_cooldowns_locked(stripe: int, current_time: float) -> None:
+    """Drop expired cooldowns from one stripe. Caller must hold its lock."""
+    cooldowns = _cooldown_shards[stripe]
+    heap = _cooldown_heaps[stripe]
+    expired = []
+    while heap and heap[0][0] <= current_time:
+        expired.append(heapq.heappop(heap))
+    if not expired:
+        return
+    
+    if len(expired) * 4 > len(cooldowns):
+        # Bulk expiry (>25% of the shard): one rebuild pass beats many
+        # targeted deletes. The shard is swapped rather than cleared in place
+        # so lock-free readers never observe a half-emptied dict.
+        _cooldown_shards[stripe] = OrderedDict(
+            (symbol, expiry) for symbol, expiry in cooldowns.items()
+            if expiry > current_time
+        )
+    else:
+        for expiry, symbol in expired:
+            if cooldowns.get(symbol) == expiry:
+                del cooldowns[symbol]
 
 def acquire_position_lock(symbol: str, agent_id: str, verify_binance: bool = False) -> bool:
     """
     Simple in-memory lock to prevent multiple agents trading the same symbol.
     Fast and clean - no Binance API calls.
     
+    The fast path takes no mutex: dict.get and dict.setdefault are atomic
+    under the GIL, so setdefault acts as a compare-and-swap on the shard.
+    
     Args:
         symbol: Trading symbol (e.g., BTCUSDT)
         agent_id: Agent identifier
@@ -32,28 +98,33 @@ def acquire_position_lock(symbol: str, agent_id: str, verify_binance: bool = Fal
     Returns:
         True if lock acquired, False if already locked or in cooldown
     """
-    # Immediate return - no logging inside lock to avoid any delays
+    # Immediate return - no logging on the fast path to avoid any delays
     try:
-        with _lock:
-            clear_expired_cooldowns()
-            
-            # Check cooldown
-            if symbol in _cooldown_tracker and time.time() < _cooldown_tracker[symbol]:
-                return False
-            
-            # Check if already locked
-            if symbol in _active_positions:
-                return False
-            
-            # Acquire lock
-            _active_positions[symbol] = {
-                "agent_id": agent_id,
-                "acquired_at": time.time()
-            }
-            return True
+        symbol = _intern(symbol)
+        stripe = _stripe(symbol)
+        cooldowns = _cooldown_shards[stripe]
+        current_time = _monotonic()
+        
+        # Check cooldown (expired entries are pruned by the locked paths)
+        cooldown_until = cooldowns.get(symbol)
+        if cooldown_until is not None and current_time < cooldown_until:
+            return False
+        
+        # Acquire lock: only the caller whose entry lands in the shard wins
+        active = _active_shards[stripe]
+        entry = PositionEntry(agent_id, current_time)
+        if active.setdefault(symbol, entry) is not entry:
+            return False
+        
+        # A failed release may have set a cooldown between our check and the CAS
+        cooldown_until = cooldowns.get(symbol)
+        if cooldown_until is not None and current_time < cooldown_until:
+            active.pop(symbol, None)
+            return False
+        return True
     except Exception as e:
         # If lock fails for any reason, allow the trade (fail open)
-        logger.error(f"Lock acquisition error for {symbol}: {e}")
+        logger.error("Lock acquisition error for %s: %s", symbol, e)
         return True  # Fail open - don't block trades
 
 def release_position_lock(symbol: str, success: bool = True):
@@ -64,14 +135,32 @@ def release_position_lock(symbol: str, success: bool = True):
         symbol: Trading symbol (e.g., BTCUSDT)
         success: Whether the trade was successful
     """
-    with _lock:
-        # Remove from active positions
-        if symbol in _active_positions:
-            del _active_positions[symbol]
-        
-        # If trade was not successful, set cooldown
-        if not success:
-            _cooldown_tracker[symbol] = time.time() + 300  # 5 minute cooldown
+    symbol = _intern(symbol)
+    stripe = _stripe(symbol)
+    
+    # If trade was not successful, set cooldown before releasing so no other
+    # agent can slip in between. Cooldown writes stay under the stripe lock
+    # to keep expiry cleanup race-free; this is the rare path.
+    if not success:
+        with _stripe_locks[stripe]:
+            current_time = _monotonic()
+            _clear_expired_cooldowns_locked(stripe, current_time)
+            cooldowns = _cooldown_shards[stripe]
+            heap = _cooldown_heaps[stripe]
+            expiry = current_time + 300  # 5 minute cooldown
+            cooldowns[symbol] = expiry
+            cooldowns.move_to_end(symbol)
+            heapq.heappush(heap, (expiry, symbol))
+            # Evict the oldest cooldowns if the shard is over capacity
+            while len(cooldowns) > _MAX_COOLDOWNS_PER_STRIPE:
+                cooldowns.popitem(last=False)
+            # Rebuild the heap if stale entries dominate it
+            if len(heap) > 2 * _MAX_COOLDOWNS_PER_STRIPE:
+                heap[:] = [(exp, sym) for sym, exp in cooldowns.items()]
+                heapq.heapify(heap)
+    
+    # Remove from active positions (atomic, no lock needed)
+    _active_shards[stripe].pop(symbol, None)
 
 def is_symbol_locked(symbol: str) -> bool:
     """
@@ -83,49 +172,132 @@ def is_symbol_locked(symbol: str) -> bool:
     Returns:
         True if symbol is locked, False otherwise
     """
-    with _lock:
-        # Check cooldown
-        if symbol in _cooldown_tracker:
-            if time.time() < _cooldown_tracker[symbol]:
-                return True
-            else:
-                # Cooldown expired, remove it
-                del _cooldown_tracker[symbol]
+    symbol = _intern(symbol)
+    stripe = _stripe(symbol)
+    cooldowns = _cooldown_shards[stripe]
+    active = _active_shards[stripe]
+    
+    # Fast path (GIL-atomic reads, no lock): the common case is a symbol that
+    # appears in neither tracker
+    if symbol not in cooldowns and symbol not in active:
+        return False
+    
+    # Double-checked: take the stripe lock only for the authoritative
+    # cooldown-expiry check
+    with _stripe_locks[stripe]:
+        # Prune due cooldowns; anything left in the shard is still active
+        _clear_expired_cooldowns_locked(stripe, _monotonic())
+        
+        # Check cooldown (re-read: cleanup may have swapped the shard)
+        if symbol in _cooldown_shards[stripe]:
+            return True
         
         # Check active position
-        return symbol in _active_positions
+        return symbol in active
+
+class _ActivePositionsView(Mapping):
+    """
+    Read-only, copy-free view over the sharded active-position tracker.
+    Lookups route straight to the owning shard; the view reflects live state.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, symbol: str) -> PositionEntry:
+        return _active_shards[_stripe(symbol)][symbol]
+    
+    def __contains__(self, symbol: object) -> bool:
+        return isinstance(symbol, str) and symbol in _active_shards[_stripe(symbol)]
+    
+    def __iter__(self) -> Iterator[str]:
+        for shard in _active_shards:
+            # list() so a concurrent insert cannot break iteration
+            yield from list(shard)
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in _active_shards)
+
+
+_active_positions_view = _ActivePositionsView()
+
+def get_active_positions_view() -> Mapping[str, PositionEntry]:
+    """
+    Get a read-only live view of active positions without copying.
+    Preferred for monitoring/dashboard callers; entries must not be mutated.
+    
+    Returns:
+        Mapping of symbol -> PositionEntry(agent_id, acquired_at)
+    """
+    return _active_positions_view
+
+def active_position_count() -> int:
+    """
+    Get the number of currently locked symbols.
+    
+    Returns:
+        Count of active position locks
+    """
+    return len(_active_positions_view)
 
 def get_active_positions() -> Dict[str, Dict[str, Any]]:
     """
-    Get all active positions.
+    Get a defensive copy of all active positions.
+    Read-only callers should prefer get_active_positions_view().
     
     Returns:
         Dictionary of active positions
     """
-    with _lock:
-        return _active_positions.copy()
+    positions: Dict[str, Dict[str, Any]] = {}
+    for stripe in range(_STRIPES):
+        with _stripe_locks[stripe]:
+            for symbol, entry in _active_shards[stripe].items():
+                positions[symbol] = entry._asdict()
+    return positions
 
 def clear_expired_cooldowns():
     """
     Clear expired cooldowns to prevent memory buildup.
+    Takes each stripe lock; code already holding a stripe lock must call
+    _clear_expired_cooldowns_locked() instead (the locks are not reentrant).
     """
-    with _lock:
-        current_time = time.time()
-        expired_symbols = [
-            symbol for symbol, cooldown_time in _cooldown_tracker.items() 
-            if current_time >= cooldown_time
-        ]
-        for symbol in expired_symbols:
-            del _cooldown_tracker[symbol]
+    current_time = _monotonic()
+    for stripe in range(_STRIPES):
+        with _stripe_locks[stripe]:
+            _clear_expired_cooldowns_locked(stripe, current_time)
 
 def clear_all_locks_and_cooldowns() -> None:
     """
     Clear all locks and cooldowns (use on startup or reset).
     """
-    with _lock:
-        _active_positions.clear()
-        _cooldown_tracker.clear()
-        logger.info("🧹 Cleared all position locks and cooldowns")
+    for stripe in range(_STRIPES):
+        with _stripe_locks[stripe]:
+            _active_shards[stripe].clear()
+            _cooldown_shards[stripe].clear()
+            _cooldown_heaps[stripe].clear()
+    logger.info("🧹 Cleared all position locks and cooldowns")
+
+def _apply_lock_clears(symbols: Set[str]) -> int:
+    """
+    Remove a batch of position locks and prune expired cooldowns, taking each
+    affected stripe lock exactly once.
+    
+    Returns:
+        Number of locks actually removed
+    """
+    by_stripe: Dict[int, List[str]] = {}
+    for symbol in symbols:
+        by_stripe.setdefault(_stripe(symbol), []).append(symbol)
+    
+    cleared_count = 0
+    current_time = _monotonic()
+    for stripe in range(_STRIPES):
+        with _stripe_locks[stripe]:
+            active = _active_shards[stripe]
+            for symbol in by_stripe.get(stripe, ()):
+                if active.pop(symbol, None) is not None:
+                    cleared_count += 1
+            _clear_expired_cooldowns_locked(stripe, current_time)
+    return cleared_count
 
 def sync_with_binance_on_startup(client) -> None:
     """
@@ -140,52 +312,59 @@ def sync_with_binance_on_startup(client) -> None:
         clear_all_locks_and_cooldowns()
         return
     
-    with _lock:
-        locked_symbols = list(_active_positions.keys())
-        
-        if not locked_symbols:
-            # No locks exist - just clear expired cooldowns
-            clear_expired_cooldowns()
-            logger.debug("No locks to sync on startup")
-            return
+    # Snapshot the locked symbols once; Binance checks run without any lock held
+    locked_symbols = list(get_active_positions().keys())
+    
+    if not locked_symbols:
+        # No locks exist - just clear expired cooldowns
+        clear_expired_cooldowns()
+        logger.debug("No locks to sync on startup")
+        return
     
     # Import outside the lock to avoid circular import issues
     # Use lazy import to avoid circular dependency
     try:
         from core.order_manager import check_existing_position
         
-        cleared_count = 0
-        for symbol in locked_symbols:
-            try:
-                # Quick check with timeout protection
-                actual_position = check_existing_position(client, symbol)
-                with _lock:
-                    if actual_position is None:
-                        # No actual position - clear stale lock
-                        if symbol in _active_positions:
-                            del _active_positions[symbol]
-                            cleared_count += 1
-                            logger.info(f"🔄 Cleared stale lock for {symbol} (no actual position on Binance)")
-                    else:
-                        # Position exists - lock is valid
-                        logger.debug(f"✅ Lock for {symbol} is valid (position exists on Binance)")
-            except Exception as e:
-                logger.warning(f"⚠️  Could not sync lock for {symbol}: {e}")
-                # On error, clear the lock to be safe (prevents blocking)
-                with _lock:
-                    if symbol in _active_positions:
-                        del _active_positions[symbol]
-                        cleared_count += 1
+        to_clear: Set[str] = set()
+        # Checks are pure network I/O, so run them concurrently. The worker
+        # count is capped to stay well inside Binance's IP weight limits.
+        workers = min(SYNC_MAX_WORKERS, len(locked_symbols))
+        # Not a `with` block: its exit waits for hung checks, which would defeat the
+        # timeout. On timeout the stragglers are abandoned (queued ones cancelled).
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(check_existing_position, client, symbol): symbol
+                for symbol in locked_symbols
+            }
+            for future in as_completed(futures, timeout=SYNC_TIMEOUT_SEC):
+                symbol = futures[future]
+                try:
+                    actual_position = future.result()
+                except Exception as e:
+                    logger.warning("⚠️  Could not sync lock for %s: %s", symbol, e)
+                    # On error, clear the lock to be safe (prevents blocking)
+                    to_clear.add(symbol)
+                    continue
+                
+                if actual_position is None:
+                    # No actual position - lock is stale
+                    to_clear.add(symbol)
+                    logger.info("🔄 Clearing stale lock for %s (no actual position on Binance)", symbol)
+                else:
+                    # Position exists - lock is valid
+                    logger.debug("✅ Lock for %s is valid (position exists on Binance)", symbol)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        # Clear expired cooldowns
-        with _lock:
-            clear_expired_cooldowns()
+        cleared_count = _apply_lock_clears(to_clear)
         
         if cleared_count > 0:
-            logger.info(f"✅ Startup sync: Cleared {cleared_count} stale lock(s)")
+            logger.info("✅ Startup sync: Cleared %s stale lock(s)", cleared_count)
     except ImportError as e:
-        logger.warning(f"⚠️  Could not import check_existing_position: {e} - clearing all locks")
+        logger.warning("⚠️  Could not import check_existing_position: %s - clearing all locks", e)
         clear_all_locks_and_cooldowns()
     except Exception as e:
-        logger.warning(f"⚠️  Error during startup sync: {e} - clearing all locks")
-        clear_all_locks_and_cooldowns()
\ No newline at end of file
+        logger.warning("⚠️  Error during startup sync: %s - clearing all locks", e)
+        clear_all_locks_and_cooldowns()
@@ -5,16 +5,46 @@ Monitors all open positions and auto-closes based on take-profit and stop-loss t
 
 import os
 import csv
+import math
 import time
+import queue
 import logging
 import threading
-from typing import Dict, Any
-from core.binance_client import get_futures_client
-from core.order_manager import close_position, cleanup_open_orders
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Any, Optional, Set, Tuple
+
+import numpy as np
+
+from core import market_stream
+from core.binance_error_handler import call_with_backoff as _binance_call, rate_limit_remaining
+from core.binance_client import get_futures_client, BINANCE_API_KEY, BINANCE_API_SECRET, IS_TESTNET
+from core.order_manager import (
+    close_position, cleanup_open_orders, safe_qty, place_futures_order,
+    place_take_profit_and_stop_loss, get_current_position
+)
 from core.csv_logger import log_trade, log_learning
-from core.learning_bridge import update_learning_from_csv_logs
+from core.learning_bridge import update_learning_from_csv_logs, find_matching_decision
 from core.outcome_feedback import update_decision_with_outcome
 
+# Trade state machine (prevents multiple exits); no-op fallbacks if unavailable
+try:
+    from core.trade_state_manager import try_begin_exit, record_exit_complete, clear_tpsl_hashes
+except ImportError:
+    def try_begin_exit(symbol: str) -> bool:
+        return True
+    def record_exit_complete(symbol: str) -> None:
+        pass
+    clear_tpsl_hashes = record_exit_complete
+
+# Kill-switch consecutive loss tracking
+try:
+    from core.risk_engine import daily_loss_tracker
+except ImportError:
+    daily_loss_tracker = None
+
 # Import Telegram notifier
 try:
     from telegram_notifier import send_auto_notification as send_message
@@ -28,7 +58,7 @@ logger = logging.getLogger("trade_manager")
 
 # Global variables for live monitor thread
 _live_monitor_thread = None
-_live_monitor_running = False
+_live_monitor_stop = threading.Event()
 _last_attach_time = {}
 _last_error = {}
 _failed_symbols = {}  # Track symbols that failed TP/SL attachment
@@ -40,6 +70,48 @@ _last_attach = {}
 TAKE_PROFIT_PERCENT = float(os.getenv("TAKE_PROFIT_PERCENT", "2.0"))
 STOP_LOSS_PERCENT = float(os.getenv("STOP_LOSS_PERCENT", "1.0"))
 TRADE_LOG_PATH = os.getenv("TRADE_LOG_PATH", "trades_log.csv")
+USE_ATR_TPSL = os.getenv("USE_ATR_TPSL", "false").lower() == "true"
+LIVE_MONITOR_INTERVAL = float(os.getenv("LIVE_MONITOR_INTERVAL", "5"))
+# Max positions checked concurrently by manage_open_positions
+MANAGE_MAX_WORKERS = 8
+_close_bookkeeping_lock = threading.Lock()
+
+# Post-close side effects (Telegram, learning updates) run on a worker thread so
+# a slow HTTP POST or file write never delays the next position's TP/SL check
+NOTIFY_QUEUE_SIZE = 1024
+_notify_queue: "queue.Queue" = queue.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+_notify_thread: Optional[threading.Thread] = None
+_notify_start_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolPolicy:
+    """Per-symbol TP/SL parameters, resolved once at import (all percentages in %)"""
+    atr_tp_mult: float  # USE_ATR_TPSL: TP = mult × ATR
+    atr_sl_mult: float  # USE_ATR_TPSL: SL = mult × ATR
+    tp_min: float  # Dynamic TP/SL clamp bounds
+    tp_max: float
+    sl_min: float
+    sl_max: float
+    default_tp: float  # Used when no ATR is available
+    default_sl: float
+
+
+# Keyed by the first 3 characters of the symbol
+_POLICY: Dict[str, SymbolPolicy] = {
+    "BTC": SymbolPolicy(2.0, 1.0, 0.8, 5.0, 0.5, 2.5, 2.0, 1.0),
+    "BNB": SymbolPolicy(1.5, 0.7, 0.6, 3.0, 0.4, 2.0, 1.5, 0.7),
+}
+_DEFAULT_POLICY = SymbolPolicy(2.0, 1.0, 0.7, 4.0, 0.5, 2.5, 2.0, 1.0)
+
+# USE_ATR_TPSL clamp bounds (lo, hi) in %, shared by every symbol
+_ATR_TP_BOUNDS = (0.5, 5.0)
+_ATR_SL_BOUNDS = (0.3, 2.5)
+
+# Lowest TP or SL % any branch of _calculate_symbol_specific_tp_sl can return (USE_ATR_TPSL SL floor).
+# Positions moving less than half of that cannot be near a level, so they skip the TP/SL work.
+_MIN_TPSL_PCT = min(_ATR_SL_BOUNDS[0], min(p.sl_min for p in (*_POLICY.values(), _DEFAULT_POLICY)))
+_QUIET_BAND_PCT = 0.5 * _MIN_TPSL_PCT
 
 
 # Global tracking for ATR-TPSL update throttling with threshold-based updates
@@ -48,13 +120,147 @@ _last_atr_tpsl_values: Dict[str, tuple[float, float]] = {}  # Store last (tp_pct
 _atr_tpsl_update_cooldown = 180  # 3 minutes cooldown between ATR-based TP/SL updates
 _atr_tpsl_change_threshold = 0.1  # Only update if TP/SL change > 0.1% (fixes excessive churn)
 
+# Memoized TP/SL results: {symbol: (expires_at, entry_price_bucket, tp_pct, sl_pct)}
+_tpsl_cache: Dict[str, tuple] = {}
+
 # Global tracking for partial closes (prevent multiple closes on same position)
-_partial_close_executed: Dict[str, bool] = {}  # {symbol: bool} - tracks if partial close already done
+_partial_close_executed: Set[str] = set()  # Symbols whose partial close is already done
+_last_roi_logs: Dict[str, float] = {}  # {symbol: ROI % at the last LiveMonitor check log}
+
+# LiveMonitor "missing orders" label keyed by (has_tp_order, has_sl_order)
+_MISSING_TPSL = {(False, False): "TP, SL", (True, False): "SL", (False, True): "TP"}
+
+# Quantity rules per symbol, loaded from one futures_exchange_info() call when the
+# live monitor starts: {symbol: SymbolMeta}
+SymbolMeta = namedtuple("SymbolMeta", ["step_size", "min_qty", "qty_decimals"])
+_sym_meta: Dict[str, SymbolMeta] = {}
+# Used until exchange info has been loaded
+_FALLBACK_MIN_QTY = {"BTCUSDT": 0.001, "BNBUSDT": 0.0001}
+
+ATR_PERIOD = 14
+
+
+def _compute_atr(klines) -> Optional[float]:
+    """
+    Compute the simple 14-period ATR from raw Binance klines.
+
+    Returns None when there are not enough candles for a full period.
+    """
+    if len(klines) < ATR_PERIOD + 1:
+        return None
+    # Parse all rows in C, then lay high/low/close out as contiguous columns (SoA)
+    arr = np.array(klines, dtype=np.float64)
+    h, l, c = np.ascontiguousarray(arr[:, 2:5].T)
+    # Only the last ATR_PERIOD true ranges are needed; build them in two buffers
+    h, l, c = h[-ATR_PERIOD:], l[-ATR_PERIOD:], c[-ATR_PERIOD - 1:-1]
+    tr = np.subtract(h, l)
+    gap = np.subtract(h, c)
+    np.maximum(tr, np.abs(gap, out=gap), out=tr)
+    np.subtract(l, c, out=gap)
+    np.maximum(tr, np.abs(gap, out=gap), out=tr)
+    return float(tr.mean())
+
+
+# Incremental Wilder ATR per symbol, advanced one closed candle at a time
+# {symbol: {"atr": float, "last_close": float, "last_open_time": int}}
+_atr_state: Dict[str, dict] = {}
+# The live monitor and the manage_open_positions pool can update the same symbol,
+# so each symbol's check-and-update runs under its own lock
+_atr_locks: Dict[str, threading.Lock] = {}
+ATR_INTERVAL = "3m"
+_ATR_INTERVAL_MS = 3 * 60 * 1000
+
+
+def _seed_atr(client, symbol: str) -> Optional[float]:
+    """Seed Wilder state with a simple ATR over the last fully closed candles."""
+    klines = _binance_call(client.futures_klines, symbol=symbol, interval=ATR_INTERVAL, limit=ATR_PERIOD + 2)
+    closed = klines[:-1]  # Last row is the candle still forming
+    atr = _compute_atr(closed)
+    if atr is None:
+        return None
+    _atr_state[symbol] = {
+        "atr": atr,
+        "last_close": float(closed[-1][4]),
+        "last_open_time": int(closed[-1][0]),
+    }
+    return atr
+
+
+def _get_atr(client, symbol: str) -> Optional[float]:
+    """
+    Return Wilder's ATR for a symbol on the 3m timeframe.
+
+    The first call seeds the state from a full window; later calls fetch only
+    the last two klines and fold the newly closed candle in with
+    ATR_t = (ATR_{t-1} * (N - 1) + TR_t) / N. If candles were missed the
+    state is reseeded.
+    """
+    with _atr_locks.setdefault(symbol, threading.Lock()):
+        return _advance_atr(client, symbol)
+
+
+def _advance_atr(client, symbol: str) -> Optional[float]:
+    """Seed or advance one symbol's ATR state (caller holds its _atr_locks entry)"""
+    state = _atr_state.get(symbol)
+    if state is None:
+        return _seed_atr(client, symbol)
+
+    klines = _binance_call(client.futures_klines, symbol=symbol, interval=ATR_INTERVAL, limit=2)
+    if len(klines) < 2:
+        return state["atr"]
+    closed = klines[-2]
+    open_time = int(closed[0])
+    if open_time == state["last_open_time"]:
+        return state["atr"]
+    if open_time - state["last_open_time"] > _ATR_INTERVAL_MS:
+        return _seed_atr(client, symbol)
+
+    high, low, close = float(closed[2]), float(closed[3]), float(closed[4])
+    prev_close = state["last_close"]
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    state["atr"] += (tr - state["atr"]) / ATR_PERIOD  # == (ATR * (N - 1) + TR) / N
+    state["last_close"] = close
+    state["last_open_time"] = open_time
+    return state["atr"]
+
+
+def _clip(x: float, lo: float, hi: float) -> float:
+    """Clamp x to [lo, hi]"""
+    return lo if x < lo else hi if x > hi else x
+
+
+def _store_tpsl(symbol: str, entry_bucket: float, tp_pct: float, sl_pct: float) -> tuple[float, float]:
+    """Memoize a TP/SL result for the ATR update cooldown and return it"""
+    _tpsl_cache[symbol] = (time.monotonic() + _atr_tpsl_update_cooldown, entry_bucket, tp_pct, sl_pct)
+    return tp_pct, sl_pct
+
+
+def _compute_atr_pct(symbol: str, entry_price: float) -> Optional[float]:
+    """
+    Get the current ATR as a percentage of entry price.
+    
+    Returns:
+        ATR percent, or None if the client or klines are unavailable
+    """
+    try:
+        client = get_futures_client()
+        if not client:
+            return None
+        atr = _get_atr(client, symbol)
+        if atr is None:
+            return None
+        return (atr / entry_price) * 100
+    except Exception as e:
+        logger.warning("[ATR-TPSL] Failed to calculate ATR for %s: %s", symbol, e)
+        return None
+
 
 def _calculate_symbol_specific_tp_sl(symbol: str, entry_price: float, force_update: bool = False) -> tuple[float, float]:
     """
     Calculate symbol-specific TP/SL based on fixed ratios or ATR.
     Now includes throttling to prevent excessive ATR recalculations.
+    Results are memoized per (symbol, entry price rounded to 0.1) for the
+    ATR update cooldown.
     
     Args:
         symbol: Trading symbol (e.g., BTCUSDT)
@@ -64,166 +270,142 @@ def _calculate_symbol_specific_tp_sl(symbol: str, entry_price: float, force_upda
     Returns:
         Tuple of (tp_percent, sl_percent)
     """
+    entry_bucket = round(entry_price, 1)
+    cached = _tpsl_cache.get(symbol)
+    if cached is not None and not force_update and cached[1] == entry_bucket and cached[0] > time.monotonic():
+        return cached[2], cached[3]
+    
     try:
-        # Normalize symbol name
+        # Normalize symbol name and resolve its TP/SL policy
         normalized_symbol = symbol.upper()
+        policy = _POLICY.get(normalized_symbol[:3], _DEFAULT_POLICY)
         
         # THROTTLING: Skip ATR recalculation if recently updated (unless forced)
         now = time.time()
         if not force_update and symbol in _last_atr_tpsl_update:
             time_since_last = now - _last_atr_tpsl_update[symbol]
-            if time_since_last < _atr_tpsl_update_cooldown:
-                # Use cached/fallback values instead of recalculating
-                logger.debug(f"[ATR-TPSL] Throttled update for {symbol} ({int(_atr_tpsl_update_cooldown - time_since_last)}s remaining)")
-                # Fall through to fixed ratios
+            last_values = _last_atr_tpsl_values.get(symbol)
+            if time_since_last < _atr_tpsl_update_cooldown and last_values is not None:
+                # Reuse the last ATR-based values instead of recalculating
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[ATR-TPSL] Throttled update for %s (%ss remaining)", symbol, int(_atr_tpsl_update_cooldown - time_since_last))
+                return _store_tpsl(symbol, entry_bucket, *last_values)
         
-        # Check if ATR-based TP/SL is enabled
-        use_atr_tpsl = os.getenv("USE_ATR_TPSL", "false").lower() == "true"
+        atr_pct = _compute_atr_pct(symbol, entry_price)
         
-        if use_atr_tpsl:
-            # ATR-Based Dynamic TP/SL
-            try:
-                from core.binance_client import get_futures_client
-                client = get_futures_client()
-                if client:
-                    # Get ATR from recent klines
-                    klines = client.futures_klines(symbol=symbol, interval="3m", limit=15)
-                    if len(klines) >= 14:  # Need at least 14 periods for ATR
-                        # Calculate ATR from klines
-                        highs = [float(k[2]) for k in klines]
-                        lows = [float(k[3]) for k in klines]
-                        closes = [float(k[4]) for k in klines]
-                        
-                        # Calculate True Range
-                        tr_values = []
-                        for i in range(1, len(highs)):
-                            tr1 = highs[i] - lows[i]
-                            tr2 = abs(highs[i] - closes[i-1])
-                            tr3 = abs(lows[i] - closes[i-1])
-                            tr = max(tr1, tr2, tr3)
-                            tr_values.append(tr)
-                        
-                        # Calculate 14-period ATR
-                        if len(tr_values) >= 14:
-                            atr = sum(tr_values[-14:]) / 14
-                            
-                            # Calculate TP/SL based on symbol and ATR
-                            if normalized_symbol.startswith("BTC"):
-                                # BTC: TP = 2.0 × ATR, SL = 1.0 × ATR
-                                tp_pct = 2.0 * (atr / entry_price) * 100
-                                sl_pct = 1.0 * (atr / entry_price) * 100
-                            elif normalized_symbol.startswith("BNB"):
-                                # BNB: TP = 1.5 × ATR, SL = 0.7 × ATR
-                                tp_pct = 1.5 * (atr / entry_price) * 100
-                                sl_pct = 0.7 * (atr / entry_price) * 100
-                            else:
-                                # Default fallback
-                                tp_pct = 2.0 * (atr / entry_price) * 100
-                                sl_pct = 1.0 * (atr / entry_price) * 100
-                            
-                            # Clamp values to reasonable ranges
-                            tp_pct = max(min(tp_pct, 5.0), 0.5)
-                            sl_pct = max(min(sl_pct, 2.5), 0.3)
-                            
-                            # THRESHOLD-BASED UPDATE: Only update if change > 0.1% (prevents unnecessary churn)
-                            if symbol in _last_atr_tpsl_values:
-                                last_tp, last_sl = _last_atr_tpsl_values[symbol]
-                                tp_change = abs(tp_pct - last_tp)
-                                sl_change = abs(sl_pct - last_sl)
-                                
-                                # If change is minimal, skip update and return cached values
-                                if tp_change < _atr_tpsl_change_threshold and sl_change < _atr_tpsl_change_threshold:
-                                    logger.debug(f"[ATR-TPSL] {symbol} - Change too small (TP: {tp_change:.3f}%, SL: {sl_change:.3f}%), using cached values")
-                                    return last_tp, last_sl
-                            
-                            logger.info(f"[ATR-TPSL] {symbol} - ATR: {atr:.4f}, TP: {tp_pct:.2f}%, SL: {sl_pct:.2f}%")
-                            # Update throttle timestamp and cache values on successful ATR calculation
-                            _last_atr_tpsl_update[symbol] = now
-                            _last_atr_tpsl_values[symbol] = (tp_pct, sl_pct)
-                            return tp_pct, sl_pct
-            except Exception as atr_error:
-                logger.warning(f"[ATR-TPSL] Failed to calculate ATR for {symbol}: {atr_error}")
+        if atr_pct is not None and USE_ATR_TPSL:
+            # ATR-Based Dynamic TP/SL (BTC 2.0/1.0, BNB 1.5/0.7 × ATR)
+            tp_pct = policy.atr_tp_mult * atr_pct
+            sl_pct = policy.atr_sl_mult * atr_pct
+            
+            # Clamp values to reasonable ranges
+            tp_pct = _clip(tp_pct, *_ATR_TP_BOUNDS)
+            sl_pct = _clip(sl_pct, *_ATR_SL_BOUNDS)
+            
+            # THRESHOLD-BASED UPDATE: Only update if change > 0.1% (prevents unnecessary churn)
+            if symbol in _last_atr_tpsl_values:
+                last_tp, last_sl = _last_atr_tpsl_values[symbol]
+                tp_change = abs(tp_pct - last_tp)
+                sl_change = abs(sl_pct - last_sl)
+                
+                # If change is minimal, skip update and return cached values
+                if tp_change < _atr_tpsl_change_threshold and sl_change < _atr_tpsl_change_threshold:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("[ATR-TPSL] %s - Change too small (TP: %.3f%%, SL: %.3f%%), using cached values", symbol, tp_change, sl_change)
+                    return _store_tpsl(symbol, entry_bucket, last_tp, last_sl)
+            
+            logger.info("[ATR-TPSL] %s - ATR: %.3f%%, TP: %.2f%%, SL: %.2f%%", symbol, atr_pct, tp_pct, sl_pct)
+            # Update throttle timestamp and cache values on successful ATR calculation
+            _last_atr_tpsl_update[symbol] = now
+            _last_atr_tpsl_values[symbol] = (tp_pct, sl_pct)
+            return _store_tpsl(symbol, entry_bucket, tp_pct, sl_pct)
         
-        # FIXED: Calculate dynamic TP/SL based on ATR instead of static values
-        # Fallback to ATR-based dynamic values when ATR calculation fails
-        try:
-            from core.binance_client import get_futures_client
-            client = get_futures_client()
-            if client:
-                # Try to get ATR from recent price action
-                klines = client.futures_klines(symbol=symbol, interval="3m", limit=15)
-                if len(klines) >= 14:
-                    highs = [float(k[2]) for k in klines]
-                    lows = [float(k[3]) for k in klines]
-                    closes = [float(k[4]) for k in klines]
-                    
-                    # Calculate True Range and ATR
-                    tr_values = []
-                    for i in range(1, len(highs)):
-                        tr1 = highs[i] - lows[i]
-                        tr2 = abs(highs[i] - closes[i-1])
-                        tr3 = abs(lows[i] - closes[i-1])
-                        tr = max(tr1, tr2, tr3)
-                        tr_values.append(tr)
-                    
-                    if len(tr_values) >= 14:
-                        atr = sum(tr_values[-14:]) / 14
-                        atr_pct = (atr / entry_price) * 100
-                        
-                        # FIXED: Dynamic RR per strategy - TP = (2-2.5)×ATR, SL = (1-1.25)×ATR
-                        # This adapts to market volatility as recommended
-                        # Use adaptive multipliers based on volatility regime
-                        if atr_pct > 1.5:  # High volatility
-                            tp_multiplier = 2.5  # Wider TP in high vol
-                            sl_multiplier = 1.25  # Wider SL in high vol
-                        elif atr_pct < 0.5:  # Low volatility
-                            tp_multiplier = 2.0  # Tighter TP in low vol
-                            sl_multiplier = 1.0  # Tighter SL in low vol
-                        else:  # Normal volatility
-                            tp_multiplier = 2.2  # Average
-                            sl_multiplier = 1.1  # Average
-                        
-                        # Calculate TP/SL as multiples of ATR percentage
-                        tp_pct = tp_multiplier * atr_pct
-                        sl_pct = sl_multiplier * atr_pct
-                        
-                        # Clamp to reasonable ranges
-                        if normalized_symbol.startswith("BTC"):
-                            tp_pct = max(min(tp_pct, 5.0), 0.8)  # 0.8% to 5.0%
-                            sl_pct = max(min(sl_pct, 2.5), 0.5)  # 0.5% to 2.5%
-                        elif normalized_symbol.startswith("BNB"):
-                            tp_pct = max(min(tp_pct, 3.0), 0.6)  # 0.6% to 3.0%
-                            sl_pct = max(min(sl_pct, 2.0), 0.4)  # 0.4% to 2.0%
-                        else:
-                            tp_pct = max(min(tp_pct, 4.0), 0.7)  # 0.7% to 4.0%
-                            sl_pct = max(min(sl_pct, 2.5), 0.5)  # 0.5% to 2.5%
-                        
-                        logger.info(f"[Dynamic TP/SL] {symbol}: ATR={atr_pct:.3f}%, TP={tp_pct:.2f}%, SL={sl_pct:.2f}%")
-                        return tp_pct, sl_pct
-        except Exception as e:
-            logger.warning(f"[Dynamic TP/SL] Failed to calculate ATR-based TP/SL for {symbol}: {e}")
+        if atr_pct is not None:
+            # FIXED: Dynamic RR per strategy - TP = (2-2.5)×ATR, SL = (1-1.25)×ATR
+            # This adapts to market volatility as recommended
+            # Use adaptive multipliers based on volatility regime
+            if atr_pct > 1.5:  # High volatility
+                tp_multiplier = 2.5  # Wider TP in high vol
+                sl_multiplier = 1.25  # Wider SL in high vol
+            elif atr_pct < 0.5:  # Low volatility
+                tp_multiplier = 2.0  # Tighter TP in low vol
+                sl_multiplier = 1.0  # Tighter SL in low vol
+            else:  # Normal volatility
+                tp_multiplier = 2.2  # Average
+                sl_multiplier = 1.1  # Average
+            
+            # Calculate TP/SL as multiples of ATR percentage
+            tp_pct = tp_multiplier * atr_pct
+            sl_pct = sl_multiplier * atr_pct
+            
+            # Clamp to reasonable ranges
+            tp_pct = _clip(tp_pct, policy.tp_min, policy.tp_max)
+            sl_pct = _clip(sl_pct, policy.sl_min, policy.sl_max)
+            
+            logger.info("[Dynamic TP/SL] %s: ATR=%.3f%%, TP=%.2f%%, SL=%.2f%%", symbol, atr_pct, tp_pct, sl_pct)
+            return _store_tpsl(symbol, entry_bucket, tp_pct, sl_pct)
         
         # Ultimate fallback: Use reasonable default percentages (not static 0.5%)
-        if normalized_symbol.startswith("BTC"):
-            tp_pct = 2.0  # 2.0% default
-            sl_pct = 1.0  # 1.0% default
-        elif normalized_symbol.startswith("BNB"):
-            tp_pct = 1.5  # 1.5% default
-            sl_pct = 0.7  # 0.7% default
-        else:
-            tp_pct = 2.0
-            sl_pct = 1.0
-        
-        return tp_pct, sl_pct
+        return _store_tpsl(symbol, entry_bucket, policy.default_tp, policy.default_sl)
     except Exception as e:
-        logger.warning(f"[ApexPatch2025-10-30] Failed to calculate symbol-specific TP/SL for {symbol}: {e}")
+        logger.warning("[ApexPatch2025-10-30] Failed to calculate symbol-specific TP/SL for %s: %s", symbol, e)
         # Fallback to default values
         return 2.0, 1.0
 
 
+def _ensure_notify_worker():
+    """Start the background notification thread if it is not running"""
+    global _notify_thread
+    if _notify_thread is not None and _notify_thread.is_alive():
+        return
+    with _notify_start_lock:
+        if _notify_thread is None or not _notify_thread.is_alive():
+            _notify_thread = threading.Thread(target=_notify_loop, name="trade-notify", daemon=True)
+            _notify_thread.start()
+
+
+def _notify_loop():
+    """Run queued side effects one at a time"""
+    while True:
+        fn, args, kwargs = _notify_queue.get()
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            logger.warning("Background task %s failed: %s", getattr(fn, "__name__", fn), e)
+
+
+def _run_in_background(fn, *args, **kwargs) -> None:
+    """Queue fn(*args, **kwargs) for the notification thread, dropping the oldest task when full"""
+    _ensure_notify_worker()
+    task = (fn, args, kwargs)
+    while True:
+        try:
+            _notify_queue.put_nowait(task)
+            return
+        except queue.Full:
+            try:
+                _notify_queue.get_nowait()
+                logger.warning("⚠️ Notification queue full, dropped oldest task")
+            except queue.Empty:
+                pass
+
+
+def flush_notifications(timeout: float = 5.0) -> bool:
+    """
+    Block until every task queued so far has run.
+    
+    Returns:
+        True if the queue drained within timeout
+    """
+    done = threading.Event()
+    _run_in_background(done.set)
+    return done.wait(timeout)
+
+
 def _append_trade_close(symbol: str, side: str, qty: float, entry_price: float, exit_price: float, status: str, 
                        agent_id: str = "trade_manager", confidence: float = 0.0, reasoning: str = "",
-                       leverage: int = 1, hold_duration_sec: float = 0.0) -> None:
+                       leverage: int = 1, hold_duration_sec: float = 0.0,
+                       pnl: Optional[float] = None, pnl_pct: Optional[float] = None) -> None:
     """
     Append a closed trade record to trades_log.csv (enhanced with CSV logger)
     
@@ -239,16 +421,18 @@ def _append_trade_close(symbol: str, side: str, qty: float, entry_price: float,
         reasoning: Reasoning at entry
         leverage: Leverage used
         hold_duration_sec: How long position was held
+        pnl: Realized PnL if the caller already computed it
+        pnl_pct: PnL percent if the caller already computed it
     """
-    # Calculate PnL
-    pnl = 0.0
-    pnl_pct = 0.0
-    if side.lower() == "buy":  # Long position closed
-        pnl = (exit_price - entry_price) * qty
-        pnl_pct = ((exit_price - entry_price) / entry_price) * 100 if entry_price > 0 else 0.0
-    else:  # Short position closed
-        pnl = (entry_price - exit_price) * qty
-        pnl_pct = ((entry_price - exit_price) / entry_price) * 100 if entry_price > 0 else 0.0
+    # Calculate PnL (only what the caller did not pass in)
+    is_long = side.lower() == "buy"  # Long position closed
+    if pnl is None:
+        pnl = (exit_price - entry_price) * qty if is_long else (entry_price - exit_price) * qty
+    if pnl_pct is None:
+        if entry_price > 0:
+            pnl_pct = ((exit_price - entry_price) if is_long else (entry_price - exit_price)) / entry_price * 100
+        else:
+            pnl_pct = 0.0
 
     # Calculate exit reason details
     exit_reason = status.upper()
@@ -274,9 +458,9 @@ def _append_trade_close(symbol: str, side: str, qty: float, entry_price: float,
             price_action_exit=price_action_exit,
             hold_duration_sec=hold_duration_sec
         )
-        logger.info(f"✅ Trade logged: {symbol} {status} PnL: {pnl:.2f} USDT ({pnl_pct:+.2f}%)")
+        logger.info("✅ Trade logged: %s %s PnL: %.2f USDT (%+.2f%%)", symbol, status, pnl, pnl_pct)
     except Exception as e:
-        logger.warning(f"Failed to write trade close log: {e}")
+        logger.warning("Failed to write trade close log: %s", e)
         # Fallback to old method
         try:
             exists = os.path.exists(TRADE_LOG_PATH)
@@ -287,31 +471,34 @@ def _append_trade_close(symbol: str, side: str, qty: float, entry_price: float,
                 writer.writerow([time.time(), agent_id, symbol, side.upper(), f"{qty:.8f}", 
                                f"{entry_price:.8f}", f"{exit_price:.8f}", f"{pnl:.8f}", status.upper(), f"Auto-closed: {status}"])
         except Exception as e2:
-            logger.error(f"Failed fallback write: {e2}")
+            logger.error("Failed fallback write: %s", e2)
 
 
-def validate_pnl_sync(client, symbol: str) -> bool:
+def validate_pnl_sync(client, symbol: str, position: Optional[Dict[str, Any]] = None) -> bool:
     """
     PnL Sync Validation: Compare internal logs vs Binance API after close.
     
     Args:
         client: Binance futures client
         symbol: Trading symbol (e.g., BTCUSDT)
+        position: Already-fetched Binance position to compare against
+                  (skips the futures_position_information request)
         
     Returns:
         True if sync is valid, False otherwise
     """
     try:
-        # Get position information from Binance
-        positions = client.futures_position_information(symbol=symbol)
-        binance_position = None
-        for pos in positions:
-            if pos.get("symbol") == symbol:
-                binance_position = pos
-                break
+        binance_position = position
+        if binance_position is None:
+            # Get position information from Binance
+            positions = client.futures_position_information(symbol=symbol)
+            for pos in positions:
+                if pos.get("symbol") == symbol:
+                    binance_position = pos
+                    break
         
         if not binance_position:
-            logger.warning(f"[PnL Sync] Could not find position for {symbol} in Binance API")
+            logger.warning("[PnL Sync] Could not find position for %s in Binance API", symbol)
             return False
             
         binance_position_amt = float(binance_position.get("positionAmt", 0))
@@ -320,16 +507,265 @@ def validate_pnl_sync(client, symbol: str) -> bool:
         
         # Read from our trade log
         if not os.path.exists(TRADE_LOG_PATH):
-            logger.info(f"[PnL Sync] No trade log found for {symbol}")
+            logger.info("[PnL Sync] No trade log found for %s", symbol)
             return True
             
         # For simplicity, we'll just log the comparison
-        logger.info(f"[PnL Sync] {symbol} - Binance position: {binance_position_amt} @ {binance_entry_price}, PnL: {binance_unrealized_pnl}")
+        logger.info("[PnL Sync] %s - Binance position: %s @ %s, PnL: %s", symbol, binance_position_amt, binance_entry_price, binance_unrealized_pnl)
         return True
         
     except Exception as e:
-        logger.error(f"[PnL Sync] Error validating PnL sync for {symbol}: {e}")
+        logger.error("[PnL Sync] Error validating PnL sync for %s: %s", symbol, e)
+        return False
+
+
+def _open_positions(positions: list) -> list:
+    """Filter a futures_position_information() response to [(position, position_amt)] with non-zero size"""
+    return [(p, amt) for p in positions if (amt := float(p.get("positionAmt", 0))) != 0.0]
+
+
+def _in_quiet_band(position: Dict[str, Any], position_amt: float) -> bool:
+    """
+    Fast check using the markPrice Binance returns with each position row.
+    
+    Returns:
+        True if the position is too close to entry to hit any TP/SL level
+    """
+    try:
+        entry_price = float(position.get("entryPrice", 0))
+        mark_price = float(position.get("markPrice", 0))
+    except (TypeError, ValueError):
         return False
+    if entry_price <= 0 or mark_price <= 0:
+        return False
+    change_pct = (mark_price - entry_price) / entry_price * 100.0
+    return abs(change_pct) < _QUIET_BAND_PCT
+
+
+def _fetch_mark_prices(client) -> Dict[str, float]:
+    """
+    Fetch mark prices for every futures symbol in a single request.
+
+    Returns an empty dict on failure so callers fall back to per-symbol lookups.
+    """
+    try:
+        return {p["symbol"]: float(p["markPrice"]) for p in _binance_call(client.futures_mark_price)}
+    except Exception as e:
+        logger.warning("Failed to fetch batch mark prices: %s", e)
+        return {}
+
+
+def _format_close_summary(closed_events: list, tp_count: int, sl_count: int, total_pnl: float) -> str:
+    """Format all positions closed in one manage_open_positions cycle as a single Telegram message"""
+    lines = []
+    for event in closed_events:
+        lines.append(
+            f"{'🎯' if event['reason'] == 'TAKE_PROFIT' else '🛑'} {event['symbol']} "
+            f"{'LONG' if event['is_long'] else 'SHORT'} {event['reason'].replace('_', ' ').title()}: "
+            f"${event['entry_price']:.2f} → ${event['exit_price']:.2f} | "
+            f"PnL: ${event['pnl']:+.2f} ({event['change_pct']:+.2f}%)"
+        )
+    return (
+        f"📊 TRADE MANAGER SUMMARY\n"
+        + "\n".join(lines) + "\n"
+        f"Positions Closed: {len(closed_events)}\n"
+        f"Take Profits: {tp_count}\n"
+        f"Stop Losses: {sl_count}\n"
+        f"Total PnL: ${total_pnl:+.2f}"
+    )
+
+
+def _process_position(client, position: Dict[str, Any], position_amt: float,
+                      mark_prices: Dict[str, float]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Check one open position against its TP/SL levels and close it if hit.
+    
+    Runs on a manage_open_positions worker thread.
+    
+    Returns:
+        (closed_event, error) - closed_event is set when the position was closed,
+        error when the price lookup or close failed; both None otherwise
+    """
+    symbol = position.get("symbol", "")
+    entry_price = float(position.get("entryPrice", 0))
+
+    if entry_price == 0:
+        return None, None
+
+    # Determine position direction
+    is_long = position_amt > 0
+    qty = abs(position_amt)
+
+    # Get current mark price for accurate PnL calculation
+    current_price = mark_prices.get(symbol, 0.0)
+    if not current_price:
+        # Fallback to ticker price
+        try:
+            ticker = _binance_call(client.futures_symbol_ticker, symbol=symbol)
+            current_price = float(ticker.get("price", 0))
+        except Exception as e:
+            return None, f"{symbol}: Failed to get price - {e}"
+
+    # Calculate symbol-specific TP/SL levels
+    tp_level, sl_level = _calculate_symbol_specific_tp_sl(symbol, entry_price)
+
+    # Calculate percentage change
+    if is_long:
+        # Long position: profit when price goes up
+        change_pct = ((current_price - entry_price) / entry_price) * 100.0
+    else:
+        # Short position: profit when price goes down
+        change_pct = ((entry_price - current_price) / entry_price) * 100.0
+
+    # Check TP/SL conditions
+    should_close = False
+    close_reason = ""
+
+    if change_pct >= tp_level:
+        should_close = True
+        close_reason = "TAKE_PROFIT"
+        logger.info(
+            "🎯 Take Profit triggered for %s: %s @ %.2f → %.2f (%+.2f%%)",
+            symbol, 'LONG' if is_long else 'SHORT', entry_price, current_price, change_pct
+        )
+    elif change_pct <= -sl_level:
+        should_close = True
+        close_reason = "STOP_LOSS"
+        logger.warning(
+            "🛑 Stop Loss triggered for %s: %s @ %.2f → %.2f (%+.2f%%)",
+            symbol, 'LONG' if is_long else 'SHORT', entry_price, current_price, change_pct
+        )
+
+    # Execute close if triggered
+    if should_close:
+        # FIXED: Trade state machine - prevent multiple exits (check + record is atomic)
+        if not try_begin_exit(symbol):
+            logger.debug("[TradeState] Exit blocked for %s - already closing or in debounce", symbol)
+            return None, None  # Skip this position
+
+        # Determine close side (opposite of position)
+        close_side = "sell" if is_long else "buy"
+
+        try:
+            result = close_position(symbol, close_side, qty, max_retries=3)
+
+            if result.get("status") == "success":
+                exit_price = result.get("price", current_price)
+
+                # FIXED: Record exit complete in state machine
+                record_exit_complete(symbol)
+                clear_tpsl_hashes(symbol)
+
+                # PnL Sync Validation: Compare internal logs vs the position we just closed
+                validate_pnl_sync(client, symbol, position)
+
+                # Calculate actual PnL
+                if is_long:
+                    pnl = (exit_price - entry_price) * qty
+                else:
+                    pnl = (entry_price - exit_price) * qty
+
+                # Kill-switch, CSV and learning files are shared across workers
+                with _close_bookkeeping_lock:
+                    # Determine agent_id from symbol (assume system or extract from position metadata)
+                    agent_id = "system"  # Default, can be enhanced to track per-agent
+
+                    # RECORD TRADE OUTCOME for kill-switch consecutive loss tracking
+                    if daily_loss_tracker is not None:
+                        try:
+                            is_win = pnl > 0
+                            daily_loss_tracker.record_trade_outcome(agent_id, is_win)
+                            logger.debug("[KillSwitch] Recorded trade outcome: %s for %s (PnL: %+.2f)", 'WIN' if is_win else 'LOSS', symbol, pnl)
+                        except Exception as e:
+                            logger.warning("Failed to record trade outcome for kill-switch: %s", e)
+
+                    # Log to CSV
+                    original_side = "buy" if is_long else "sell"
+                    # From the fill price, like pnl (change_pct is the mark-price trigger)
+                    pnl_pct = ((exit_price - entry_price) if is_long else (entry_price - exit_price)) / entry_price * 100
+                    _append_trade_close(symbol, original_side, qty, entry_price, exit_price, close_reason,
+                                        pnl=pnl, pnl_pct=pnl_pct)
+
+                    # FIXED: Outcome Feedback Logging - Append TP/SL/ROI to decision log
+                    try:
+                        update_decision_with_outcome(
+                            symbol=symbol,
+                            entry_price=entry_price,
+                            exit_price=exit_price,
+                            exit_reason=close_reason,
+                            pnl=pnl,
+                            pnl_pct=pnl_pct,
+                            agent_id=agent_id
+                        )
+                    except Exception as e:
+                        logger.warning("Failed to log outcome feedback: %s", e)
+
+                    # FEEDBACK LOOP: Update learning memory from CSV logs
+                    # This links outcome to original decision so future cycles can learn
+                    try:
+                        # Try to get strategy from decisions log
+                        decision_data = find_matching_decision(symbol, entry_price, agent_id)
+                        strategy_used = decision_data.get("strategy_used", "unknown") if decision_data else "unknown"
+
+                        update_learning_from_csv_logs(
+                            symbol=symbol,
+                            entry_price=entry_price,
+                            exit_price=exit_price,
+                            pnl=pnl,
+                            pnl_pct=pnl_pct,
+                            exit_reason=close_reason,
+                            agent_id=agent_id,
+                            strategy_used=strategy_used
+                        )
+
+                        # Also log to CSV learning log
+                        if decision_data:
+                            confidence_accuracy = 1.0 if (decision_data.get("confidence", 0.5) > 0.5) == (pnl > 0) else 0.0
+                            lesson = f"{strategy_used} strategy {'worked' if pnl > 0 else 'failed'} in {close_reason} scenario"
+
+                            log_learning(
+                                agent_id=agent_id,
+                                symbol=symbol,
+                                decision_signal=decision_data.get("signal", "long"),
+                                decision_confidence=decision_data.get("confidence", 0.7),
+                                decision_reasoning=decision_data.get("reasoning", ""),
+                                outcome_status="win" if pnl > 0 else "loss" if pnl < 0 else "breakeven",
+                                outcome_pnl=pnl,
+                                outcome_pnl_pct=pnl_pct,
+                                exit_reason=close_reason,
+                                strategy_used=strategy_used,
+                                market_conditions_entry=decision_data.get("volatility_regime", ""),
+                                confidence_accuracy=confidence_accuracy,
+                                lesson_learned=lesson
+                            )
+                    except Exception as e:
+                        logger.warning("Failed to update learning from CSV logs: %s", e)
+
+                logger.info(
+                    "✅ Position closed: %s %s PnL: %+.2f USDT (%+.2f%%)",
+                    symbol, close_reason, pnl, pnl_pct
+                )
+
+                return {
+                    "symbol": symbol,
+                    "reason": close_reason,
+                    "is_long": is_long,
+                    "entry_price": entry_price,
+                    "exit_price": exit_price,
+                    "pnl": pnl,
+                    "change_pct": change_pct,
+                }, None
+            else:
+                error_msg = f"{symbol}: Close failed - {result.get('message')}"
+                logger.error(error_msg)
+                return None, error_msg
+
+        except Exception as e:
+            error_msg = f"{symbol}: Exception during close - {str(e)}"
+            logger.error(error_msg)
+            return None, error_msg
+
+    return None, None
 
 
 def manage_open_positions() -> Dict[str, Any]:
@@ -366,236 +802,62 @@ def manage_open_positions() -> Dict[str, Any]:
     sl_count = 0
     errors = []
     total_pnl = 0.0
+    closed_events = []  # Reported in one Telegram message after the loop
+
+    banned_for = rate_limit_remaining()
+    if banned_for > 0:
+        return {
+            "closed": 0,
+            "take_profit": 0,
+            "stop_loss": 0,
+            "errors": [f"Rate limited by Binance for {banned_for:.0f}s"],
+            "total_pnl": 0.0
+        }
 
     try:
-        positions = client.futures_position_information()
+        # Only open positions (skip the zero rows for every listed symbol), and
+        # of those only the ones whose reported markPrice is outside the quiet band
+        active = [
+            (position, position_amt)
+            for position, position_amt in _open_positions(_binance_call(client.futures_position_information))
+            if not _in_quiet_band(position, position_amt)
+        ]
+        mark_prices = _fetch_mark_prices(client) if active else {}
         
-        for position in positions:
-            position_amt = float(position.get("positionAmt", 0))
-            
-            # Skip if no position
-            if position_amt == 0.0:
-                continue
-            
-            symbol = position.get("symbol", "")
-            entry_price = float(position.get("entryPrice", 0))
-            
-            if entry_price == 0:
-                continue
-            
-            # PnL Sync Validation: Compare internal logs vs Binance API after close
-            validate_pnl_sync(client, symbol)
-            
-            # Determine position direction
-            is_long = position_amt > 0
-            qty = abs(position_amt)
-            
-            # Get current mark price for accurate PnL calculation
-            try:
-                mark_price_data = client.futures_mark_price(symbol=symbol)
-                current_price = float(mark_price_data.get("markPrice", 0))
-            except Exception:
-                # Fallback to ticker price
-                try:
-                    ticker = client.futures_symbol_ticker(symbol=symbol)
-                    current_price = float(ticker.get("price", 0))
-                except Exception as e:
-                    errors.append(f"{symbol}: Failed to get price - {e}")
-                    continue
-            
-            # Calculate symbol-specific TP/SL levels
-            tp_level, sl_level = _calculate_symbol_specific_tp_sl(symbol, entry_price)
-            
-            # Calculate percentage change
-            if is_long:
-                # Long position: profit when price goes up
-                change_pct = ((current_price - entry_price) / entry_price) * 100.0
-            else:
-                # Short position: profit when price goes down
-                change_pct = ((entry_price - current_price) / entry_price) * 100.0
-            
-            # Check TP/SL conditions
-            should_close = False
-            close_reason = ""
-            
-            if change_pct >= tp_level:
-                should_close = True
-                close_reason = "TAKE_PROFIT"
-                logger.info(
-                    f"🎯 Take Profit triggered for {symbol}: "
-                    f"{'LONG' if is_long else 'SHORT'} @ {entry_price:.2f} → {current_price:.2f} "
-                    f"({change_pct:+.2f}%)"
-                )
-            elif change_pct <= -sl_level:
-                should_close = True
-                close_reason = "STOP_LOSS"
-                logger.warning(
-                    f"🛑 Stop Loss triggered for {symbol}: "
-                    f"{'LONG' if is_long else 'SHORT'} @ {entry_price:.2f} → {current_price:.2f} "
-                    f"({change_pct:+.2f}%)"
-                )
-            
-            # Execute close if triggered
-            if should_close:
-                # FIXED: Trade state machine - prevent multiple exits
-                try:
-                    from core.trade_state_manager import is_exit_allowed, record_exit_attempt, record_exit_complete
-                    
-                    if not is_exit_allowed(symbol):
-                        logger.debug(f"[TradeState] Exit blocked for {symbol} - already closing or in debounce")
-                        continue  # Skip this position, try next
-                    
-                    record_exit_attempt(symbol)
-                except ImportError:
-                    pass  # Fallback if module not available
-                
-                # Determine close side (opposite of position)
-                close_side = "sell" if is_long else "buy"
-                
-                try:
-                    result = close_position(symbol, close_side, qty, max_retries=3)
-                    
-                    if result.get("status") == "success":
-                        exit_price = result.get("price", current_price)
-                        
-                        # FIXED: Record exit complete in state machine
-                        try:
-                            from core.trade_state_manager import record_exit_complete, clear_tpsl_hashes
-                            record_exit_complete(symbol)
-                            clear_tpsl_hashes(symbol)
-                        except ImportError:
-                            pass
-                        
-                        # Calculate actual PnL
-                        if is_long:
-                            pnl = (exit_price - entry_price) * qty
-                        else:
-                            pnl = (entry_price - exit_price) * qty
-                        
-                        # RECORD TRADE OUTCOME for kill-switch consecutive loss tracking
-                        try:
-                            from core.risk_engine import daily_loss_tracker
-                            is_win = pnl > 0
-                            # Determine agent_id from symbol (assume system or extract from position metadata)
-                            agent_id = "system"  # Default, can be enhanced to track per-agent
-                            daily_loss_tracker.record_trade_outcome(agent_id, is_win)
-                            logger.debug(f"[KillSwitch] Recorded trade outcome: {'WIN' if is_win else 'LOSS'} for {symbol} (PnL: {pnl:+.2f})")
-                        except Exception as e:
-                            logger.warning(f"Failed to record trade outcome for kill-switch: {e}")
-                        
-                        total_pnl += pnl
-                        closed += 1
-                        
-                        if close_reason == "TAKE_PROFIT":
-                            tp_count += 1
-                        else:
-                            sl_count += 1
-                        
-                        # Log to CSV
-                        original_side = "buy" if is_long else "sell"
-                        pnl_pct = change_pct
-                        _append_trade_close(symbol, original_side, qty, entry_price, exit_price, close_reason)
-                        
-                        # FIXED: Outcome Feedback Logging - Append TP/SL/ROI to decision log
-                        try:
-                            update_decision_with_outcome(
-                                symbol=symbol,
-                                entry_price=entry_price,
-                                exit_price=exit_price,
-                                exit_reason=close_reason,
-                                pnl=pnl,
-                                pnl_pct=pnl_pct,
-                                agent_id=agent_id
-                            )
-                        except Exception as e:
-                            logger.warning(f"Failed to log outcome feedback: {e}")
-                        
-                        # FEEDBACK LOOP: Update learning memory from CSV logs
-                        # This links outcome to original decision so future cycles can learn
-                        try:
-                            # Try to get strategy from decisions log
-                            from core.learning_bridge import find_matching_decision
-                            decision_data = find_matching_decision(symbol, entry_price, agent_id)
-                            strategy_used = decision_data.get("strategy_used", "unknown") if decision_data else "unknown"
-                            
-                            update_learning_from_csv_logs(
-                                symbol=symbol,
-                                entry_price=entry_price,
-                                exit_price=exit_price,
-                                pnl=pnl,
-                                pnl_pct=pnl_pct,
-                                exit_reason=close_reason,
-                                agent_id=agent_id,
-                                strategy_used=strategy_used
-                            )
-                            
-                            # Also log to CSV learning log
-                            if decision_data:
-                                confidence_accuracy = 1.0 if (decision_data.get("confidence", 0.5) > 0.5) == (pnl > 0) else 0.0
-                                lesson = f"{strategy_used} strategy {'worked' if pnl > 0 else 'failed'} in {close_reason} scenario"
-                                
-                                log_learning(
-                                    agent_id=agent_id,
-                                    symbol=symbol,
-                                    decision_signal=decision_data.get("signal", "long"),
-                                    decision_confidence=decision_data.get("confidence", 0.7),
-                                    decision_reasoning=decision_data.get("reasoning", ""),
-                                    outcome_status="win" if pnl > 0 else "loss" if pnl < 0 else "breakeven",
-                                    outcome_pnl=pnl,
-                                    outcome_pnl_pct=pnl_pct,
-                                    exit_reason=close_reason,
-                                    strategy_used=strategy_used,
-                                    market_conditions_entry=decision_data.get("volatility_regime", ""),
-                                    confidence_accuracy=confidence_accuracy,
-                                    lesson_learned=lesson
-                                )
-                        except Exception as e:
-                            logger.warning(f"Failed to update learning from CSV logs: {e}")
-                        
-                        logger.info(
-                            f"✅ Position closed: {symbol} {close_reason} "
-                            f"PnL: {pnl:+.2f} USDT ({change_pct:+.2f}%)"
-                        )
-                        
-                        # Send Telegram notification for closed position
-                        if TELEGRAM_ENABLED:
-                            telegram_msg = (
-                                f"{'🎯' if close_reason == 'TAKE_PROFIT' else '🛑'} POSITION CLOSED\n"
-                                f"Symbol: {symbol}\n"
-                                f"Type: {close_reason.replace('_', ' ').title()}\n"
-                                f"Side: {'LONG' if is_long else 'SHORT'}\n"
-                                f"Entry: ${entry_price:.2f}\n"
-                                f"Exit: ${exit_price:.2f}\n"
-                                f"PnL: ${pnl:+.2f} ({change_pct:+.2f}%)"
-                            )
-                            send_message(telegram_msg)
+        # Each position's price lookup/klines/close is independent network I/O,
+        # so run them concurrently. The worker count is capped to stay well inside
+        # Binance's request weight limits.
+        if active:
+            workers = min(MANAGE_MAX_WORKERS, len(active))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_process_position, client, position, position_amt, mark_prices)
+                    for position, position_amt in active
+                ]
+                for future in futures:
+                    event, error = future.result()
+                    if error:
+                        errors.append(error)
+                    if event is None:
+                        continue
+                    closed_events.append(event)
+                    total_pnl += event["pnl"]
+                    closed += 1
+                    if event["reason"] == "TAKE_PROFIT":
+                        tp_count += 1
                     else:
-                        error_msg = f"{symbol}: Close failed - {result.get('message')}"
-                        errors.append(error_msg)
-                        logger.error(error_msg)
-                        
-                except Exception as e:
-                    error_msg = f"{symbol}: Exception during close - {str(e)}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
+                        sl_count += 1
         
         # Summary log
         if closed > 0:
             logger.info(
-                f"📊 Trade Manager Summary: {closed} positions closed "
-                f"(TP: {tp_count}, SL: {sl_count}) | Total PnL: {total_pnl:+.2f} USDT"
+                "📊 Trade Manager Summary: %s positions closed (TP: %s, SL: %s) | Total PnL: %+.2f USDT",
+                closed, tp_count, sl_count, total_pnl
             )
             
-            # Send Telegram summary
+            # Send one Telegram message for the whole cycle (closes + summary)
             if TELEGRAM_ENABLED:
-                telegram_msg = (
-                    f"📊 TRADE MANAGER SUMMARY\n"
-                    f"Positions Closed: {closed}\n"
-                    f"Take Profits: {tp_count}\n"
-                    f"Stop Losses: {sl_count}\n"
-                    f"Total PnL: ${total_pnl:+.2f}"
-                )
-                send_message(telegram_msg)
+                _run_in_background(send_message, _format_close_summary(closed_events, tp_count, sl_count, total_pnl))
         
         return {
             "closed": closed,
@@ -606,7 +868,7 @@ def manage_open_positions() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Trade manager exception: {e}", exc_info=True)
+        logger.error("Trade manager exception: %s", e, exc_info=True)
         return {
             "closed": closed,
             "take_profit": tp_count,
@@ -616,32 +878,119 @@ def manage_open_positions() -> Dict[str, Any]:
         }
 
 
-def live_monitor_loop(interval=3):
+def _load_symbol_meta(client) -> None:
+    """Index LOT_SIZE step and min quantity for every futures symbol"""
+    global _sym_meta
+    try:
+        info = client.futures_exchange_info()
+    except Exception as e:
+        logger.warning("⚠️ [LiveMonitor] Failed to load exchange info, using default quantity rules: %s", e)
+        return
+    
+    meta = {}
+    for sym in info.get("symbols", []):
+        lot = next((f for f in sym.get("filters", []) if f.get("filterType") == "LOT_SIZE"), None)
+        if lot is None:
+            continue
+        try:
+            step = Decimal(str(lot["stepSize"])).normalize()
+            meta[sym["symbol"]] = SymbolMeta(float(step), float(lot["minQty"]), max(0, -step.as_tuple().exponent))
+        except (KeyError, ArithmeticError, ValueError):
+            continue
+    _sym_meta = meta
+
+
+def _round_to_step(symbol: str, qty: float) -> Tuple[float, float]:
+    """
+    Round a quantity down to the symbol's step size.
+    
+    Returns:
+        Tuple of (rounded_qty, min_qty)
+    """
+    meta = _sym_meta.get(symbol)
+    if meta is None or meta.step_size <= 0:
+        return safe_qty(symbol, qty), _FALLBACK_MIN_QTY.get(symbol, 0.001)
+    # round() absorbs float error so e.g. 0.003 / 0.001 doesn't floor to 2 steps
+    steps = math.floor(round(qty / meta.step_size, 9))
+    return round(steps * meta.step_size, meta.qty_decimals), meta.min_qty
+
+
+def _evaluate_tpsl(entry, mark, is_long, tp_pct, sl_pct):
+    """
+    Evaluate TP/SL for all open positions at once.
+    
+    Args are parallel arrays with one element per position; is_long is boolean
+    and tp_pct/sl_pct are percentages.
+    
+    Returns:
+        Tuple of arrays (roi_pct, tp_price, sl_price, hit_tp, hit_sl)
+    """
+    # +1 for longs, -1 for shorts: a short profits (and hits TP) as price falls
+    sign = np.where(is_long, 1.0, -1.0)
+    roi_pct = sign * (mark - entry) / entry * 100
+    tp_price = entry * (1 + sign * tp_pct / 100)
+    sl_price = entry * (1 - sign * sl_pct / 100)
+    hit_tp = sign * (mark - tp_price) >= 0
+    hit_sl = sign * (mark - sl_price) <= 0
+    return roi_pct, tp_price, sl_price, hit_tp, hit_sl
+
+
+def live_monitor_loop(interval=LIVE_MONITOR_INTERVAL):
     """
     Live monitor thread that checks TP/SL hits every N seconds.
     This runs in a separate thread to provide instant reaction to price movements.
+    
+    Positions and mark prices come from the WebSocket mirror in core.market_stream
+    when available; a pass also runs as soon as a streamed mark price crosses a
+    TP/SL level or a position changes. REST polling is used whenever the streams
+    are down or stale.
     """
-    global _live_monitor_running, _last_attach
-    logger.info(f"🔄 [LiveMonitor] Thread started ({interval}s interval)")
+    global _last_attach
+    logger.info("🔄 [LiveMonitor] Thread started (%ss interval)", interval)
     
     client = get_futures_client()
     if not client:
         logger.error("❌ [LiveMonitor] Binance Futures client not initialized")
         return
     
-    while _live_monitor_running:
+    _load_symbol_meta(client)
+    streaming = market_stream.start_streams(BINANCE_API_KEY, BINANCE_API_SECRET, testnet=IS_TESTNET)
+    
+    # Passes are scheduled on fixed monotonic deadlines so the cadence doesn't
+    # stretch to interval + pass duration under load
+    next_tick = time.monotonic() + interval
+    
+    while not _live_monitor_stop.is_set():
+        # Don't poll while Binance is rate limiting us - extra requests extend the ban
+        banned_for = rate_limit_remaining()
+        if banned_for > 0:
+            logger.warning("⚠️ [LiveMonitor] Rate limited, pausing %.0fs", banned_for)
+            if _live_monitor_stop.wait(banned_for):
+                break
+            next_tick = time.monotonic() + interval
+        
         try:
-            # Get all open positions
-            positions = client.futures_position_information()
+            # Get all open positions (stream mirror first, REST when it needs a re-seed)
+            positions = market_stream.get_positions() if streaming else None
+            if positions is None:
+                positions = _binance_call(client.futures_position_information)
+                if streaming:
+                    market_stream.seed_positions(positions)
+                    market_stream.seed_open_orders(_binance_call(client.futures_get_open_orders))
             
-            for position in positions:
-                position_amt = float(position.get("positionAmt", 0))
-                
-                # Skip if no position
-                if position_amt == 0.0:
-                    continue
-                
+            # Account-wide REST snapshots, fetched at most once per pass and only
+            # for symbols the streams can't answer for
+            rest_marks = None
+            rest_tickers = None
+            rest_orders = None
+            open_symbols = set()
+            rows = []  # Positions with a usable price, evaluated together below
+            leverages = {}  # {symbol: leverage} from the snapshot, when it carries one
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            
+            for position, position_amt in _open_positions(positions):
                 symbol = position.get("symbol", "")
+                open_symbols.add(symbol)
                 entry_price = float(position.get("entryPrice", 0))
                 
                 if entry_price == 0:
@@ -650,122 +999,127 @@ def live_monitor_loop(interval=3):
                 # Determine position direction
                 is_long = position_amt > 0
                 qty = abs(position_amt)
+                if position.get("leverage") is not None:
+                    leverages[symbol] = position["leverage"]
                 
                 # Get current mark price for accurate PnL calculation
-                try:
-                    mark_price_data = client.futures_mark_price(symbol=symbol)
-                    mark_price = float(mark_price_data.get("markPrice", 0))
-                except Exception:
-                    # Fallback to ticker price
+                mark_price = market_stream.get_mark_price(symbol) if streaming else None
+                if mark_price is None:
+                    if rest_marks is None:
+                        rest_marks = _fetch_mark_prices(client)
+                    mark_price = rest_marks.get(symbol)
+                if not mark_price:
+                    # Fallback to ticker price (all symbols in one request, once per pass)
                     try:
-                        ticker = client.futures_symbol_ticker(symbol=symbol)
-                        mark_price = float(ticker.get("price", 0))
+                        if rest_tickers is None:
+                            rest_tickers = {t["symbol"]: float(t["price"]) for t in _binance_call(client.futures_symbol_ticker)}
+                        mark_price = rest_tickers.get(symbol, 0.0)
                     except Exception as e:
-                        logger.warning(f"⚠️ [LiveMonitor] {symbol}: Failed to get price - {e}")
+                        logger.warning("⚠️ [LiveMonitor] %s: Failed to get price - %s", symbol, e)
+                        continue
+                    if not mark_price:
+                        logger.warning("⚠️ [LiveMonitor] %s: Failed to get price - no ticker", symbol)
                         continue
                 
                 # FIXED: LiveMonitor now only OBSERVES TP/SL status - SentinelAgent handles re-attach
                 # This prevents overlapping re-attach attempts and reduces API calls
+                open_orders = None
+                has_tp_order = has_sl_order = True  # Assume present if the check fails
                 try:
-                    open_orders = client.futures_get_open_orders(symbol=symbol)
-                    has_tp_order = any(
-                        order.get('type') == 'TAKE_PROFIT_MARKET' and 
-                        (order.get('closePosition') or order.get('reduceOnly'))
-                        for order in open_orders
-                    )
-                    has_sl_order = any(
-                        order.get('type') == 'STOP_MARKET' and 
-                        (order.get('closePosition') or order.get('reduceOnly'))
-                        for order in open_orders
-                    )
+                    open_orders = market_stream.get_open_orders(symbol) if streaming else None
+                    if open_orders is None:
+                        if rest_orders is None:
+                            rest_orders = defaultdict(list)
+                            for order in _binance_call(client.futures_get_open_orders):
+                                rest_orders[order.get("symbol")].append(order)
+                        open_orders = rest_orders.get(symbol, [])
+                    # Single pass over the orders, stopping once both are found
+                    has_tp_order = has_sl_order = False
+                    for order in open_orders:
+                        if not (order.get('closePosition') or order.get('reduceOnly')):
+                            continue
+                        order_type = order.get('type')
+                        if order_type == 'TAKE_PROFIT_MARKET':
+                            has_tp_order = True
+                        elif order_type == 'STOP_MARKET':
+                            has_sl_order = True
+                        if has_tp_order and has_sl_order:
+                            break
                     
                     # Only log status - do NOT re-attach (SentinelAgent handles that)
-                    if not has_tp_order or not has_sl_order:
-                        missing_parts = []
-                        if not has_tp_order:
-                            missing_parts.append("TP")
-                        if not has_sl_order:
-                            missing_parts.append("SL")
-                        logger.debug(f"[LiveMonitor] ⚠️ Missing {', '.join(missing_parts)} for {symbol} - SentinelAgent will handle re-attach")
-                    else:
-                        logger.debug(f"[LiveMonitor] ✅ TP/SL verified for {symbol}")
+                    if debug_enabled:
+                        missing = _MISSING_TPSL.get((has_tp_order, has_sl_order))
+                        if missing:
+                            logger.debug("[LiveMonitor] ⚠️ Missing %s for %s - SentinelAgent will handle re-attach", missing, symbol)
+                        else:
+                            logger.debug("[LiveMonitor] ✅ TP/SL verified for %s", symbol)
                 except Exception as e:
-                    logger.debug(f"[LiveMonitor] Could not check TP/SL for {symbol}: {e}")
+                    logger.debug("[LiveMonitor] Could not check TP/SL for %s: %s", symbol, e)
                 
                 # Calculate symbol-specific TP and SL levels
                 tp_level, sl_level = _calculate_symbol_specific_tp_sl(symbol, entry_price)
+                rows.append((symbol, position_amt, entry_price, is_long, qty, mark_price,
+                             open_orders, has_tp_order, has_sl_order, tp_level, sl_level))
+            
+            # TP/SL prices, ROI and hits for every position at once
+            if rows:
+                roi_arr, tp_arr, sl_arr, hit_tp_arr, hit_sl_arr = _evaluate_tpsl(
+                    np.array([row[2] for row in rows]),
+                    np.array([row[5] for row in rows]),
+                    np.array([row[3] for row in rows]),
+                    np.array([row[9] for row in rows]),
+                    np.array([row[10] for row in rows]),
+                )
                 
-                # For long positions
-                if is_long:
-                    tp_price = entry_price * (1 + tp_level / 100)
-                    sl_price = entry_price * (1 - sl_level / 100)
-                else:
-                    # For short positions
-                    tp_price = entry_price * (1 - tp_level / 100)
-                    sl_price = entry_price * (1 + sl_level / 100)
-                
-                # Calculate and log ROI percentage for better monitoring
-                if is_long:
-                    roi_pct = ((mark_price - entry_price) / entry_price) * 100
-                else:
-                    roi_pct = ((entry_price - mark_price) / entry_price) * 100
-                
-                # Log the check with ROI - only on significant changes or errors (reduce verbosity)
-                # Track last logged ROI to avoid spam
-                last_logged_key = f"{symbol}_last_roi_log"
-                if not hasattr(live_monitor_loop, '_last_roi_logs'):
-                    live_monitor_loop._last_roi_logs = {}
-                
-                last_roi = live_monitor_loop._last_roi_logs.get(last_logged_key, roi_pct)
-                roi_change = abs(roi_pct - last_roi)
-                
-                # Only log if: ROI changed significantly (>0.05%), or TP/SL missing, or ROI crossed threshold
-                should_log = (
-                    roi_change > 0.05 or  # Significant ROI change
-                    (not has_tp_order or not has_sl_order) or  # Missing TP/SL
-                    (roi_pct >= 0.3 and last_roi < 0.3) or  # Crossed profit threshold
-                    (roi_pct <= -0.5 and last_roi > -0.5)  # Crossed loss threshold
+                # Log the check with ROI - only on significant changes or errors (reduce verbosity).
+                # Log if: ROI moved >0.05% since the last log, TP/SL missing, or ROI crossed
+                # the +0.3% / -0.5% thresholds - decided for every position in one pass.
+                last_arr = np.array([_last_roi_logs.get(row[0], roi) for row, roi in zip(rows, roi_arr)])
+                delta_arr = roi_arr - last_arr
+                log_arr = (
+                    (delta_arr > 0.05) | (delta_arr < -0.05)
+                    | ~np.array([row[7] and row[8] for row in rows])
+                    | ((roi_arr >= 0.3) & (last_arr < 0.3))
+                    | ((roi_arr <= -0.5) & (last_arr > -0.5))
                 )
+            
+            for i, row in enumerate(rows):
+                (symbol, position_amt, entry_price, is_long, qty, mark_price,
+                 open_orders, has_tp_order, has_sl_order, tp_level, sl_level) = row
+                tp_price = float(tp_arr[i])
+                sl_price = float(sl_arr[i])
+                roi_pct = float(roi_arr[i])
+                
+                if streaming:
+                    market_stream.set_tpsl_trigger(symbol, is_long, tp_price, sl_price)
                 
-                if should_log:
-                    logger.info(f"🔄 [LiveMonitor] Checking {symbol}... Mark={mark_price:.2f} TP={tp_price:.2f} SL={sl_price:.2f} ROI={roi_pct:+.2f}%")
-                    live_monitor_loop._last_roi_logs[last_logged_key] = roi_pct
+                if log_arr[i]:
+                    logger.info("🔄 [LiveMonitor] Checking %s... Mark=%.2f TP=%.2f SL=%.2f ROI=%+.2f%%", symbol, mark_price, tp_price, sl_price, roi_pct)
+                    _last_roi_logs[symbol] = roi_pct
                 
                 # AUTO-PARTIAL CLOSE: Lock in profits when ROI >= +0.3% (profit protection)
                 # This prevents profit plateau issues where price stalls near TP without hitting it
                 if roi_pct >= 0.3 and symbol not in _partial_close_executed:
-                    # Check if position still exists (hasn't been fully closed)
                     try:
-                        current_positions = client.futures_position_information(symbol=symbol)
-                        current_pos_amt = 0.0
-                        for pos in current_positions:
-                            if pos.get("symbol") == symbol:
-                                current_pos_amt = float(pos.get("positionAmt", 0))
-                                break
+                        current_pos_amt = position_amt  # From this pass's position snapshot
                         
                         # Only partial close if position exists and is substantial
                         if abs(current_pos_amt) > 0:
                             # FIXED: Calculate partial close quantity (25% of position, not 50%)
                             partial_close_qty = abs(current_pos_amt) * 0.25
                             
-                            # Get minimum quantity requirements
-                            from core.order_manager import safe_qty
-                            safe_partial_qty = safe_qty(symbol, partial_close_qty)
-                            
-                            # Minimum quantity check
-                            MIN_QTY_MAP = {"BTCUSDT": 0.001, "BNBUSDT": 0.0001}
-                            min_qty = MIN_QTY_MAP.get(symbol, 0.001)
+                            # Round to the symbol's step size and get its minimum quantity
+                            safe_partial_qty, min_qty = _round_to_step(symbol, partial_close_qty)
                             
                             if safe_partial_qty >= min_qty:
                                 close_side = "sell" if is_long else "buy"
                                 
                                 logger.info(
-                                    f"💰 [LiveMonitor] Auto-partial close triggered for {symbol}: "
-                                    f"ROI={roi_pct:+.2f}% >= 0.3% | Closing 25% ({safe_partial_qty:.6f} of {abs(current_pos_amt):.6f})"
+                                    "💰 [LiveMonitor] Auto-partial close triggered for %s: ROI=%+.2f%% >= 0.3%% | Closing 25%% (%.6f of %.6f)",
+                                    symbol, roi_pct, safe_partial_qty, abs(current_pos_amt)
                                 )
                                 
                                 try:
-                                    from core.order_manager import place_futures_order
                                     partial_result = place_futures_order(
                                         symbol=symbol,
                                         side=close_side,
@@ -787,56 +1141,52 @@ def live_monitor_loop(interval=3):
                                             partial_pnl = (entry_price - partial_exit_price) * safe_partial_qty
                                         
                                         # Mark as partially closed to prevent repeated closes
-                                        _partial_close_executed[symbol] = True
+                                        _partial_close_executed.add(symbol)
                                         
                                         logger.info(
-                                            f"✅ [LiveMonitor] Partial close executed: {symbol} | "
-                                            f"25% closed @ {partial_exit_price:.2f} | Partial PnL: {partial_pnl:+.2f} USDT"
+                                            "✅ [LiveMonitor] Partial close executed: %s | 25%% closed @ %.2f | Partial PnL: %+.2f USDT",
+                                            symbol, partial_exit_price, partial_pnl
                                         )
                                         
                                         # FIXED: Move SL to breakeven after partial close (trailing stop protection)
                                         try:
-                                            from core.order_manager import place_take_profit_and_stop_loss, get_current_position
-                                            current_pos = get_current_position(symbol)
-                                            if current_pos:
-                                                remaining_qty = abs(float(current_pos.get('positionAmt', 0)))
-                                                if remaining_qty > 0:
-                                                    # Calculate breakeven SL price
-                                                    if is_long:
-                                                        breakeven_sl = entry_price * 1.001  # Slight buffer above entry
-                                                    else:
-                                                        breakeven_sl = entry_price * 0.999  # Slight buffer below entry
+                                            # Remainder follows from this pass's snapshot and the
+                                            # reduce-only fill; only re-query when leverage is unknown
+                                            remaining_qty = qty - float(partial_result.get("qty") or safe_partial_qty)
+                                            leverage = leverages.get(symbol)
+                                            if leverage is None:
+                                                current_pos = get_current_position(symbol)
+                                                remaining_qty = abs(float(current_pos.get('positionAmt', 0))) if current_pos else 0.0
+                                                leverage = current_pos.get('leverage', 1) if current_pos else 1
+                                            if remaining_qty > 0:
+                                                # Calculate breakeven SL price
+                                                if is_long:
+                                                    breakeven_sl = entry_price * 1.001  # Slight buffer above entry
+                                                else:
+                                                    breakeven_sl = entry_price * 0.999  # Slight buffer below entry
                                                     
-                                                    # Update SL to breakeven (calculate TP/SL prices from percentages)
-                                                    # Get current TP price first
-                                                    open_orders = client.futures_get_open_orders(symbol=symbol)
-                                                    tp_price = 0
-                                                    for order in open_orders:
-                                                        if order.get('type') == 'TAKE_PROFIT_MARKET':
-                                                            tp_price = float(order.get('stopPrice', 0))
-                                                            break
+                                                # Update SL to breakeven (calculate TP/SL prices from percentages)
+                                                # Keep the resting TP order's price (partial close leaves it in place),
+                                                # else the level computed for this pass
+                                                breakeven_tp = next(
+                                                    (float(order.get('stopPrice', 0)) for order in open_orders or []
+                                                     if order.get('type') == 'TAKE_PROFIT_MARKET'),
+                                                    0.0
+                                                ) or tp_price
                                                     
-                                                    # If no TP found, calculate default
-                                                    if tp_price == 0:
-                                                        tp_pct, _ = _calculate_symbol_specific_tp_sl(symbol, entry_price)
-                                                        if is_long:
-                                                            tp_price = entry_price * (1 + tp_pct / 100)
-                                                        else:
-                                                            tp_price = entry_price * (1 - tp_pct / 100)
-                                                    
-                                                    # Update SL to breakeven
-                                                    place_take_profit_and_stop_loss(
-                                                        client, symbol, 
-                                                        "buy" if is_long else "sell",
-                                                        remaining_qty,
-                                                        tp_price,
-                                                        breakeven_sl,
-                                                        agent_id="live_monitor",
-                                                        leverage=current_pos.get('leverage', 1)
-                                                    )
-                                                    logger.info(f"✅ [LiveMonitor] SL moved to breakeven for {symbol} remainder")
+                                                # Update SL to breakeven
+                                                place_take_profit_and_stop_loss(
+                                                    client, symbol, 
+                                                    "buy" if is_long else "sell",
+                                                    remaining_qty,
+                                                    breakeven_tp,
+                                                    breakeven_sl,
+                                                    agent_id="live_monitor",
+                                                    leverage=leverage
+                                                )
+                                                logger.info("✅ [LiveMonitor] SL moved to breakeven for %s remainder", symbol)
                                         except Exception as sl_update_error:
-                                            logger.warning(f"⚠️ [LiveMonitor] Failed to update SL to breakeven: {sl_update_error}")
+                                            logger.warning("⚠️ [LiveMonitor] Failed to update SL to breakeven: %s", sl_update_error)
                                         
                                         # Send Telegram notification (reduced frequency - only on significant events)
                                         if TELEGRAM_ENABLED and roi_pct >= 0.5:  # Only notify for larger profits
@@ -850,57 +1200,27 @@ def live_monitor_loop(interval=3):
                                                 f"ROI: {roi_pct:+.2f}%\n"
                                                 f"Partial PnL: ${partial_pnl:+.2f}"
                                             )
-                                            send_message(telegram_msg)
+                                            _run_in_background(send_message, telegram_msg)
                                     else:
-                                        logger.warning(f"⚠️ [LiveMonitor] Partial close failed for {symbol}: {partial_result.get('message')}")
+                                        logger.warning("⚠️ [LiveMonitor] Partial close failed for %s: %s", symbol, partial_result.get('message'))
                                         
                                 except Exception as e:
-                                    logger.error(f"❌ [LiveMonitor] Exception during partial close for {symbol}: {e}")
+                                    logger.error("❌ [LiveMonitor] Exception during partial close for %s: %s", symbol, e)
                     except Exception as e:
-                        logger.warning(f"⚠️ [LiveMonitor] Error checking position for partial close on {symbol}: {e}")
-                
-                # Reset partial close tracking if position is fully closed (check if position exists)
-                if symbol in _partial_close_executed:
-                    try:
-                        current_positions = client.futures_position_information(symbol=symbol)
-                        has_position = False
-                        for pos in current_positions:
-                            if pos.get("symbol") == symbol:
-                                pos_amt = float(pos.get("positionAmt", 0))
-                                if abs(pos_amt) > 0:
-                                    has_position = True
-                                    break
-                        # If position is fully closed, reset tracking
-                        if not has_position:
-                            del _partial_close_executed[symbol]
-                            logger.debug(f"[LiveMonitor] Reset partial close tracking for {symbol} (position closed)")
-                    except Exception:
-                        pass  # If error checking, keep tracking as-is
+                        logger.warning("⚠️ [LiveMonitor] Error checking position for partial close on %s: %s", symbol, e)
                 
                 # Check if TP/SL levels are hit (full close)
                 should_close = False
                 close_reason = ""
                 
-                if is_long:
-                    # Long position: TP when price goes up, SL when price goes down
-                    if mark_price >= tp_price:
-                        should_close = True
-                        close_reason = "TP"
-                        logger.info(f"✅ [LiveMonitor] Take Profit hit → closing {symbol} position")
-                    elif mark_price <= sl_price:
-                        should_close = True
-                        close_reason = "SL"
-                        logger.info(f"✅ [LiveMonitor] Stop Loss hit → closing {symbol} position")
-                else:
-                    # Short position: TP when price goes down, SL when price goes up
-                    if mark_price <= tp_price:
-                        should_close = True
-                        close_reason = "TP"
-                        logger.info(f"✅ [LiveMonitor] Take Profit hit → closing {symbol} position")
-                    elif mark_price >= sl_price:
-                        should_close = True
-                        close_reason = "SL"
-                        logger.info(f"✅ [LiveMonitor] Stop Loss hit → closing {symbol} position")
+                if hit_tp_arr[i]:
+                    should_close = True
+                    close_reason = "TP"
+                    logger.info("✅ [LiveMonitor] Take Profit hit → closing %s position", symbol)
+                elif hit_sl_arr[i]:
+                    should_close = True
+                    close_reason = "SL"
+                    logger.info("✅ [LiveMonitor] Stop Loss hit → closing %s position", symbol)
                 
                 # Execute close if triggered
                 if should_close:
@@ -922,30 +1242,29 @@ def live_monitor_loop(interval=3):
                             # Log to CSV
                             original_side = "buy" if is_long else "sell"
                             pnl_pct = ((exit_price - entry_price) / entry_price * 100) if is_long else ((entry_price - exit_price) / entry_price * 100)
-                            _append_trade_close(symbol, original_side, qty, entry_price, exit_price, close_reason)
+                            _append_trade_close(symbol, original_side, qty, entry_price, exit_price, close_reason,
+                                                pnl=pnl, pnl_pct=pnl_pct)
                             
-                            # FEEDBACK LOOP: Update learning memory from CSV logs
-                            try:
-                                update_learning_from_csv_logs(
-                                    symbol=symbol,
-                                    entry_price=entry_price,
-                                    exit_price=exit_price,
-                                    pnl=pnl,
-                                    pnl_pct=pnl_pct,
-                                    exit_reason=close_reason.replace("TP", "TAKE_PROFIT").replace("SL", "STOP_LOSS"),
-                                    agent_id="system",  # Default, can be enhanced
-                                    strategy_used="unknown"
-                                )
-                            except Exception as e:
-                                logger.warning(f"Failed to update learning from CSV logs: {e}")
+                            # FEEDBACK LOOP: Update learning memory from CSV logs (off the monitor thread)
+                            _run_in_background(
+                                update_learning_from_csv_logs,
+                                symbol=symbol,
+                                entry_price=entry_price,
+                                exit_price=exit_price,
+                                pnl=pnl,
+                                pnl_pct=pnl_pct,
+                                exit_reason=close_reason.replace("TP", "TAKE_PROFIT").replace("SL", "STOP_LOSS"),
+                                agent_id="system",  # Default, can be enhanced
+                                strategy_used="unknown"
+                            )
                             
                             # Clear partial close tracking when position is fully closed
-                            if symbol in _partial_close_executed:
-                                del _partial_close_executed[symbol]
+                            _partial_close_executed.discard(symbol)
+                            market_stream.clear_tpsl_trigger(symbol)
                             
                             logger.info(
-                                f"✅ [LiveMonitor] Position closed: {symbol} {close_reason} "
-                                f"PnL: {pnl:+.2f} USDT"
+                                "✅ [LiveMonitor] Position closed: %s %s PnL: %+.2f USDT",
+                                symbol, close_reason, pnl
                             )
                             
                             # Send Telegram notification for closed position
@@ -959,34 +1278,59 @@ def live_monitor_loop(interval=3):
                                     f"Exit: ${exit_price:.2f}\n"
                                     f"PnL: ${pnl:+.2f}"
                                 )
-                                send_message(telegram_msg)
+                                _run_in_background(send_message, telegram_msg)
                         else:
                             error_msg = f"{symbol}: Close failed - {result.get('message')}"
-                            logger.error(f"❌ [LiveMonitor] {error_msg}")
+                            logger.error("❌ [LiveMonitor] %s", error_msg)
                             
                     except Exception as e:
                         error_msg = f"{symbol}: Exception during close - {str(e)}"
-                        logger.error(f"❌ [LiveMonitor] {error_msg}")
+                        logger.error("❌ [LiveMonitor] %s", error_msg)
             
-            # Sleep for specified interval before next check
-            time.sleep(interval)
+            # Reset partial close tracking for positions that are no longer open
+            for symbol in _partial_close_executed - open_symbols:
+                _partial_close_executed.discard(symbol)
+                logger.debug("[LiveMonitor] Reset partial close tracking for %s (position closed)", symbol)
+            for symbol in _last_roi_logs.keys() - open_symbols:
+                del _last_roi_logs[symbol]
+            
+            # Wait for the next deadline, or less if a stream event needs a pass now
+            now = time.monotonic()
+            if now - next_tick > interval:
+                logger.warning("⚠️ [LiveMonitor] Pass overran by %.1fs, skipping missed ticks", now - next_tick)
+                next_tick = now + interval
+            wait_sec = max(0.0, next_tick - now)
+            if streaming:
+                woken = market_stream.wait_for_event(wait_sec)
+            elif _live_monitor_stop.wait(wait_sec):
+                break
+            else:
+                woken = False
+            if not woken:
+                next_tick += interval  # An early, event-driven pass keeps the current deadline
             
         except Exception as e:
-            logger.error(f"❌ [LiveMonitor] Exception in loop: {e}")
-            time.sleep(interval)  # Continue running even if there's an error
+            logger.error("❌ [LiveMonitor] Exception in loop: %s", e)
+            _live_monitor_stop.wait(interval)  # Continue running even if there's an error
+            next_tick = time.monotonic() + interval
 
 
-def start_live_monitor(interval=3):
+def start_live_monitor(interval=None):
     """
     Start the live monitor thread for instant TP/SL reactions.
+    
+    Args:
+        interval: Seconds between passes (default LIVE_MONITOR_INTERVAL env, 5s)
     """
-    global _live_monitor_thread, _live_monitor_running
+    global _live_monitor_thread
     
-    if '_live_monitor_thread' in globals() and _live_monitor_thread is not None and _live_monitor_thread.is_alive():
+    if _live_monitor_thread is not None and _live_monitor_thread.is_alive():
         logger.info("🔄 [LiveMonitor] Thread already running")
         return _live_monitor_thread
     
-    _live_monitor_running = True
+    if interval is None:
+        interval = LIVE_MONITOR_INTERVAL
+    _live_monitor_stop.clear()
     _live_monitor_thread = threading.Thread(target=live_monitor_loop, args=(interval,), daemon=True)
     _live_monitor_thread.start()
     logger.info("✅ [LiveMonitor] Thread started successfully")
@@ -997,10 +1341,11 @@ def stop_live_monitor():
     """
     Stop the live monitor thread gracefully.
     """
-    global _live_monitor_running, _live_monitor_thread
+    global _live_monitor_thread
     
-    if '_live_monitor_thread' in globals() and _live_monitor_thread is not None and _live_monitor_thread.is_alive():
-        _live_monitor_running = False
+    if _live_monitor_thread is not None and _live_monitor_thread.is_alive():
+        _live_monitor_stop.set()
+        market_stream.stop_streams()  # Also wakes a loop blocked on stream events
         _live_monitor_thread.join(timeout=5)  # Wait up to 5 seconds for thread to finish
         logger.info("🛑 [LiveMonitor] Thread stopped")
     else:
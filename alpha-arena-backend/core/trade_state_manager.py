@@ -6,17 +6,33 @@ Prevents duplicate TP/SL orders and multiple exit attempts.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, Optional, Set
-from collections import defaultdict
+from typing import Dict, Optional, Tuple
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Lock striping: the live monitor, trade manager workers and SentinelAgent all
+# update these maps. Each symbol maps to one of _STRIPES locks so the
+# check-then-update sequences below are atomic per symbol without serializing
+# unrelated symbols.
+_STRIPES = 16  # must be a power of two
+_stripe_locks = [threading.Lock() for _ in range(_STRIPES)]
+
+
+def _lock_for(symbol: str) -> threading.Lock:
+    """Return the stripe lock owning a symbol."""
+    return _stripe_locks[hash(symbol) & (_STRIPES - 1)]
+
 # Trade state machine: {symbol: "OPEN" | "MONITORING" | "CLOSING" | "CLOSED"}
 _trade_states: Dict[str, str] = {}
 
-# Track TP/SL order IDs per symbol to prevent duplicates (hash-based deduplication)
-_tpsl_order_hashes: Dict[str, Set[str]] = defaultdict(set)  # {symbol: {hash1, hash2, ...}}
+# Track TP/SL order hashes to prevent duplicates (hash-based deduplication).
+# Bounded LRU so symbols that never reach clear_tpsl_hashes() can't grow it forever.
+TPSL_HASH_CACHE_SIZE = 4096
+_tpsl_order_hashes: "OrderedDict[Tuple[str, int], bool]" = OrderedDict()  # {(symbol, hash): True}
+_tpsl_lock = threading.Lock()
 
 # Track last exit attempt per symbol (prevents multiple close attempts)
 _last_exit_attempt: Dict[str, float] = {}
@@ -31,16 +47,11 @@ def get_trade_state(symbol: str) -> str:
 def set_trade_state(symbol: str, state: str):
     """Set trade state (OPEN, MONITORING, CLOSING, CLOSED)"""
     _trade_states[symbol] = state
-    logger.debug(f"[TradeState] {symbol}: {state}")
+    logger.debug("[TradeState] %s: %s", symbol, state)
 
 
-def is_exit_allowed(symbol: str) -> bool:
-    """
-    Check if exit is allowed (not in cooldown, not already closing)
-    
-    Returns:
-        True if exit allowed, False if in debounce or already closing
-    """
+def _exit_allowed_locked(symbol: str) -> bool:
+    """Exit check body. Caller must hold the symbol's stripe lock."""
     current_state = get_trade_state(symbol)
     
     # Can't exit if already closing or closed
@@ -57,21 +68,51 @@ def is_exit_allowed(symbol: str) -> bool:
     return True
 
 
+def is_exit_allowed(symbol: str) -> bool:
+    """
+    Check if exit is allowed (not in cooldown, not already closing)
+    
+    Returns:
+        True if exit allowed, False if in debounce or already closing
+    """
+    with _lock_for(symbol):
+        return _exit_allowed_locked(symbol)
+
+
 def record_exit_attempt(symbol: str):
     """Record that an exit attempt was made"""
-    _last_exit_attempt[symbol] = time.time()
-    set_trade_state(symbol, "CLOSING")
+    with _lock_for(symbol):
+        _last_exit_attempt[symbol] = time.time()
+        set_trade_state(symbol, "CLOSING")
+
+
+def try_begin_exit(symbol: str) -> bool:
+    """
+    Atomically check that an exit is allowed and record the attempt.
+    
+    Use instead of is_exit_allowed() + record_exit_attempt() when several
+    threads may try to close the same symbol.
+    
+    Returns:
+        True if this caller owns the exit, False if blocked
+    """
+    with _lock_for(symbol):
+        if not _exit_allowed_locked(symbol):
+            return False
+        _last_exit_attempt[symbol] = time.time()
+        set_trade_state(symbol, "CLOSING")
+        return True
 
 
 def record_exit_complete(symbol: str):
     """Record that exit is complete"""
-    set_trade_state(symbol, "CLOSED")
-    # Clean up after 1 hour
-    if symbol in _last_exit_attempt:
-        del _last_exit_attempt[symbol]
+    with _lock_for(symbol):
+        set_trade_state(symbol, "CLOSED")
+        # Debounce entry is no longer needed once the exit is done
+        _last_exit_attempt.pop(symbol, None)
 
 
-def generate_tpsl_hash(symbol: str, side: str, tp_price: float, sl_price: float) -> str:
+def generate_tpsl_hash(symbol: str, side: str, tp_price: float, sl_price: float) -> int:
     """
     Generate hash for TP/SL order pair to detect duplicates
     
@@ -82,47 +123,55 @@ def generate_tpsl_hash(symbol: str, side: str, tp_price: float, sl_price: float)
         sl_price: Stop loss price
     
     Returns:
-        Hash string for deduplication
+        Integer hash for deduplication (stable within the process only)
     """
     # Round prices to 2 decimal places for hash stability
-    tp_rounded = round(tp_price, 2)
-    sl_rounded = round(sl_price, 2)
-    
-    # Create hash from symbol + side + prices
-    hash_str = f"{symbol}_{side}_{tp_rounded}_{sl_rounded}"
-    return hash_str
+    return hash((symbol, side, round(tp_price, 2), round(sl_price, 2)))
 
 
-def is_tpsl_duplicate(symbol: str, hash_str: str) -> bool:
+def is_tpsl_duplicate(symbol: str, tpsl_hash: int) -> bool:
     """
     Check if TP/SL order pair is duplicate
     
     Returns:
         True if duplicate, False if new
     """
-    if hash_str in _tpsl_order_hashes[symbol]:
-        logger.debug(f"[TPSL Dedupe] Duplicate TP/SL detected for {symbol}: {hash_str}")
-        return True
-    return False
+    key = (symbol, tpsl_hash)
+    with _tpsl_lock:
+        if key not in _tpsl_order_hashes:
+            return False
+        _tpsl_order_hashes.move_to_end(key)
+    logger.debug("[TPSL Dedupe] Duplicate TP/SL detected for %s: %x", symbol, tpsl_hash)
+    return True
 
 
-def register_tpsl_order(symbol: str, hash_str: str):
+def register_tpsl_order(symbol: str, tpsl_hash: int):
     """Register TP/SL order hash to prevent duplicates"""
-    _tpsl_order_hashes[symbol].add(hash_str)
-    logger.debug(f"[TPSL Dedupe] Registered TP/SL for {symbol}: {hash_str}")
+    key = (symbol, tpsl_hash)
+    with _tpsl_lock:
+        _tpsl_order_hashes[key] = True
+        _tpsl_order_hashes.move_to_end(key)
+        while len(_tpsl_order_hashes) > TPSL_HASH_CACHE_SIZE:
+            _tpsl_order_hashes.popitem(last=False)
+    logger.debug("[TPSL Dedupe] Registered TP/SL for %s: %x", symbol, tpsl_hash)
+
+
+def _drop_tpsl_hashes(symbol: str):
+    """Remove every cached hash for a symbol."""
+    with _tpsl_lock:
+        for key in [k for k in _tpsl_order_hashes if k[0] == symbol]:
+            del _tpsl_order_hashes[key]
 
 
 def clear_tpsl_hashes(symbol: str):
     """Clear TP/SL hashes when position is fully closed"""
-    if symbol in _tpsl_order_hashes:
-        del _tpsl_order_hashes[symbol]
+    _drop_tpsl_hashes(symbol)
 
 
 def reset_trade_state(symbol: str):
     """Reset trade state (for new positions)"""
-    if symbol in _trade_states:
-        del _trade_states[symbol]
-    clear_tpsl_hashes(symbol)
-    if symbol in _last_exit_attempt:
-        del _last_exit_attempt[symbol]
+    with _lock_for(symbol):
+        _trade_states.pop(symbol, None)
+        _last_exit_attempt.pop(symbol, None)
+    _drop_tpsl_hashes(symbol)
 
@@ -5,9 +5,11 @@ Uses centralized binance_client module for testnet/mainnet switching.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import time
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
@@ -23,10 +25,28 @@ from core.binance_client import (
     get_full_balance,
     place_order as binance_place_order
 )
+from core import market_stream
+from core.data_engine import fetch_ohlcv
+
+# Every REST call here backs off on 429/418 and fails fast while its endpoint is down
+from core.binance_error_handler import guarded_call
 
 # Initialize logging
 logger = logging.getLogger("trading")
 
+# Max concurrent requests for account-wide operations (close-all pricing, cancel-all)
+CLOSE_ALL_MAX_WORKERS = 8
+
+# Numeric position fields returned as floats by get_account_summary (Binance sends strings)
+_POSITION_NUM_FIELDS = (
+    'positionAmt', 'entryPrice', 'markPrice', 'unrealizedProfit', 'unRealizedProfit',
+    'leverage', 'notional', 'initialMargin',
+)
+
+# Overlaps get_account_summary's open-orders request with its account request;
+# shared so each call doesn't start and join a thread of its own
+_account_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="account-summary")
+
 # LAZY INITIALIZATION: Don't initialize clients at module import time
 # This prevents blocking hangs when the module is imported
 _client_manager = None
@@ -52,11 +72,20 @@ def _get_futures():
             if _futures_client is None:
                 logger.warning("[LazyInit] Futures client is None after initialization")
         except Exception as e:
-            logger.error(f"[LazyInit] Error initializing futures client: {e}")
+            logger.error("[LazyInit] Error initializing futures client: %s", e)
             import traceback
             logger.error(traceback.format_exc())
     return _futures_client
 
+@lru_cache(maxsize=64)
+def _bn_sym(symbol: str) -> str:
+    """
+    Convert symbol format: BNB/USDT -> BNBUSDT (same normalization as order_manager).
+    
+    Memoized, so after the first call per symbol this is a table lookup.
+    """
+    return symbol.replace("/", "").upper()
+
 def _get_data():
     """Lazy getter for data client"""
     global _data_client
@@ -106,20 +135,22 @@ def place_futures_order(
         return {"error": "Futures client not initialized"}
     
     try:
-        # Convert symbol format: BNB/USDT -> BNBUSDT
-        binance_symbol = symbol.replace("/", "")
+        binance_symbol = _bn_sym(symbol)
         
         # Use the helper function from binance_client
-        order = binance_place_order(
+        order = guarded_call(
+            "order",
+            binance_place_order,
             client=futures_client,
             symbol=binance_symbol,
             side=side,
             quantity=amount,
             order_type="MARKET",
-            leverage=leverage
+            leverage=leverage,
+            reduce_only=reduce_only
         )
         
-        logger.info(f"✅ Futures {side.upper()} order executed: {amount} {symbol} @ {order.get('price', 'N/A')}")
+        logger.info("✅ Futures %s order executed: %s %s @ %s", side.upper(), amount, symbol, order.get('price', 'N/A'))
         return order
         
     except BinanceAPIException as e:
@@ -151,7 +182,10 @@ def close_futures_position(
 
 def get_futures_position(symbol: str) -> Optional[Dict[str, Any]]:
     """
-    Get current futures position for a symbol using python-binance.
+    Get current futures position for a symbol.
+    
+    Served from the user-data stream mirror when the market stream is running,
+    otherwise from python-binance REST.
     
     Args:
         symbol: Trading pair (e.g., 'BNB/USDT')
@@ -159,23 +193,22 @@ def get_futures_position(symbol: str) -> Optional[Dict[str, Any]]:
     Returns:
         Position info or None if no position
     """
+    binance_symbol = _bn_sym(symbol)
+    mirrored = market_stream.get_positions()
+    if mirrored is not None:
+        return next((pos for pos in mirrored if pos.get('symbol') == binance_symbol), None)
+    
     futures_client = _get_futures()
     if not futures_client:
         return None
     
     try:
-        # Convert symbol format: BNB/USDT -> BNBUSDT
-        binance_symbol = symbol.replace("/", "")
-        
         # Get position information
-        positions = futures_client.futures_position_information(symbol=binance_symbol)
+        positions = guarded_call("position", futures_client.futures_position_information, symbol=binance_symbol)
         
-        for pos in positions:
-            if float(pos.get('positionAmt', 0)) != 0:
-                return pos
-        return None
+        return next((pos for pos in positions if float(pos.get('positionAmt', 0)) != 0), None)
     except Exception as e:
-        logger.error(f"Error fetching position: {e}")
+        logger.error("Error fetching position: %s", e)
         return None
 
 def get_futures_balance() -> Dict[str, Any]:
@@ -194,7 +227,7 @@ def get_futures_balance() -> Dict[str, Any]:
         # Use the helper function
         return get_full_balance(futures_client)
     except Exception as e:
-        logger.error(f"Error fetching balance: {e}")
+        logger.error("Error fetching balance: %s", e)
         return {"free": 0.0, "used": 0.0, "total": 0.0}
 
 def test_connections() -> Dict[str, Any]:
@@ -211,18 +244,18 @@ def test_connections() -> Dict[str, Any]:
     try:
         logger.debug("[TestConnection] Initializing futures client...")
         futures_client = _get_futures()
-        logger.debug(f"[TestConnection] Futures client result: {futures_client is not None}")
+        logger.debug("[TestConnection] Futures client result: %s", futures_client is not None)
         
         if futures_client:
             try:
                 # Test price fetch
                 logger.debug("[TestConnection] Testing price fetch...")
-                ticker = futures_client.futures_symbol_ticker(symbol="BTCUSDT")
+                ticker = guarded_call("market", futures_client.futures_symbol_ticker, symbol="BTCUSDT")
                 price = float(ticker['price'])
                 results["data_connection"] = True
                 results["futures_connection"] = True
                 results["trading_connection"] = True
-                logger.info(f"✅ Binance Futures client OK - BTC/USDT: {price}")
+                logger.info("✅ Binance Futures client OK - BTC/USDT: %s", price)
             except Exception as e:
                 error = f"Futures client failed: {e}"
                 results["errors"].append(error)
@@ -251,28 +284,27 @@ def get_account_summary(account_type: str = "futures") -> Dict[str, Any]:
             logger.error(error_msg)
             return {"error": error_msg}
         
-        # Get balance
-        balance_info = get_futures_balance()
-        
-        # Get account info for positions
-        account = futures_client.futures_account()
+        # Open orders and the account snapshot are independent - fetch them together.
+        # The account snapshot already carries the balances (no separate balance request).
+        orders_future = _account_executor.submit(guarded_call, "account", futures_client.futures_get_open_orders)
+        account = guarded_call("account", futures_client.futures_account)
+        open_orders = orders_future.result()
         
-        # Get open positions
-        positions = []
-        for pos in account.get('positions', []):
-            if float(pos.get('positionAmt', 0)) != 0:
-                positions.append(pos)
+        usdt = next((a for a in account.get('assets', []) if a.get('asset') == 'USDT'), {})
         
-        # Get open orders
-        open_orders = futures_client.futures_get_open_orders()
+        # Get open positions, with numeric fields parsed once here instead of by every consumer
+        positions = [
+            {**pos, **{k: float(pos[k]) for k in _POSITION_NUM_FIELDS if k in pos}}
+            for pos in account.get('positions', ()) if float(pos.get('positionAmt', 0)) != 0
+        ]
         
         return {
-            'total_balance': balance_info.get('total', 0),
-            'free_balance': balance_info.get('free', 0),
-            'used_balance': balance_info.get('used', 0),
+            'total_balance': float(usdt.get('walletBalance', 0)),
+            'free_balance': float(account.get('availableBalance', 0)),
+            'used_balance': float(account.get('totalInitialMargin', 0)),
             'open_positions': positions,
             'open_orders': open_orders,
-            'timestamp': int(time.time() * 1000)
+            'timestamp': time.time_ns() // 1_000_000
         }
         
     except Exception as e:
@@ -280,7 +312,7 @@ def get_account_summary(account_type: str = "futures") -> Dict[str, Any]:
         logger.error(error_msg)
         return {"error": error_msg}
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """Container for order execution results"""
     success: bool
@@ -294,13 +326,13 @@ class OrderResult:
     status: Optional[str] = None
     fee: Optional[Dict[str, float]] = None
     error: Optional[str] = None
-    timestamp: float = 0.0  # Will be set in __post_init__
+    timestamp: int = 0  # Epoch millis, set in __post_init__
 
     def __post_init__(self):
-        self.timestamp = time.time()
+        self.timestamp = time.time_ns() // 1_000_000
 
     def to_dict(self) -> Dict[str, Any]:
-        return {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        return asdict(self)
 
 def choose_trade_client(account_type: str = "futures") -> Optional[Client]:
     """
@@ -317,25 +349,34 @@ def get_trade_client(account_type: str = "futures") -> Optional[Client]:
     return _get_futures()
 
 def fetch_public_ticker(symbol: str) -> Dict[str, Any]:
-    """Fetch ticker data from the data client using python-binance."""
+    """Fetch ticker data from the market stream, or the data client using python-binance."""
     try:
+        binance_symbol = _bn_sym(symbol)
+        
+        # Streamed last price when the market stream is running (no request)
+        streamed = market_stream.get_last_price(binance_symbol)
+        if streamed is not None:
+            price, event_time = streamed
+            return {
+                'symbol': symbol,
+                'last': price,
+                'timestamp': int(event_time or time.time_ns() // 1_000_000)
+            }
+        
         data_client = _get_data()
         if not data_client:
             raise Exception("Data client not initialized")
         
-        # Convert symbol format: BTC/USDT -> BTCUSDT
-        binance_symbol = symbol.replace("/", "")
-        
-        ticker = data_client.futures_symbol_ticker(symbol=binance_symbol)
+        ticker = guarded_call("market", data_client.futures_symbol_ticker, symbol=binance_symbol)
         
         # Convert to standard format
         return {
             'symbol': symbol,
             'last': float(ticker['price']),
-            'timestamp': int(ticker.get('time', time.time() * 1000))
+            'timestamp': int(ticker.get('time') or time.time_ns() // 1_000_000)
         }
     except Exception as e:
-        logger.error(f"Failed to fetch ticker for {symbol}: {e}")
+        logger.error("Failed to fetch ticker for %s: %s", symbol, e)
         raise
 
 def execute_trade(
@@ -368,11 +409,12 @@ def execute_trade(
         if not client:
             return OrderResult(success=False, error="Trading client not initialized")
         
-        # Convert symbol format
-        binance_symbol = symbol.replace("/", "")
+        binance_symbol = _bn_sym(symbol)
         
         # Place order using helper function
-        order = binance_place_order(
+        order = guarded_call(
+            "order",
+            binance_place_order,
             client=client,
             symbol=binance_symbol,
             side=side,
@@ -416,20 +458,24 @@ def cancel_all_orders(symbol: Optional[str] = None, account_type: str = "futures
             return {"error": "Trading client not initialized"}
         
         if symbol:
-            binance_symbol = symbol.replace("/", "")
-            client.futures_cancel_all_open_orders(symbol=binance_symbol)
+            binance_symbol = _bn_sym(symbol)
+            guarded_call("cancel", client.futures_cancel_all_open_orders, symbol=binance_symbol)
             return {"status": f"Cancelled all orders for {symbol}"}
         else:
-            # Cancel all orders for all symbols
-            open_orders = client.futures_get_open_orders()
-            for order in open_orders:
+            # Cancel all orders for all symbols: one cancel-all per symbol that
+            # has orders, in parallel (bounded by the order bulkhead)
+            open_orders = guarded_call("account", client.futures_get_open_orders)
+            symbols = list({order['symbol'] for order in open_orders})
+            
+            def cancel_symbol(binance_symbol):
                 try:
-                    client.futures_cancel_order(
-                        symbol=order['symbol'],
-                        orderId=order['orderId']
-                    )
+                    guarded_call("cancel", client.futures_cancel_all_open_orders, symbol=binance_symbol)
                 except Exception as e:
-                    logger.warning(f"Failed to cancel order {order['orderId']}: {e}")
+                    logger.warning("Failed to cancel orders for %s: %s", binance_symbol, e)
+            
+            if symbols:
+                with ThreadPoolExecutor(max_workers=min(CLOSE_ALL_MAX_WORKERS, len(symbols))) as pool:
+                    list(pool.map(cancel_symbol, symbols))
             return {"status": "Cancelled all open orders"}
             
     except Exception as e:
@@ -437,6 +483,49 @@ def cancel_all_orders(symbol: Optional[str] = None, account_type: str = "futures
         logger.error(error_msg)
         return {"error": error_msg}
 
+def _fetch_last_close(symbol: str):
+    """Last 1m close for a symbol, None if no candle, or the fetch exception"""
+    try:
+        df = fetch_ohlcv(symbol, timeframe="1m", limit=1)
+    except Exception as e:
+        return e
+    if df.empty:
+        return None
+    return df['c'].iloc[-1]
+
+def _fetch_ticker_prices() -> Dict[str, float]:
+    """Last price of every futures symbol in one request ({} on failure)"""
+    try:
+        data_client = _get_data()
+        if not data_client:
+            return {}
+        return {t['symbol']: float(t['price']) for t in guarded_call("market", data_client.futures_symbol_ticker)}
+    except Exception as e:
+        logger.warning("Failed to fetch batch ticker prices: %s", e)
+        return {}
+
+def _fetch_close_prices(symbols) -> Dict[str, Any]:
+    """
+    Last prices for several symbols: one all-symbol ticker request, then
+    concurrent OHLCV lookups (see _fetch_last_close) for anything it missed
+    """
+    symbols = list(symbols)
+    if not symbols:
+        return {}
+    tickers = _fetch_ticker_prices()
+    prices = {}
+    missing = []
+    for symbol in symbols:
+        price = tickers.get(_bn_sym(symbol))
+        if price:
+            prices[symbol] = price
+        else:
+            missing.append(symbol)
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(CLOSE_ALL_MAX_WORKERS, len(missing))) as pool:
+            prices.update(zip(missing, pool.map(_fetch_last_close, missing)))
+    return prices
+
 def close_all_positions(portfolios: Dict, account_type: str = "futures") -> Dict[str, Any]:
     """Close all open positions across all portfolios safely.
     
@@ -447,8 +536,6 @@ def close_all_positions(portfolios: Dict, account_type: str = "futures") -> Dict
     Returns:
         Summary of closed positions
     """
-    from core.data_engine import fetch_ohlcv
-    
     summary = {
         "total_positions_closed": 0,
         "total_pnl": 0.0,
@@ -456,6 +543,14 @@ def close_all_positions(portfolios: Dict, account_type: str = "futures") -> Dict
     }
     
     try:
+        # Price every open symbol up front - closing itself is local
+        # portfolio bookkeeping
+        prices = _fetch_close_prices({
+            symbol
+            for portfolio in portfolios.values()
+            for symbol in portfolio.get_open_positions()
+        })
+        
         for agent_id, portfolio in portfolios.items():
             agent_summary = {
                 "positions_closed": 0,
@@ -468,17 +563,17 @@ def close_all_positions(portfolios: Dict, account_type: str = "futures") -> Dict
             if not open_positions:
                 continue
                 
-            print(f"\n🛡️  [{agent_id}] Closing {len(open_positions)} open position(s)...")
+            logger.info("🛡️  [%s] Closing %d open position(s)...", agent_id, len(open_positions))
             
             for symbol, position in list(open_positions.items()):
                 try:
-                    # Fetch current price
-                    df = fetch_ohlcv(symbol, timeframe="1m", limit=1)
-                    if df.empty:
-                        logger.warning(f"Could not fetch price for {symbol}, using entry price")
+                    # Current price fetched above
+                    current_price = prices.get(symbol)
+                    if isinstance(current_price, Exception):
+                        raise current_price
+                    if current_price is None:
+                        logger.warning("Could not fetch price for %s, using entry price", symbol)
                         current_price = position.entry_price
-                    else:
-                        current_price = df['c'].iloc[-1]
                     
                     # Close position in portfolio
                     result = portfolio.close_position(symbol, current_price)
@@ -495,20 +590,25 @@ def close_all_positions(portfolios: Dict, account_type: str = "futures") -> Dict
                         })
                         
                         emoji = "🟢" if pnl > 0 else "🔴"
-                        print(f"  {emoji} {symbol}: {position.side.upper()} closed | PnL: {pnl:+.2f} ({pnl_pct:+.2f}%)")
+                        logger.info(
+                            "  %s %s: %s closed | PnL: %+.2f (%+.2f%%)",
+                            emoji, symbol, position.side.upper(), pnl, pnl_pct
+                        )
                         
                 except Exception as e:
-                    logger.error(f"Error closing position {symbol} for {agent_id}: {e}")
-                    print(f"  ⚠️  Failed to close {symbol}: {e}")
+                    logger.error("  ⚠️  Failed to close %s for %s: %s", symbol, agent_id, e)
             
             summary["total_positions_closed"] += agent_summary["positions_closed"]
             summary["total_pnl"] += agent_summary["total_pnl"]
             summary["agents"][agent_id] = agent_summary
             
-            print(f"  ✅ [{agent_id}] Closed {agent_summary['positions_closed']} positions | Total PnL: {agent_summary['total_pnl']:+.2f}")
+            logger.info(
+                "  ✅ [%s] Closed %d positions | Total PnL: %+.2f",
+                agent_id, agent_summary["positions_closed"], agent_summary["total_pnl"]
+            )
         
         return summary
         
     except Exception as e:
-        logger.error(f"Error in close_all_positions: {e}", exc_info=True)
+        logger.error("Error in close_all_positions: %s", e, exc_info=True)
         return {"error": str(e)}
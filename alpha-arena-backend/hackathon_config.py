@@ -3,10 +3,14 @@ Kushal Hackathon Configuration
 Central config for the trading competition
 """
 import os
+import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger("config")
+
 # Competition Parameters
 CAPITAL = float(os.getenv("STARTING_CAPITAL", 10000))
 MAX_LEVERAGE = 5
@@ -50,6 +54,11 @@ def load_symbols():
     Returns:
         list: Filtered list of allowed trading pairs (e.g., ["BTC/USDT", "BNB/USDT"])
     """
+    # Parsed once per process - the environment doesn't change at runtime
+    return list(_load_symbols_cached())
+
+@lru_cache(maxsize=1)
+def _load_symbols_cached():
     symbols_str = os.getenv("SYMBOLS", "")
     allowed_str = os.getenv("ALLOWED_SYMBOLS", "")
 
@@ -57,26 +66,22 @@ def load_symbols():
     env_symbols = [s.strip() for s in symbols_str.split(",") if s.strip()]
     
     # Parse ALLOWED_SYMBOLS from .env (normalize to non-slash format)
-    allowed_symbols = [s.strip().upper() for s in allowed_str.split(",") if s.strip()]
-
-    # Filter symbols: only include if in ALLOWED_SYMBOLS
-    filtered = []
-    for sym in env_symbols:
-        # Normalize symbol for comparison (remove slash)
-        clean = sym.replace("/", "").upper()
-        if clean in allowed_symbols:
-            filtered.append(sym)
-        else:
-            print(f"⏩ Skipping {sym} (not in ALLOWED_SYMBOLS)")
+    allowed_symbols = frozenset(s.strip().upper() for s in allowed_str.split(",") if s.strip())
+
+    # Filter symbols: only include if in ALLOWED_SYMBOLS (compared without the slash)
+    filtered = [sym for sym in env_symbols if sym.replace("/", "").upper() in allowed_symbols]
+    skipped = [sym for sym in env_symbols if sym.replace("/", "").upper() not in allowed_symbols]
+    if skipped:
+        logger.info("⏩ Skipping %s (not in ALLOWED_SYMBOLS)", ", ".join(skipped))
 
     # Default to BTC/USDT if nothing valid found
     if not filtered:
-        print("⚠️  No valid symbols found in .env, defaulting to BTC/USDT")
+        logger.warning("⚠️  No valid symbols found in .env, defaulting to BTC/USDT")
         filtered = ["BTC/USDT"]
     else:
-        print(f"✅ Active trading symbols: {', '.join(filtered)}")
+        logger.info("✅ Active trading symbols: %s", ", ".join(filtered))
 
-    return filtered
+    return tuple(filtered)
 
 # Logging
 LOG_DIR = "logs"
@@ -9,9 +9,12 @@ import sys
 import time
 import signal
 import logging
+import logging.handlers
+import threading
+import queue
+import atexit
 import json
 from typing import Dict
-import importlib
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -24,19 +27,70 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from core.orchestrator import TradingOrchestrator
 from core.portfolio import Portfolio
 from core.trading_engine import close_all_positions
-from core.storage import init_db, log_equity
-from hackathon_config import CAPITAL, REFRESH_INTERVAL_SEC, load_symbols
+from core.storage import init_db, log_equity_bulk, stop_wal_checkpointer
+from core.csv_logger import force_flush_all
+from core.binance_client import get_connection_info, is_testnet_mode
+from core.symbol_lock import clear_all_locks_and_cooldowns
+from core.settings import settings
+from hackathon_config import CAPITAL, REFRESH_INTERVAL_SEC, AGENTS_CONFIG_DIR, load_symbols
+
+# Optional: orjson parses the agent config cache several times faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize logging
+# Records are formatted on the calling thread and written to file/stdout by a
+# background listener, so trading threads never block on console or disk I/O
+_log_queue = queue.SimpleQueue()
+# Per-cycle progress lines also go to their own rotating file
+_cycle_file_handler = logging.handlers.RotatingFileHandler(
+    "logs/cycle.log", maxBytes=5 * 1024 * 1024, backupCount=3
+)
+_cycle_file_handler.addFilter(logging.Filter("cycle"))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("logs/trading_bot.log"),
+    logging.StreamHandler(sys.stdout),
+    _cycle_file_handler
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/trading_bot.log"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger("main")
+cycle_logger = logging.getLogger("cycle")
+
+# Trading symbols from .env (SYMBOLS filtered by ALLOWED_SYMBOLS), resolved once per process
+ACTIVE_SYMBOLS = frozenset(load_symbols())
+
+# Monitor and shutdown hooks are imported up front - importing inside the signal
+# handler can block on the import lock held by a running thread, and the trading
+# loop shouldn't re-resolve them every cycle
+try:
+    from core.trade_manager import manage_open_positions, start_live_monitor, stop_live_monitor
+except ImportError as e:
+    logger.warning(f"Live monitor unavailable: {e}")
+    manage_open_positions = start_live_monitor = stop_live_monitor = None
+try:
+    from core.sentinel_agent import start_sentinel_agent, stop_sentinel_agent
+except ImportError as e:
+    logger.warning(f"Sentinel agent unavailable: {e}")
+    start_sentinel_agent = stop_sentinel_agent = None
+try:
+    from core.regime_engine import get_regime_analysis
+    from core.binance_error_handler import handle_binance_error
+    NEW_MODULES_ENABLED = True
+except ImportError as e:
+    logger.warning(f"⚠️ Failed to import new modules: {e}")
+    NEW_MODULES_ENABLED = False
+
+# Set by the first SIGINT/SIGTERM; repeated signals during shutdown are ignored
+_shutdown_requested = threading.Event()
 
 # Import Telegram notifier
 try:
@@ -52,11 +106,13 @@ except ImportError:
 # Graceful shutdown handler
 def signal_handler(sig, frame):
     """Handle Ctrl+C gracefully"""
+    if _shutdown_requested.is_set():
+        return  # Already shutting down
+    _shutdown_requested.set()
     print("\n\n🚨 Shutdown signal received...")
     
     # Force flush all CSV buffers before shutdown
     try:
-        from core.csv_logger import force_flush_all
         print("💾 Flushing CSV logs to disk...")
         force_flush_all()
         print("✅ CSV logs saved")
@@ -65,18 +121,24 @@ def signal_handler(sig, frame):
     
     # Stop the live monitor if it's running
     try:
-        from core.trade_manager import stop_live_monitor
-        stop_live_monitor()
+        if stop_live_monitor is not None:
+            stop_live_monitor()
     except Exception as e:
         logger.warning(f"Error stopping live monitor: {e}")
     
     # Stop the sentinel agent if it's running
     try:
-        from core.sentinel_agent import stop_sentinel_agent
-        stop_sentinel_agent()
+        if stop_sentinel_agent is not None:
+            stop_sentinel_agent()
     except Exception as e:
         logger.warning(f"Error stopping sentinel agent: {e}")
     
+    # Checkpoint and truncate the SQLite WAL before exiting
+    try:
+        stop_wal_checkpointer()
+    except Exception as e:
+        logger.warning(f"Error checkpointing database: {e}")
+    
     # Send Telegram notification
     try:
         send_message("🛑 TRADING BOT STOPPED\nReceived shutdown signal")
@@ -89,6 +151,54 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
+# Every agent config merged into one file, rebuilt when any config changes
+AGENT_CONFIG_CACHE = f"{AGENTS_CONFIG_DIR}.cache.json"
+
+
+def _read_all_agent_configs():
+    """
+    Read every agent config, using the consolidated cache when it is current.
+    
+    Returns:
+        List of raw agent config dicts (unfiltered)
+    """
+    # Adding/removing a file bumps the directory mtime, editing one bumps its own
+    with os.scandir(AGENTS_CONFIG_DIR) as it:
+        entries = [entry for entry in it if entry.name.endswith('.json')]
+    mtime = max([os.stat(AGENTS_CONFIG_DIR).st_mtime] + [entry.stat().st_mtime for entry in entries])
+    
+    try:
+        with open(AGENT_CONFIG_CACHE, 'rb') as f:
+            cached = orjson.loads(f.read()) if orjson else json.load(f)
+        if cached.get('mtime') == mtime and cached.get('count') == len(entries):
+            return cached['configs']
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing or unreadable cache - rebuild it
+    
+    configs = []
+    for entry in entries:
+        try:
+            with open(entry.path, 'rb') as f:
+                configs.append(orjson.loads(f.read()) if orjson else json.load(f))
+        except Exception as e:
+            logger.error(f"Error loading agent config {entry.name}: {e}")
+    
+    # Don't cache a partial read - a broken file must be retried (and logged) every start
+    if len(configs) != len(entries):
+        return configs
+    
+    try:
+        payload = {'mtime': mtime, 'count': len(entries), 'configs': configs}
+        tmp_path = AGENT_CONFIG_CACHE + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(payload) if orjson else json.dumps(payload).encode())
+        os.replace(tmp_path, AGENT_CONFIG_CACHE)
+    except OSError as e:
+        logger.debug(f"Could not write agent config cache: {e}")
+    
+    return configs
+
+
 def load_agent_configs():
     """
     Load all agent configurations from agents_config directory
@@ -97,37 +207,27 @@ def load_agent_configs():
     Returns:
         Dict of agent_id -> agent_config
     """
-    from hackathon_config import AGENTS_CONFIG_DIR
-    
     agent_configs = {}
-    allowed_symbols = set(load_symbols())  # Get allowed symbols from .env
     
     if not os.path.exists(AGENTS_CONFIG_DIR):
         logger.warning(f"Agents config directory not found: {AGENTS_CONFIG_DIR}")
         return agent_configs
     
-    # Load all JSON config files
-    for filename in os.listdir(AGENTS_CONFIG_DIR):
-        if filename.endswith('.json'):
-            filepath = os.path.join(AGENTS_CONFIG_DIR, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    config = json.load(f)
-                
-                agent_id = config.get('agent_id')
-                symbol = config.get('symbol')
-                
-                # Only include agents for allowed symbols
-                if agent_id and symbol and symbol in allowed_symbols:
-                    agent_configs[agent_id] = config
-                    logger.info(f"Loaded agent config: {agent_id} for {symbol}")
-                elif agent_id and symbol and symbol not in allowed_symbols:
-                    logger.info(f"Skipping agent {agent_id} for {symbol} (not in ALLOWED_SYMBOLS)")
-                    
-            except Exception as e:
-                logger.error(f"Error loading agent config {filename}: {e}")
+    # The cache holds every config, so changing ALLOWED_SYMBOLS never invalidates it
+    skipped = []
+    for config in _read_all_agent_configs():
+        agent_id = config.get('agent_id')
+        symbol = config.get('symbol')
+        
+        # Only include agents for allowed symbols
+        if agent_id and symbol and symbol in ACTIVE_SYMBOLS:
+            agent_configs[agent_id] = config
+        elif agent_id and symbol:
+            skipped.append(agent_id)
     
-    logger.info(f"Loaded {len(agent_configs)} agent configurations")
+    if skipped:
+        logger.info(f"Skipping agents {', '.join(skipped)} (symbol not in ALLOWED_SYMBOLS)")
+    logger.info(f"Loaded {len(agent_configs)} agent configurations: {', '.join(agent_configs)}")
     return agent_configs
 
 
@@ -141,11 +241,10 @@ def initialize_agents(agent_configs: Dict[str, Dict]) -> Dict[str, Portfolio]:
     Returns:
         Dict of agent_id -> Portfolio
     """
-    portfolios = {}
-    
-    for agent_id, config in agent_configs.items():
-        portfolios[agent_id] = Portfolio(agent_id=agent_id, capital=CAPITAL)
-        logger.info(f"Initialized portfolio for {agent_id}")
+    # Portfolio() is purely in-memory (no storage or exchange calls), so a thread
+    # pool would only add overhead here
+    portfolios = {agent_id: Portfolio(agent_id=agent_id, capital=CAPITAL) for agent_id in agent_configs}
+    logger.info(f"Initialized {len(portfolios)} portfolios: {', '.join(portfolios)}")
     
     return portfolios
 
@@ -158,10 +257,10 @@ def cleanup_on_shutdown(portfolios: Dict[str, Portfolio]):
     
     # Stop monitoring threads
     try:
-        from core.trade_manager import stop_live_monitor
-        from core.sentinel_agent import stop_sentinel_agent
-        stop_live_monitor()
-        stop_sentinel_agent()
+        if stop_live_monitor is not None:
+            stop_live_monitor()
+        if stop_sentinel_agent is not None:
+            stop_sentinel_agent()
     except Exception as e:
         logger.warning(f"Error stopping monitoring threads: {e}")
     
@@ -181,10 +280,13 @@ def cleanup_on_shutdown(portfolios: Dict[str, Portfolio]):
         else:
             print("\n✅ No open positions to close")
             
-        # Save final equity for all agents
+        # Save final equity for all agents (one transaction)
+        log_equity_bulk([(agent_id, portfolio.equity) for agent_id, portfolio in portfolios.items()])
         for agent_id, portfolio in portfolios.items():
-            log_equity(agent_id, portfolio.equity)
             print(f"  [{agent_id}] Final equity: ${portfolio.equity:.2f}")
+        
+        # Checkpoint and truncate the SQLite WAL now that final writes are done
+        stop_wal_checkpointer()
             
         # Send Telegram summary
         try:
@@ -231,9 +333,6 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
         symbols: List of trading pairs to monitor
         interval: Time in seconds between each trading cycle
     """
-    import signal as sig_module  # Rename to avoid conflict
-    from core.binance_client import get_connection_info, is_testnet_mode, test_binance_connection
-    
     # Initialize portfolios variable
     portfolios = {}
     
@@ -251,9 +350,7 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
         # === SYNC SYMBOL LOCKS WITH ACTUAL POSITIONS ON STARTUP ===
         logger.info("🔄 Initializing symbol lock system...")
         try:
-            logger.debug("Importing symbol_lock module...")
-            from core.symbol_lock import clear_all_locks_and_cooldowns
-            logger.debug("Import successful, clearing locks...")
+            logger.debug("Clearing symbol locks...")
             # On fresh startup, just clear everything - no need to check Binance
             clear_all_locks_and_cooldowns()
             logger.info("✅ Symbol locks cleared on startup (fresh start)")
@@ -270,11 +367,8 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
         
         # === [ApexPatch2025-10-31] Live Monitor Thread Fix ===
         # === [Bulletproof Improvements] Enhanced Monitoring & Error Handling ===
-        from core.trade_manager import start_live_monitor
-        from core.sentinel_agent import start_sentinel_agent
-
         try:
-            live_monitor_thread = start_live_monitor(5)  # Changed from 3 to 5 seconds to reduce API load
+            live_monitor_thread = start_live_monitor() if start_live_monitor else None  # LIVE_MONITOR_INTERVAL, 5s by default to reduce API load
             if live_monitor_thread:
                 # Thread is already started in start_live_monitor function
                 logger.info("✅ Live monitor thread started successfully")
@@ -282,19 +376,15 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
                 logger.warning("⚠️ Live monitor thread not returned from trade_manager")
                 
             # Start sentinel agent for position health monitoring (with enhanced debounce & leverage consistency)
-            sentinel_thread = start_sentinel_agent(300)  # 5 minutes
+            sentinel_thread = start_sentinel_agent(300) if start_sentinel_agent else None  # 5 minutes
             if sentinel_thread:
                 logger.info("✅ Sentinel agent thread started successfully (with dual-layer debounce & leverage consistency)")
             else:
                 logger.warning("⚠️ Sentinel agent thread not returned")
                 
             # Verify new modules are available (regime_engine, binance_error_handler)
-            try:
-                from core.regime_engine import get_regime_analysis
-                from core.binance_error_handler import handle_binance_error
+            if NEW_MODULES_ENABLED:
                 logger.info("✅ Regime engine and error handler modules loaded successfully")
-            except ImportError as e:
-                logger.warning(f"⚠️ Failed to import new modules: {e}")
         except Exception as e:
             logger.error(f"Failed to start monitoring threads: {e}")
         
@@ -316,7 +406,6 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
         
         print(f"\n💰 ACCOUNT SETTINGS:")
         print(f"   Starting Capital: ${CAPITAL:,.2f}")
-        from core.settings import settings
         risk_pct = settings.risk_fraction * 100
         print(f"   Risk per Trade: {risk_pct:.1f}% of equity (dynamic scaling)")
         print(f"   Max Leverage: {settings.max_leverage}x")
@@ -350,15 +439,8 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
             try:
                 cycle_count += 1
                 
-                # Clear, organized cycle header
-                print("\n" + "═" * 80)
-                cycle_time = time.strftime('%Y-%m-%d %H:%M:%S')
-                header_text = f"TRADING CYCLE #{cycle_count} │ {cycle_time}"
-                padding = (80 - len(header_text)) // 2
-                print(" " * padding + header_text)
-                print("═" * 80)
-                print(f"📊 Analyzing market conditions and executing trades...")
-                print("-" * 80)
+                # One header record per cycle (the timestamp comes from the log format)
+                cycle_logger.info(f"{'═' * 20} TRADING CYCLE #{cycle_count} {'═' * 20}")
                 
                 # Execute one trading cycle
                 cycle_results = orchestrator.run_cycle()
@@ -369,31 +451,27 @@ def live_trading_loop(symbols: list = ['BTC/USDT', 'BNB/USDT'], interval: int =
                     signals_generated = cycle_results.get('signals_generated', 0)
                     
                     if trades_executed > 0:
-                        print(f"\n✅ Cycle Summary: {trades_executed} trade(s) executed, {signals_generated} signal(s) analyzed")
+                        cycle_logger.info(f"✅ Cycle Summary: {trades_executed} trade(s) executed, {signals_generated} signal(s) analyzed")
                     else:
-                        print(f"\n⏸️  Cycle Summary: No trades executed (analyzed {signals_generated} signal(s))")
+                        cycle_logger.info(f"⏸️  Cycle Summary: No trades executed (analyzed {signals_generated} signal(s))")
                 
                 # Manage open positions (TP/SL) - backup check
-                from core.trade_manager import manage_open_positions
-                position_summary = manage_open_positions()
+                position_summary = manage_open_positions() if manage_open_positions else None
                 
                 # Show position summary if available
                 if position_summary and position_summary.get('total_positions', 0) > 0:
                     total_pos = position_summary.get('total_positions', 0)
-                    print(f"\n📈 Open Positions: {total_pos} position(s) being monitored")
+                    cycle_logger.info(f"📈 Open Positions: {total_pos} position(s) being monitored")
                 
                 # Wait for next cycle with clear indication
-                print(f"\n" + "-" * 80)
-                print(f"⏳ Waiting {interval} seconds ({interval/60:.1f} minutes) until next cycle...")
-                print("═" * 80)
+                cycle_logger.info(f"⏳ Waiting {interval} seconds ({interval/60:.1f} minutes) until next cycle...")
                 time.sleep(interval)
                 
             except KeyboardInterrupt:
                 print("\n\n🚨 Keyboard interrupt received...")
                 break
             except Exception as e:
-                logger.error(f"Error in trading loop: {e}", exc_info=True)
-                print(f"⚠️  Error in trading loop: {e}")
+                logger.error(f"⚠️  Error in trading loop: {e}", exc_info=True)
                 
                 # Send Telegram error notification
                 try:
@@ -433,10 +511,8 @@ if __name__ == "__main__":
     
     print("✅ Connection Verified")
     
-    # Load symbols from .env
-    from hackathon_config import load_symbols
+    # Load symbols from .env (already logged when they were resolved)
     symbols = load_symbols()
-    print(f"✅ Active trading symbols: {', '.join(symbols)}")
     
     # Start live trading loop
     live_trading_loop(symbols=symbols, interval=REFRESH_INTERVAL_SEC)
\ No newline at end of file
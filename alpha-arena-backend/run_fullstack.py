@@ -8,39 +8,52 @@ import os
 import sys
 import threading
 import time
-import asyncio
 from dotenv import load_dotenv
 
 # Load environment
 load_dotenv()
 
-def run_api_server():
-    """Run the FastAPI server in a separate thread"""
+# How long to wait for the API server to report it is serving
+API_STARTUP_TIMEOUT_SEC = 15.0
+
+def start_api_server() -> bool:
+    """
+    Start the FastAPI server on a daemon thread and wait until it is serving.
+    
+    Returns:
+        True once uvicorn has finished startup, False if it exited or timed out
+    """
     import uvicorn
     from api_server import app
     
     print("\n🚀 Starting FastAPI server...")
-    uvicorn.run(
+    server = uvicorn.Server(uvicorn.Config(
         app,
         host="0.0.0.0",
         port=8000,
         log_level="warning",  # Reduce noise
         access_log=False
-    )
+    ))
+    # uvicorn only installs signal handlers on the main thread, which stays with the bot
+    api_thread = threading.Thread(target=server.run, name="api-server", daemon=True)
+    api_thread.start()
+    
+    deadline = time.monotonic() + API_STARTUP_TIMEOUT_SEC
+    while not server.started:
+        if not api_thread.is_alive() or time.monotonic() > deadline:
+            return False
+        time.sleep(0.05)
+    return True
 
 def run_trading_bot():
     """Run the main trading bot"""
     import main
     from hackathon_config import REFRESH_INTERVAL_SEC, load_symbols
     
-    # Give API server time to start
-    time.sleep(2)
-
     print("\n🤖 Starting trading bot...")
     
-    # Load symbols from .env
+    # Load symbols from .env (already logged when main resolved them)
     symbols = load_symbols()
-    print(f"✅ Active trading symbols: {', '.join(symbols)}")
     
     # Call the main trading loop with the correct interval and symbols
     if hasattr(main, 'live_trading_loop'):
@@ -49,29 +62,6 @@ def run_trading_bot():
         print("❌ live_trading_loop not found in main.py")
         sys.exit(1)
 
-def update_dashboard_periodically():
-    """Periodically send dashboard updates to API server"""
-    from api_server import update_dashboard_data
-    from main import load_agent_configs, initialize_agents
-    from core.orchestrator import TradingOrchestrator
-    
-    # Wait for trading bot to initialize
-    time.sleep(5)
-    
-    print("\n📊 Dashboard updater started")
-    
-    # This will be updated by the orchestrator
-    # For now, just a placeholder
-    while True:
-        try:
-            time.sleep(5)
-            # Dashboard updates will come from orchestrator.run_cycle()
-        except KeyboardInterrupt:
-            break
-        except Exception as e:
-            print(f"⚠️  Dashboard update error: {e}")
-            time.sleep(5)
-
 if __name__ == "__main__":
     print("\n" + "="*80)
     print("🚀 ALPHA ARENA - Full Stack Trading Bot")
@@ -84,11 +74,9 @@ if __name__ == "__main__":
     
     try:
         # Start API server in separate thread
-        api_thread = threading.Thread(target=run_api_server, daemon=True)
-        api_thread.start()
-        
-        # Give server time to start
-        time.sleep(2)
+        if not start_api_server():
+            print("❌ API server failed to start (is port 8000 in use?)")
+            sys.exit(1)
         
         print("\n✅ API Server running at: http://localhost:8000")
         print("✅ API Docs at: http://localhost:8000/docs")
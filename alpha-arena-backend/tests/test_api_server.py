@@ -0,0 +1,126 @@
+"""
+Unit tests for the dashboard API server helpers
+"""
+
+import os
+import sys
+import json
+import asyncio
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import api_server
+
+
+class _FakeSocket:
+    def __init__(self):
+        self.sent = []
+        self.received = threading.Event()
+
+    async def send_text(self, payload):
+        self.sent.append(json.loads(payload))
+        self.received.set()
+
+
+@pytest.fixture
+def server_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(api_server.start_dashboard_broadcaster(), loop).result(2.0)
+    yield loop
+    asyncio.run_coroutine_threadsafe(api_server.stop_dashboard_broadcaster(), loop).result(2.0)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@pytest.fixture
+def socket(monkeypatch):
+    socket = _FakeSocket()
+    monkeypatch.setattr(api_server.manager, "active_connections", {socket})
+    return socket
+
+
+def test_update_from_trading_thread_broadcasts_on_server_loop(server_loop, socket):
+    api_server.update_dashboard_data({"iteration": 7})
+
+    assert socket.received.wait(2.0)
+    assert socket.sent[0]["type"] == "update"
+    assert socket.sent[0]["data"]["iteration"] == 7
+
+
+def test_update_without_server_only_stores_data(monkeypatch, socket):
+    monkeypatch.setattr(api_server, "_server_loop", None)
+
+    api_server.update_dashboard_data({"iteration": 3})
+
+    assert api_server.dashboard_data["iteration"] == 3
+    assert socket.sent == []
+
+
+def test_full_queue_drops_oldest_update(monkeypatch):
+    queue = asyncio.Queue(maxsize=2)
+    monkeypatch.setattr(api_server, "_dashboard_queue", queue)
+
+    for i in range(3):
+        api_server._enqueue_update({"iteration": i})
+
+    assert [queue.get_nowait()["iteration"] for _ in range(2)] == [1, 2]
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_message_encoding_round_trips(monkeypatch, fast_json):
+    if not fast_json:
+        monkeypatch.setattr(api_server, "orjson", None)
+    message = {"type": "update", "data": {"total_equity": 10000.5, "agents": ["BTC_MACD"], "mode": "λ"}}
+
+    payload = api_server.encode_message(message)
+
+    assert json.loads(payload) == message
+    assert api_server.decode_message(payload) == message
+
+
+class _ConnectingSocket(_FakeSocket):
+    """Adds another client while its own send is in flight"""
+
+    async def send_text(self, payload):
+        api_server.manager.active_connections.add(_FakeSocket())
+        await asyncio.sleep(0)
+        await super().send_text(payload)
+
+
+def test_connection_change_during_send_keeps_broadcaster_alive(server_loop, monkeypatch):
+    socket = _ConnectingSocket()
+    monkeypatch.setattr(api_server.manager, "active_connections", {socket})
+
+    api_server.update_dashboard_data({"iteration": 1})
+    assert socket.received.wait(2.0)
+    socket.received.clear()
+    api_server.update_dashboard_data({"iteration": 2})
+
+    assert socket.received.wait(2.0)
+    assert [m["data"]["iteration"] for m in socket.sent] == [1, 2]
+    assert not api_server._broadcaster_task.done()
+
+
+def test_broadcaster_survives_failed_broadcast(server_loop, socket, monkeypatch):
+    real_broadcast = api_server.manager.broadcast
+    calls = []
+
+    async def flaky_broadcast(message):
+        calls.append(message)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        await real_broadcast(message)
+
+    monkeypatch.setattr(api_server.manager, "broadcast", flaky_broadcast)
+
+    api_server.update_dashboard_data({"iteration": 1})
+    api_server.update_dashboard_data({"iteration": 2})
+
+    assert socket.received.wait(2.0)
+    assert socket.sent[-1]["data"]["iteration"] == 2
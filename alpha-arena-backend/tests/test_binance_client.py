@@ -0,0 +1,164 @@
+"""
+Unit tests for the Binance client helpers
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+
+from core import binance_client
+from core.binance_client import FuturesClient
+
+
+def _response(status, body):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    return response
+
+
+@pytest.mark.parametrize("fast_json", [True, False])
+def test_futures_client_parses_like_stock_client(monkeypatch, fast_json):
+    if not fast_json:
+        monkeypatch.setattr(binance_client, "orjson", None)
+    body = b'[{"symbol": "BTCUSDT", "markPrice": "50000.10"}]'
+
+    assert FuturesClient._handle_response(_response(200, body)) == Client._handle_response(_response(200, body))
+    assert FuturesClient._handle_response(_response(200, b"")) == {}
+    with pytest.raises(BinanceAPIException):
+        FuturesClient._handle_response(_response(400, b'{"code": -1102, "msg": "bad"}'))
+
+
+def test_tuned_session_pool():
+    client = FuturesClient.__new__(FuturesClient)
+    client.session = requests.Session()
+
+    binance_client._tune_session(client)
+
+    adapter = client.session.adapters["https://"]
+    assert adapter._pool_maxsize == binance_client.HTTP_POOL_SIZE
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_clients_share_one_connection_pool():
+    clients = []
+    for _ in range(2):
+        client = FuturesClient.__new__(FuturesClient)
+        client.session = requests.Session()
+        binance_client._tune_session(client)
+        clients.append(client)
+
+    assert clients[0].session.adapters["https://"] is clients[1].session.adapters["https://"]
+
+
+class _OrderClient:
+    CONTRACT_ORDER_PREFIX = "x-"
+
+    def __init__(self, ws_error=None, placed=False, ws_delay=None):
+        self.ws_error = ws_error
+        self.ws_delay = ws_delay
+        self.placed = placed
+        self.ws_orders = []
+        self.rest_orders = []
+        self.lookups = []
+
+    def uuid22(self):
+        return "abc"
+
+    def ws_futures_create_order(self, **params):
+        self.ws_orders.append(params)
+        if self.ws_delay:
+            self.ws_delay.wait(5.0)
+        if self.ws_error:
+            raise self.ws_error
+        return {"orderId": 1, "status": "FILLED"}
+
+    def futures_get_order(self, **params):
+        self.lookups.append(params)
+        if self.placed:
+            return {"orderId": 1, "status": "FILLED"}
+        raise BinanceAPIException(_response(400, b'{"code": -2013, "msg": "Order does not exist."}'), 400,
+                                  '{"code": -2013, "msg": "Order does not exist."}')
+
+    def futures_create_order(self, **params):
+        self.rest_orders.append(params)
+        return {"orderId": 2, "status": "FILLED"}
+
+
+@pytest.fixture
+def ws_orders(monkeypatch):
+    monkeypatch.setattr(binance_client, "WS_ORDERS_ENABLED", True)
+    monkeypatch.setattr(binance_client, "_ws_orders_failed", False)
+
+
+def test_orders_go_over_websocket(ws_orders):
+    client = _OrderClient()
+
+    order = binance_client._create_futures_order(client, symbol="BTCUSDT", side="BUY", type="MARKET", quantity=0.01)
+
+    assert order["orderId"] == 1
+    assert client.ws_orders[0]["newClientOrderId"] == "x-abc"
+    assert client.rest_orders == []
+
+
+@pytest.mark.parametrize("placed", [True, False])
+def test_websocket_failure_falls_back_without_double_submit(ws_orders, placed):
+    client = _OrderClient(ws_error=ConnectionError("socket closed"), placed=placed)
+
+    order = binance_client._create_futures_order(client, symbol="BTCUSDT", side="BUY", type="MARKET", quantity=0.01)
+
+    assert client.lookups == [{"symbol": "BTCUSDT", "origClientOrderId": "x-abc"}]
+    assert order["orderId"] == (1 if placed else 2)
+    assert len(client.rest_orders) == (0 if placed else 1)
+    assert binance_client._ws_orders_failed
+
+    binance_client._create_futures_order(client, symbol="BTCUSDT", side="SELL", type="MARKET", quantity=0.01)
+    assert len(client.ws_orders) == 1
+
+
+@pytest.mark.parametrize("settles", [True, False])
+def test_websocket_timeout_never_resends_unsettled_order(ws_orders, monkeypatch, settles):
+    monkeypatch.setattr(binance_client, "WS_ORDER_TIMEOUT_SEC", 0.05)
+    monkeypatch.setattr(binance_client, "WS_ORDER_SETTLE_SEC", 0.5 if settles else 0.05)
+    release = threading.Event()
+    client = _OrderClient(ws_delay=release)
+    if settles:
+        threading.Timer(0.2, release.set).start()
+
+    try:
+        if settles:
+            order = binance_client._create_futures_order(client, symbol="BTCUSDT", side="BUY", type="MARKET", quantity=0.01)
+            assert order["orderId"] == 1
+        else:
+            with pytest.raises(RuntimeError):
+                binance_client._create_futures_order(client, symbol="BTCUSDT", side="BUY", type="MARKET", quantity=0.01)
+    finally:
+        release.set()
+
+    assert client.lookups == []
+    assert client.rest_orders == []
+
+
+@pytest.mark.parametrize("testnet", [True, False])
+def test_clients_use_matching_websocket_order_endpoint(monkeypatch, testnet):
+    monkeypatch.setattr(FuturesClient, "ping", lambda self: {})
+    monkeypatch.setenv("BINANCE_TESTNET", "true" if testnet else "false")
+
+    manager = binance_client.BinanceClientManager()
+    manager.is_testnet = testnet
+    clients = [manager.create_futures_client(), binance_client.make_binance_futures_client()]
+
+    expected = Client.WS_FUTURES_TESTNET_URL if testnet else Client.WS_FUTURES_URL.format("com")
+    for client in clients:
+        assert client.ws_future._url == expected
+        assert client._create_futures_api_uri("order").startswith(
+            "https://testnet.binancefuture.com" if testnet else "https://fapi.binance.com"
+        )
@@ -0,0 +1,52 @@
+"""
+Unit tests for the background CSV writer
+"""
+
+import csv
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import csv_logger
+
+
+@pytest.fixture
+def csv_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(csv_logger, "CSV_DIR", str(tmp_path))
+    monkeypatch.setattr(csv_logger, "TRADES_LOG", str(tmp_path / "trades_log.csv"))
+    monkeypatch.setattr(csv_logger, "_checked_headers", set())
+    yield tmp_path
+    csv_logger.force_flush_all()
+
+
+def _read(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def test_trades_are_written_by_background_writer(csv_dir):
+    for i in range(3):
+        csv_logger.log_trade("agent", "BTCUSDT", "BUY", 0.01, 50000.0 + i, status="TAKE_PROFIT")
+    csv_logger.force_flush_all()
+
+    rows = _read(csv_logger.TRADES_LOG)
+    assert rows[0] == csv_logger._get_trades_header()
+    assert [r[5] for r in rows[1:]] == ["50000.0000", "50001.0000", "50002.0000"]
+    assert csv_logger._writer_thread.name == "csv-writer"
+
+
+def test_header_change_rotates_old_log(csv_dir):
+    with open(csv_logger.TRADES_LOG, "w", newline="") as f:
+        csv.writer(f).writerows([["time", "symbol"], ["1", "BTCUSDT"]])
+
+    csv_logger.log_trade("agent", "BNBUSDT", "SELL", 1.0, 600.0)
+    csv_logger.force_flush_all()
+
+    rows = _read(csv_logger.TRADES_LOG)
+    assert rows[0] == csv_logger._get_trades_header()
+    assert len(rows) == 2
+    rotated = [p for p in os.listdir(csv_dir) if p.startswith("trades_log_")]
+    assert len(rotated) == 1
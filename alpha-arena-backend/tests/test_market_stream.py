@@ -0,0 +1,132 @@
+"""
+Unit tests for the WebSocket market stream mirror
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import market_stream
+
+
+@pytest.fixture(autouse=True)
+def reset_stream():
+    market_stream.stop_streams()
+    market_stream._wakeup.clear()
+    yield
+    market_stream.stop_streams()
+
+
+def _marks(**prices):
+    return [{"e": "markPriceUpdate", "s": s, "p": str(p)} for s, p in prices.items()]
+
+
+def test_positions_need_seed_before_use():
+    assert market_stream.get_positions() is None
+
+    market_stream.seed_positions([
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"},
+        {"symbol": "ETHUSDT", "positionAmt": "0", "entryPrice": "0"},
+    ])
+    # Mirror is seeded but no mark prices have arrived yet: treat as stale
+    assert market_stream.get_positions() is None
+
+    market_stream._handle_mark_prices(_marks(BTCUSDT=50100))
+    assert [p["symbol"] for p in market_stream.get_positions()] == ["BTCUSDT"]
+    assert market_stream.get_mark_price("BTCUSDT") == 50100.0
+
+
+def test_account_update_mirrors_position_changes():
+    market_stream.seed_positions([])
+    market_stream._handle_mark_prices(_marks(BNBUSDT=600))
+
+    market_stream._handle_user_event({
+        "e": "ACCOUNT_UPDATE",
+        "a": {"P": [{"s": "BNBUSDT", "pa": "-1.5", "ep": "601.0", "up": "-1.5"}]},
+    })
+    assert market_stream.wait_for_event(0)
+    assert market_stream.get_positions()[0]["positionAmt"] == "-1.5"
+
+    market_stream._handle_user_event({"e": "ACCOUNT_UPDATE", "a": {"P": [{"s": "BNBUSDT", "pa": "0", "ep": "0"}]}})
+    assert market_stream.get_positions() == []
+
+
+def test_user_stream_error_forces_rest_reseed():
+    market_stream.seed_positions([])
+    market_stream._handle_mark_prices(_marks(BTCUSDT=50000))
+    assert market_stream.get_positions() == []
+
+    market_stream._handle_user_event({"e": "error", "m": "connection lost"})
+    assert market_stream.get_positions() is None
+
+
+def test_tpsl_crossing_wakes_monitor_once():
+    market_stream.set_tpsl_trigger("BTCUSDT", True, 51000.0, 49500.0)
+
+    market_stream._handle_mark_prices(_marks(BTCUSDT=50500))
+    assert not market_stream.wait_for_event(0)
+
+    market_stream._handle_mark_prices(_marks(BTCUSDT=51010))
+    assert market_stream.wait_for_event(0)
+
+    # Still above TP: no repeated wakeups until price re-enters the range
+    market_stream._handle_mark_prices(_marks(BTCUSDT=51020))
+    assert not market_stream.wait_for_event(0)
+
+
+def test_order_updates_mirror_open_orders():
+    assert market_stream.get_open_orders("BTCUSDT") is None
+
+    market_stream.seed_open_orders([
+        {"symbol": "BTCUSDT", "orderId": 1, "type": "STOP_MARKET", "closePosition": True},
+    ])
+    market_stream._handle_user_event({
+        "e": "ORDER_TRADE_UPDATE",
+        "o": {"s": "BTCUSDT", "i": 2, "o": "TAKE_PROFIT_MARKET", "X": "NEW", "R": False, "cp": True},
+    })
+    assert sorted(o["type"] for o in market_stream.get_open_orders("BTCUSDT")) == ["STOP_MARKET", "TAKE_PROFIT_MARKET"]
+
+    market_stream._handle_user_event({"e": "ORDER_TRADE_UPDATE", "o": {"s": "BTCUSDT", "i": 1, "X": "CANCELED"}})
+    assert [o["orderId"] for o in market_stream.get_open_orders("BTCUSDT")] == [2]
+    assert market_stream.get_open_orders("BNBUSDT") == []
+
+    market_stream._handle_user_event({"e": "listenKeyExpired"})
+    assert market_stream.get_open_orders("BTCUSDT") is None
+
+
+def test_reseed_logs_drift_and_keeps_leverage(caplog):
+    market_stream.seed_positions([
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000", "leverage": "5"},
+    ])
+    market_stream._handle_user_event({
+        "e": "ACCOUNT_UPDATE",
+        "a": {"P": [{"s": "BTCUSDT", "pa": "0.02", "ep": "50000", "up": "0"}]},
+    })
+    assert market_stream._positions["BTCUSDT"]["leverage"] == "5"
+
+    with caplog.at_level("WARNING", logger="market_stream"):
+        market_stream.seed_positions([
+            {"symbol": "BTCUSDT", "positionAmt": "0.02", "entryPrice": "50000"},
+            {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+        ])
+
+    drift = [r.getMessage() for r in caplog.records if "drift" in r.getMessage()]
+    assert len(drift) == 1 and "BNBUSDT" in drift[0]
+
+
+def test_ticker_stream_feeds_last_prices():
+    assert market_stream.get_last_price("BTCUSDT") is None
+
+    market_stream._handle_tickers([
+        {"e": "24hrTicker", "E": 1700000000000, "s": "BTCUSDT", "c": "50123.4"},
+        {"e": "24hrTicker", "E": 1700000000000, "s": "BADUSDT", "c": "n/a"},
+    ])
+
+    assert market_stream.get_last_price("BTCUSDT") == (50123.4, 1700000000000)
+    assert market_stream.get_last_price("BADUSDT") is None
+
+    market_stream._handle_tickers({"e": "error", "m": "closed"})
+    assert market_stream.get_last_price("BTCUSDT") is None
@@ -0,0 +1,123 @@
+"""
+Unit tests for SQLite storage layer
+"""
+
+import os
+import sys
+import sqlite3
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import storage
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """Point storage at a throwaway database"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(storage, "MAIN_DB", str(tmp_path / "arena.db"))
+    monkeypatch.setattr(storage, "_open_pos_cache", {})
+    storage.init_db()
+    yield storage.MAIN_DB
+    storage.stop_wal_checkpointer()
+
+
+def test_init_db_enables_wal_and_checkpointer(temp_db):
+    con = sqlite3.connect(temp_db)
+    mode = con.execute("PRAGMA journal_mode").fetchone()[0]
+    con.close()
+
+    assert mode == "wal"
+    assert storage._checkpoint_thread is not None
+    assert storage._checkpoint_thread.is_alive()
+
+
+def test_connections_disable_autocheckpoint(temp_db):
+    con = storage._connect()
+    assert con.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 0
+    con.close()
+
+
+def test_stop_truncates_wal(temp_db):
+    storage.log_equity("agent", 1000.0)
+    storage.stop_wal_checkpointer()
+
+    wal_path = temp_db + "-wal"
+    assert not os.path.exists(wal_path) or os.path.getsize(wal_path) == 0
+    assert storage._checkpoint_thread is None
+
+
+def test_open_position_cache_tracks_writes(temp_db):
+    assert storage.get_open_position("BTCUSDT", "agent") is None
+    assert storage._open_pos_cache[("BTCUSDT", "agent")] is None
+
+    position_id = storage.log_position_open("BTCUSDT", "agent", "long", 0.01, 50000.0, 5)
+    cached = storage.get_open_position("BTCUSDT", "agent")
+    assert cached["id"] == position_id
+    assert cached["entry_price"] == 50000.0
+
+    storage.mark_position_closed(position_id=position_id)
+    assert storage.get_open_position("BTCUSDT", "agent") is None
+
+
+def test_open_position_cache_matches_database(temp_db):
+    storage.log_position_open("BNBUSDT", "agent", "short", 1.0, 600.0, 3, 0.7, "test")
+    cached = storage.get_open_position("BNBUSDT", "agent")
+
+    storage._open_pos_cache.clear()
+    fresh = storage.get_open_position("BNBUSDT", "agent")
+
+    assert cached == fresh
+
+
+def test_log_equity_bulk_writes_all_agents(temp_db):
+    storage.log_equity_bulk([("agent_a", 1000.0), ("agent_b", 950.5)])
+    storage.log_equity_bulk([])
+
+    assert [equity for _, equity in storage.get_equity_history("agent_a")] == [1000.0]
+    assert [equity for _, equity in storage.get_equity_history("agent_b")] == [950.5]
+
+
+def test_read_through_does_not_overwrite_concurrent_open(temp_db, monkeypatch):
+    real_connect = storage._connect
+    raced = []
+
+    class _RacingConnection:
+        def __init__(self, con):
+            self._con = con
+
+        def cursor(self):
+            return self._con.cursor()
+
+        def close(self):
+            self._con.close()
+            if not raced:
+                raced.append(True)
+                monkeypatch.setattr(storage, "_connect", real_connect)
+                storage.log_position_open("BTCUSDT", "agent", "long", 0.01, 50000.0, 5)
+
+    monkeypatch.setattr(storage, "_connect", lambda: _RacingConnection(real_connect()))
+
+    assert storage.get_open_position("BTCUSDT", "agent") is None
+    assert storage.get_open_position("BTCUSDT", "agent")["entry_price"] == 50000.0
+
+
+def test_duplicate_open_drops_cached_entry(temp_db):
+    storage.log_position_open("BTCUSDT", "agent", "long", 0.01, 50000.0, 5)
+    storage._open_pos_cache[("BTCUSDT", "agent")] = None
+
+    assert storage.log_position_open("BTCUSDT", "agent", "long", 0.02, 51000.0, 5) is None
+    assert storage.get_open_position("BTCUSDT", "agent")["entry_price"] == 50000.0
+
+
+def test_open_position_returns_copies(temp_db):
+    storage.log_position_open("BTCUSDT", "agent", "long", 0.01, 50000.0, 5)
+
+    storage.get_open_position("BTCUSDT", "agent")["quantity"] = 99.0
+    storage._open_pos_cache.clear()
+    fetched = storage.get_open_position("BTCUSDT", "agent")
+    fetched["quantity"] = 99.0
+
+    assert storage.get_open_position("BTCUSDT", "agent")["quantity"] == 0.01
@@ -0,0 +1,30 @@
+"""
+Unit tests for strategy analytics caching
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import strategy_analytics
+
+
+def test_adaptive_weights_expire_without_new_trades(monkeypatch):
+    now = [1000.0]
+    computed = []
+
+    monkeypatch.setattr(strategy_analytics.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(strategy_analytics, "get_weights_epoch", lambda: 7)
+    monkeypatch.setattr(strategy_analytics, "_stats", lambda: {})
+    monkeypatch.setattr(strategy_analytics, "get_strategy_weights",
+                        lambda stats: computed.append(now[0]) or {"trend_following": float(len(computed))})
+    monkeypatch.setattr(strategy_analytics, "_weights_cache", None)
+
+    assert strategy_analytics.get_adaptive_strategy_weights() == {"trend_following": 1.0}
+    now[0] += strategy_analytics.WEIGHTS_CACHE_TTL_SEC - 1
+    assert strategy_analytics.get_adaptive_strategy_weights() == {"trend_following": 1.0}
+
+    now[0] += 2
+    assert strategy_analytics.get_adaptive_strategy_weights() == {"trend_following": 2.0}
+    assert len(computed) == 2
@@ -0,0 +1,184 @@
+"""
+Unit tests for the multi-agent symbol lock
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import symbol_lock
+from core.symbol_lock import (
+    acquire_position_lock,
+    release_position_lock,
+    is_symbol_locked,
+    get_active_positions,
+    clear_all_locks_and_cooldowns,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_locks():
+    clear_all_locks_and_cooldowns()
+    yield
+    clear_all_locks_and_cooldowns()
+
+
+def test_acquire_and_release():
+    assert acquire_position_lock("BTCUSDT", "agent_a")
+    assert is_symbol_locked("BTCUSDT")
+    assert not acquire_position_lock("BTCUSDT", "agent_b")
+    assert get_active_positions()["BTCUSDT"]["agent_id"] == "agent_a"
+
+    release_position_lock("BTCUSDT", success=True)
+    assert not is_symbol_locked("BTCUSDT")
+    assert acquire_position_lock("BTCUSDT", "agent_b")
+
+
+def test_failed_trade_sets_cooldown():
+    assert acquire_position_lock("BNBUSDT", "agent_a")
+    release_position_lock("BNBUSDT", success=False)
+
+    assert is_symbol_locked("BNBUSDT")
+    assert not acquire_position_lock("BNBUSDT", "agent_b")
+    assert "BNBUSDT" not in get_active_positions()
+
+
+def test_symbols_are_independent():
+    assert acquire_position_lock("BTCUSDT", "agent_a")
+    assert acquire_position_lock("ETHUSDT", "agent_b")
+    assert set(get_active_positions()) == {"BTCUSDT", "ETHUSDT"}
+
+
+def test_concurrent_acquire_has_single_winner():
+    results = []
+    barrier = threading.Barrier(16)
+
+    def worker(i):
+        barrier.wait()
+        results.append(acquire_position_lock("SOLUSDT", f"agent_{i}"))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results.count(True) == 1
+
+
+def test_clear_all_locks_and_cooldowns():
+    acquire_position_lock("BTCUSDT", "agent_a")
+    acquire_position_lock("BNBUSDT", "agent_b")
+    release_position_lock("BNBUSDT", success=False)
+
+    clear_all_locks_and_cooldowns()
+
+    assert get_active_positions() == {}
+    assert not is_symbol_locked("BTCUSDT")
+    assert not is_symbol_locked("BNBUSDT")
+
+
+def test_cooldown_tracker_is_bounded():
+    for i in range(symbol_lock.MAX_COOLDOWNS * 2):
+        release_position_lock(f"SYM{i}USDT", success=False)
+
+    total = sum(len(shard) for shard in symbol_lock._cooldown_shards)
+    assert total <= symbol_lock.MAX_COOLDOWNS
+
+
+def test_expired_cooldowns_are_cleared(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(symbol_lock, "_monotonic", lambda: now[0])
+
+    release_position_lock("BTCUSDT", success=False)
+    assert is_symbol_locked("BTCUSDT")
+
+    now[0] += 301
+    symbol_lock.clear_expired_cooldowns()
+
+    assert all(len(shard) == 0 for shard in symbol_lock._cooldown_shards)
+    assert all(len(heap) == 0 for heap in symbol_lock._cooldown_heaps)
+    assert acquire_position_lock("BTCUSDT", "agent_a")
+
+
+def test_sync_with_binance_clears_stale_locks(monkeypatch):
+    from core import order_manager
+
+    open_positions = {"BTCUSDT": {"positionAmt": "0.01"}}
+
+    def fake_check(client, symbol):
+        if symbol == "ETHUSDT":
+            raise RuntimeError("network down")
+        return open_positions.get(symbol)
+
+    monkeypatch.setattr(order_manager, "check_existing_position", fake_check)
+
+    for symbol in ("BTCUSDT", "BNBUSDT", "ETHUSDT"):
+        assert acquire_position_lock(symbol, "agent")
+
+    symbol_lock.sync_with_binance_on_startup(client=object())
+
+    assert set(get_active_positions()) == {"BTCUSDT"}
+
+
+def test_active_positions_view_is_live_and_read_only():
+    view = symbol_lock.get_active_positions_view()
+    assert len(view) == 0
+
+    acquire_position_lock("BTCUSDT", "agent_a")
+    acquire_position_lock("BNBUSDT", "agent_b")
+
+    assert symbol_lock.active_position_count() == 2
+    assert "BTCUSDT" in view
+    assert view["BNBUSDT"].agent_id == "agent_b"
+    assert set(view) == {"BTCUSDT", "BNBUSDT"}
+    with pytest.raises(TypeError):
+        view["ETHUSDT"] = {}
+
+    release_position_lock("BTCUSDT")
+    assert "BTCUSDT" not in view
+
+
+def test_partial_cooldown_expiry_keeps_live_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(symbol_lock, "_monotonic", lambda: now[0])
+
+    release_position_lock("OLDUSDT", success=False)
+    now[0] += 200
+    for i in range(20):
+        release_position_lock(f"NEW{i}USDT", success=False)
+
+    now[0] += 150
+    symbol_lock.clear_expired_cooldowns()
+
+    assert not is_symbol_locked("OLDUSDT")
+    assert all(is_symbol_locked(f"NEW{i}USDT") for i in range(20))
+
+
+def test_sync_with_binance_timeout_bounds_startup(monkeypatch):
+    import time
+    from core import order_manager
+
+    release = threading.Event()
+
+    def hung_check(client, symbol):
+        release.wait(4.0)
+        return {"positionAmt": "1"}
+
+    monkeypatch.setattr(order_manager, "check_existing_position", hung_check)
+    monkeypatch.setattr(symbol_lock, "SYNC_TIMEOUT_SEC", 0.2)
+    assert acquire_position_lock("BTCUSDT", "agent")
+
+    start = time.monotonic()
+    try:
+        symbol_lock.sync_with_binance_on_startup(client=object())
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert elapsed < 1.0
+    assert get_active_positions() == {}
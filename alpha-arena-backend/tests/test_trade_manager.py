@@ -0,0 +1,512 @@
+"""
+Unit tests for trade manager TP/SL helpers
+"""
+
+import os
+import sys
+import time
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import trade_manager
+
+
+@pytest.fixture(autouse=True)
+def reset_tpsl_state(monkeypatch):
+    monkeypatch.setattr(trade_manager, "_atr_state", {})
+    monkeypatch.setattr(trade_manager, "_tpsl_cache", {})
+
+
+def _klines(n):
+    # Binance kline rows: [open_time, open, high, low, close, volume, ...] as strings
+    return [[i, "0", str(10 + i), str(9 + i * 0.5), str(9.5 + i), "0"] for i in range(n)]
+
+
+def _reference_atr(klines):
+    highs = [float(k[2]) for k in klines]
+    lows = [float(k[3]) for k in klines]
+    closes = [float(k[4]) for k in klines]
+    tr_values = [
+        max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+        for i in range(1, len(highs))
+    ]
+    return sum(tr_values[-14:]) / 14
+
+
+def test_compute_atr_matches_scalar_reference():
+    klines = _klines(15)
+    assert trade_manager._compute_atr(klines) == pytest.approx(_reference_atr(klines))
+
+
+def test_compute_atr_needs_full_period():
+    assert trade_manager._compute_atr(_klines(14)) is None
+
+
+class _FakeKlineClient:
+    def __init__(self, klines):
+        self.klines = klines
+        self.limits = []
+
+    def futures_klines(self, symbol, interval, limit):
+        self.limits.append(limit)
+        return self.klines[-limit:]
+
+
+def test_wilder_atr_updates_incrementally(monkeypatch):
+    step = trade_manager._ATR_INTERVAL_MS
+    klines = [[i * step] + row[1:] for i, row in enumerate(_klines(17))]
+    client = _FakeKlineClient(klines[:16])
+
+    seeded = trade_manager._get_atr(client, "BTCUSDT")
+    assert seeded == pytest.approx(_reference_atr(klines[:15]))
+
+    # Same forming candle: no update
+    assert trade_manager._get_atr(client, "BTCUSDT") == seeded
+
+    client.klines = klines
+    updated = trade_manager._get_atr(client, "BTCUSDT")
+    high, low, prev_close = float(klines[15][2]), float(klines[15][3]), float(klines[14][4])
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    assert updated == pytest.approx((seeded * 13 + tr) / 14)
+    assert client.limits == [16, 2, 2]
+
+
+def test_wilder_atr_adds_new_candle_once_across_threads(monkeypatch):
+    step = trade_manager._ATR_INTERVAL_MS
+    klines = [[i * step] + row[1:] for i, row in enumerate(_klines(17))]
+    client = _FakeKlineClient(klines[:16])
+    seeded = trade_manager._get_atr(client, "BTCUSDT")
+
+    class _SlowPrice(str):
+        def __float__(self):
+            time.sleep(0.05)  # Widen the gap between the open_time check and the state write
+            return float(str(self))
+
+    new_candle = list(klines[15])
+    new_candle[2] = _SlowPrice(new_candle[2])
+    slow = _FakeKlineClient(klines[:15] + [new_candle, klines[16]])
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(trade_manager._get_atr(slow, "BTCUSDT")))
+               for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    high, low, prev_close = float(klines[15][2]), float(klines[15][3]), float(klines[14][4])
+    tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
+    assert results == [pytest.approx((seeded * 13 + tr) / 14)] * 2
+    assert trade_manager._atr_state["BTCUSDT"]["atr"] == pytest.approx((seeded * 13 + tr) / 14)
+
+
+def test_dynamic_tpsl_uses_symbol_clamp_table(monkeypatch):
+    monkeypatch.setattr(trade_manager, "USE_ATR_TPSL", False)
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: _FakeKlineClient(_klines(16)))
+
+    # ATR ~4.8 on a price of 10 is extreme volatility: both values hit the caps
+    assert trade_manager._calculate_symbol_specific_tp_sl("BNBUSDT", 10.0) == (3.0, 2.0)
+    assert trade_manager._calculate_symbol_specific_tp_sl("ETHUSDT", 10.0) == (4.0, 2.5)
+
+
+class _FakePositionClient:
+    def __init__(self, positions, marks):
+        self.positions = positions
+        self.marks = marks
+        self.mark_calls = []
+        self.ticker_calls = []
+
+    def futures_position_information(self, symbol=None):
+        return [p for p in self.positions if symbol is None or p["symbol"] == symbol]
+
+    def futures_mark_price(self, **kwargs):
+        self.mark_calls.append(kwargs)
+        return [{"symbol": s, "markPrice": str(p)} for s, p in self.marks.items()]
+
+    def futures_symbol_ticker(self, symbol=None):
+        self.ticker_calls.append(symbol)
+        if symbol is None:
+            return [{"symbol": p["symbol"], "price": "600.0"} for p in self.positions]
+        return {"symbol": symbol, "price": "600.0"}
+
+
+def test_manage_open_positions_batches_mark_prices(monkeypatch):
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+        {"symbol": "ETHUSDT", "positionAmt": "0", "entryPrice": "0"},
+    ]
+    client = _FakePositionClient(positions, {"BTCUSDT": 50100.0})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+
+    result = trade_manager.manage_open_positions()
+
+    assert result["closed"] == 0
+    assert result["errors"] == []
+    assert client.mark_calls == [{}]
+    assert client.ticker_calls == ["BNBUSDT"]
+
+
+def test_manage_open_positions_skips_mark_prices_when_flat(monkeypatch):
+    positions = [{"symbol": s, "positionAmt": "0.000", "entryPrice": "0.0"} for s in ("BTCUSDT", "BNBUSDT")]
+    client = _FakePositionClient(positions, {"BTCUSDT": 50000.0})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+
+    assert trade_manager.manage_open_positions()["closed"] == 0
+    assert client.mark_calls == []
+
+
+def test_stop_live_monitor_interrupts_wait(monkeypatch):
+    import time
+
+    client = _FakePositionClient([], {})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager.market_stream, "start_streams", lambda *a, **k: False)
+
+    thread = trade_manager.start_live_monitor(interval=60)
+    time.sleep(0.1)
+    started = time.monotonic()
+    trade_manager.stop_live_monitor()
+
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 2
+
+
+def test_default_tpsl_without_client(monkeypatch):
+
+    assert trade_manager._calculate_symbol_specific_tp_sl("BTCUSDT", 50000.0) == (2.0, 1.0)
+    assert trade_manager._calculate_symbol_specific_tp_sl("bnbusdt", 600.0) == (1.5, 0.7)
+    assert trade_manager._calculate_symbol_specific_tp_sl("SOLUSDT", 150.0) == (2.0, 1.0)
+
+
+def test_tpsl_results_are_memoized(monkeypatch):
+    client = _FakeKlineClient(_klines(16))
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+
+    first = trade_manager._calculate_symbol_specific_tp_sl("BTCUSDT", 10.0)
+    assert trade_manager._calculate_symbol_specific_tp_sl("BTCUSDT", 10.02) == first
+    assert client.limits == [16]
+
+    # A different entry price bucket or force_update recomputes
+    trade_manager._calculate_symbol_specific_tp_sl("BTCUSDT", 12.0)
+    trade_manager._calculate_symbol_specific_tp_sl("BTCUSDT", 12.0, force_update=True)
+    assert len(client.limits) == 3
+
+
+def test_atr_tpsl_fetches_klines_once(monkeypatch):
+    client = _FakeKlineClient(_klines(16))
+    monkeypatch.setattr(trade_manager, "USE_ATR_TPSL", True)
+    monkeypatch.setattr(trade_manager, "_last_atr_tpsl_values", {})
+    monkeypatch.setattr(trade_manager, "_last_atr_tpsl_update", {})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+
+    # ATR-TPSL clamp is 0.5-5.0% / 0.3-2.5% regardless of symbol
+    assert trade_manager._calculate_symbol_specific_tp_sl("BNBUSDT", 10.0) == (5.0, 2.5)
+    assert client.limits == [16]
+
+
+def test_throttled_atr_tpsl_reuses_last_values(monkeypatch):
+    client = _FakeKlineClient(_klines(16))
+    monkeypatch.setattr(trade_manager, "USE_ATR_TPSL", True)
+    monkeypatch.setattr(trade_manager, "_last_atr_tpsl_values", {"BNBUSDT": (1.2, 0.6)})
+    monkeypatch.setattr(trade_manager, "_last_atr_tpsl_update", {"BNBUSDT": trade_manager.time.time()})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+
+    assert trade_manager._calculate_symbol_specific_tp_sl("BNBUSDT", 10.0) == (1.2, 0.6)
+    assert client.limits == []
+
+
+def test_validate_pnl_sync_uses_given_position():
+    position = {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000", "unRealizedProfit": "1.0"}
+    # No client needed when the position is passed in
+    assert trade_manager.validate_pnl_sync(None, "BTCUSDT", position)
+
+
+def test_cycle_closes_send_one_telegram_message(monkeypatch, tmp_path):
+    from core import trade_state_manager
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trade_state_manager, "_trade_states", {})
+    monkeypatch.setattr(trade_state_manager, "_last_exit_attempt", {})
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+    ]
+    client = _FakePositionClient(positions, {"BTCUSDT": 52000.0, "BNBUSDT": 540.0})
+    sent = []
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager, "close_position",
+                        lambda symbol, side, qty, max_retries=3: {"status": "success", "price": client.marks[symbol]})
+    monkeypatch.setattr(trade_manager, "_append_trade_close", lambda *a, **k: None)
+    monkeypatch.setattr(trade_manager, "update_decision_with_outcome", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "update_learning_from_csv_logs", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "TELEGRAM_ENABLED", True)
+    monkeypatch.setattr(trade_manager, "send_message", sent.append)
+
+    result = trade_manager.manage_open_positions()
+    assert trade_manager.flush_notifications()
+
+    assert result["closed"] == 2
+    assert result["take_profit"] == 2
+    assert len(sent) == 1
+    assert "BTCUSDT" in sent[0] and "BNBUSDT" in sent[0]
+
+
+def test_append_trade_close_uses_passed_pnl(monkeypatch):
+    logged = []
+    monkeypatch.setattr(trade_manager, "log_trade", lambda **kwargs: logged.append(kwargs))
+
+    trade_manager._append_trade_close("BTCUSDT", "buy", 0.01, 50000.0, 51000.0, "TAKE_PROFIT")
+    trade_manager._append_trade_close("BTCUSDT", "sell", 0.01, 50000.0, 51000.0, "STOP_LOSS", pnl=-9.5, pnl_pct=-1.9)
+
+    assert logged[0]["pnl"] == pytest.approx(10.0)
+    assert logged[0]["pnl_pct"] == pytest.approx(2.0)
+    assert (logged[1]["pnl"], logged[1]["pnl_pct"]) == (-9.5, -1.9)
+
+
+def test_closed_row_pnl_pct_uses_fill_price(monkeypatch, tmp_path):
+    from core import trade_state_manager
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trade_state_manager, "_trade_states", {})
+    monkeypatch.setattr(trade_state_manager, "_last_exit_attempt", {})
+    positions = [{"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"}]
+    client = _FakePositionClient(positions, {"BTCUSDT": 52000.0})
+    rows = []
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    # Filled below the mark price that triggered the take-profit
+    monkeypatch.setattr(trade_manager, "close_position",
+                        lambda symbol, side, qty, max_retries=3: {"status": "success", "price": 51500.0})
+    monkeypatch.setattr(trade_manager, "_append_trade_close", lambda *a, **k: rows.append(k))
+    monkeypatch.setattr(trade_manager, "update_decision_with_outcome", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "update_learning_from_csv_logs", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "TELEGRAM_ENABLED", False)
+
+    assert trade_manager.manage_open_positions()["closed"] == 1
+
+    assert rows[0]["pnl"] == pytest.approx(15.0)
+    assert rows[0]["pnl_pct"] == pytest.approx(3.0)
+
+
+def test_quiet_positions_skip_price_and_tpsl_work(monkeypatch):
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000", "markPrice": "50020"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600", "markPrice": "599.7"},
+    ]
+    client = _FakePositionClient(positions, {"BTCUSDT": 50020.0, "BNBUSDT": 599.7})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager, "_calculate_symbol_specific_tp_sl",
+                        lambda *a, **k: pytest.fail("TP/SL computed for a quiet position"))
+
+    assert trade_manager.manage_open_positions()["closed"] == 0
+    assert client.mark_calls == []
+
+
+def test_positions_are_closed_concurrently(monkeypatch, tmp_path):
+    from core import trade_state_manager
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(trade_state_manager, "_trade_states", {})
+    monkeypatch.setattr(trade_state_manager, "_last_exit_attempt", {})
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+        {"symbol": "SOLUSDT", "positionAmt": "2", "entryPrice": "100"},
+    ]
+    client = _FakePositionClient(positions, {"BTCUSDT": 52000.0, "BNBUSDT": 540.0, "SOLUSDT": 90.0})
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fake_close(symbol, side, qty, max_retries=3):
+        if symbol == "SOLUSDT":
+            return {"status": "error", "message": "rejected"}
+        barrier.wait()  # Both closes must be in flight at once
+        return {"status": "success", "price": client.marks[symbol]}
+
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager, "close_position", fake_close)
+    monkeypatch.setattr(trade_manager, "_append_trade_close", lambda *a, **k: None)
+    monkeypatch.setattr(trade_manager, "update_decision_with_outcome", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "update_learning_from_csv_logs", lambda **k: None)
+    monkeypatch.setattr(trade_manager, "TELEGRAM_ENABLED", False)
+
+    result = trade_manager.manage_open_positions()
+
+    assert result["closed"] == 2
+    assert result["take_profit"] == 2
+    assert result["stop_loss"] == 0
+    assert result["total_pnl"] == pytest.approx(20.0 + 60.0)
+    assert result["errors"] == ["SOLUSDT: Close failed - rejected"]
+
+
+def test_live_monitor_rest_pass_uses_account_wide_calls(monkeypatch):
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+    ]
+    order_calls = []
+
+    class _MonitorClient(_FakePositionClient):
+        def futures_position_information(self, symbol=None):
+            assert symbol is None
+            trade_manager._live_monitor_stop.set()  # Run a single pass
+            return super().futures_position_information()
+
+        def futures_get_open_orders(self, **kwargs):
+            order_calls.append(kwargs)
+            return [{"symbol": "BTCUSDT", "type": "STOP_MARKET", "closePosition": True}]
+
+    client = _MonitorClient(positions, {"BTCUSDT": 50010.0, "BNBUSDT": 599.9})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager.market_stream, "start_streams", lambda *a, **k: False)
+    monkeypatch.setattr(trade_manager, "_live_monitor_stop", threading.Event())
+
+    trade_manager.live_monitor_loop(interval=60)
+
+    assert client.mark_calls == [{}]
+    assert order_calls == [{}]
+    assert client.ticker_calls == []
+
+
+def test_evaluate_tpsl_matches_per_position_checks():
+    np = trade_manager.np
+    entry = np.array([50000.0, 600.0, 100.0, 200.0])
+    mark = np.array([51000.0, 590.0, 99.0, 203.0])
+    is_long = np.array([True, False, True, False])
+
+    roi, tp_price, sl_price, hit_tp, hit_sl = trade_manager._evaluate_tpsl(
+        entry, mark, is_long, np.full(4, 2.0), np.full(4, 1.0))
+
+    assert roi == pytest.approx([2.0, 10 / 6, -1.0, -1.5])
+    assert tp_price == pytest.approx([51000.0, 588.0, 102.0, 196.0])
+    assert sl_price == pytest.approx([49500.0, 606.0, 99.0, 202.0])
+    assert hit_tp.tolist() == [True, False, False, False]
+    assert hit_sl.tolist() == [False, False, True, True]
+
+
+def test_background_tasks_drop_oldest_when_full(monkeypatch):
+    import queue
+
+    ran = []
+    monkeypatch.setattr(trade_manager, "_notify_queue", queue.Queue(maxsize=2))
+    monkeypatch.setattr(trade_manager, "_ensure_notify_worker", lambda: None)
+
+    for i in range(3):
+        trade_manager._run_in_background(ran.append, i)
+
+    while not trade_manager._notify_queue.empty():
+        fn, args, kwargs = trade_manager._notify_queue.get_nowait()
+        fn(*args, **kwargs)
+    assert ran == [1, 2]
+
+
+def test_partial_close_qty_uses_exchange_step(monkeypatch):
+    class _InfoClient:
+        def futures_exchange_info(self):
+            return {"symbols": [
+                {"symbol": "BTCUSDT", "filters": [
+                    {"filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                    {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+                ]},
+                {"symbol": "DOGEUSDT", "filters": [{"filterType": "LOT_SIZE", "stepSize": "1", "minQty": "1"}]},
+            ]}
+
+    monkeypatch.setattr(trade_manager, "_sym_meta", {})
+    assert trade_manager._round_to_step("BNBUSDT", 0.12345) == (0.1235, 0.0001)
+
+    trade_manager._load_symbol_meta(_InfoClient())
+
+    assert trade_manager._round_to_step("BTCUSDT", 0.003) == (0.003, 0.001)
+    assert trade_manager._round_to_step("BTCUSDT", 0.0049) == (0.004, 0.001)
+    assert trade_manager._round_to_step("DOGEUSDT", 12.7) == (12, 1.0)
+
+
+def test_rate_limited_reads_back_off_and_pause_manager(monkeypatch):
+    from binance.exceptions import BinanceAPIException
+    from core import binance_error_handler
+
+    class _Response:
+        headers = {"Retry-After": "3"}
+
+    calls = []
+    sleeps = []
+
+    def throttled():
+        calls.append(1)
+        if len(calls) < 2:
+            raise BinanceAPIException(_Response(), 429, '{"code": -1003, "msg": "Too many requests"}')
+        return "ok"
+
+    monkeypatch.setattr(binance_error_handler, "_ban_until", 0.0)
+    monkeypatch.setattr(trade_manager.time, "sleep", sleeps.append)
+
+    assert trade_manager._binance_call(throttled) == "ok"
+    assert sleeps == [3.0]
+    assert binance_error_handler.rate_limit_remaining() > 0
+
+    client = _FakePositionClient([{"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"}], {})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    result = trade_manager.manage_open_positions()
+    assert result["closed"] == 0
+    assert "Rate limited" in result["errors"][0]
+    assert client.mark_calls == []
+
+
+def test_partial_close_breakeven_uses_pass_snapshot(monkeypatch):
+    positions = [{"symbol": "BTCUSDT", "positionAmt": "0.04", "entryPrice": "50000", "leverage": "5"}]
+    tpsl_calls = []
+
+    class _MonitorClient(_FakePositionClient):
+        def futures_position_information(self, symbol=None):
+            trade_manager._live_monitor_stop.set()  # Run a single pass
+            return super().futures_position_information()
+
+        def futures_get_open_orders(self, **kwargs):
+            return []
+
+    def no_refetch(symbol):
+        raise AssertionError("position re-fetched after partial close")
+
+    client = _MonitorClient(positions, {"BTCUSDT": 50200.0})
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager.market_stream, "start_streams", lambda *a, **k: False)
+    monkeypatch.setattr(trade_manager, "_live_monitor_stop", threading.Event())
+    monkeypatch.setattr(trade_manager, "_partial_close_executed", set())
+    monkeypatch.setattr(trade_manager, "_calculate_symbol_specific_tp_sl", lambda symbol, entry: (2.0, 1.0))
+    monkeypatch.setattr(trade_manager, "place_futures_order",
+                        lambda **kw: {"status": "success", "qty": kw["qty"], "price": 50200.0})
+    monkeypatch.setattr(trade_manager, "get_current_position", no_refetch)
+    monkeypatch.setattr(trade_manager, "place_take_profit_and_stop_loss",
+                        lambda *a, **kw: tpsl_calls.append((a, kw)))
+
+    trade_manager.live_monitor_loop(interval=60)
+
+    (args, kwargs), = tpsl_calls
+    assert args[3] == pytest.approx(0.03)
+    assert args[4] == pytest.approx(51000.0)
+    assert kwargs["leverage"] == "5"
+
+
+def test_live_monitor_ticker_fallback_is_one_request(monkeypatch):
+    positions = [
+        {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "600"},
+        {"symbol": "BNBUSDT", "positionAmt": "-1", "entryPrice": "600"},
+    ]
+
+    class _MonitorClient(_FakePositionClient):
+        def futures_position_information(self, symbol=None):
+            trade_manager._live_monitor_stop.set()  # Run a single pass
+            return super().futures_position_information()
+
+        def futures_get_open_orders(self, **kwargs):
+            return []
+
+    client = _MonitorClient(positions, {})  # Batch mark prices miss every symbol
+    monkeypatch.setattr(trade_manager, "get_futures_client", lambda: client)
+    monkeypatch.setattr(trade_manager.market_stream, "start_streams", lambda *a, **k: False)
+    monkeypatch.setattr(trade_manager, "_live_monitor_stop", threading.Event())
+
+    trade_manager.live_monitor_loop(interval=60)
+
+    assert client.ticker_calls == [None]
@@ -0,0 +1,79 @@
+"""
+Unit tests for the trade state machine
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import trade_state_manager
+from core.trade_state_manager import (
+    try_begin_exit,
+    is_exit_allowed,
+    record_exit_complete,
+    reset_trade_state,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_states(monkeypatch):
+    monkeypatch.setattr(trade_state_manager, "_trade_states", {})
+    monkeypatch.setattr(trade_state_manager, "_last_exit_attempt", {})
+
+
+def test_exit_lifecycle():
+    assert is_exit_allowed("BTCUSDT")
+    assert try_begin_exit("BTCUSDT")
+    assert trade_state_manager.get_trade_state("BTCUSDT") == "CLOSING"
+    assert not try_begin_exit("BTCUSDT")
+
+    record_exit_complete("BTCUSDT")
+    assert trade_state_manager.get_trade_state("BTCUSDT") == "CLOSED"
+    assert "BTCUSDT" not in trade_state_manager._last_exit_attempt
+    assert not is_exit_allowed("BTCUSDT")
+
+    reset_trade_state("BTCUSDT")
+    assert try_begin_exit("BTCUSDT")
+
+
+def test_concurrent_exit_has_single_winner():
+    results = []
+    barrier = threading.Barrier(16)
+
+    def worker():
+        barrier.wait()
+        results.append(try_begin_exit("BNBUSDT"))
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results.count(True) == 1
+
+
+def test_tpsl_hash_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(trade_state_manager, "_tpsl_order_hashes", trade_state_manager.OrderedDict())
+    monkeypatch.setattr(trade_state_manager, "TPSL_HASH_CACHE_SIZE", 4)
+
+    first = trade_state_manager.generate_tpsl_hash("BTCUSDT", "long", 51000.004, 49000.0)
+    assert first == trade_state_manager.generate_tpsl_hash("BTCUSDT", "long", 51000.0, 49000.0)
+    trade_state_manager.register_tpsl_order("BTCUSDT", first)
+    assert trade_state_manager.is_tpsl_duplicate("BTCUSDT", first)
+
+    for i in range(4):
+        h = trade_state_manager.generate_tpsl_hash(f"SYM{i}USDT", "short", 1.0, 2.0)
+        trade_state_manager.register_tpsl_order(f"SYM{i}USDT", h)
+
+    assert len(trade_state_manager._tpsl_order_hashes) == 4
+    assert not trade_state_manager.is_tpsl_duplicate("BTCUSDT", first)
+
+    h = trade_state_manager.generate_tpsl_hash("SYM0USDT", "short", 1.0, 2.0)
+    trade_state_manager.clear_tpsl_hashes("SYM0USDT")
+    assert not trade_state_manager.is_tpsl_duplicate("SYM0USDT", h)
+    assert trade_state_manager.is_tpsl_duplicate("SYM3USDT", trade_state_manager.generate_tpsl_hash("SYM3USDT", "short", 1.0, 2.0))
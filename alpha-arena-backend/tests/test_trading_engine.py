@@ -0,0 +1,296 @@
+"""
+Unit tests for the trading engine helpers
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import trading_engine
+from core.portfolio import Portfolio
+
+
+def test_close_all_positions_prices_each_symbol_once(monkeypatch):
+    calls = []
+
+    def fake_ohlcv(symbol, timeframe="1m", limit=1):
+        calls.append(symbol)
+        if symbol == "SOL/USDT":
+            raise RuntimeError("network down")
+        return pd.DataFrame({"c": [{"BTC/USDT": 51000.0, "BNB/USDT": 590.0}[symbol]]})
+
+    monkeypatch.setattr(trading_engine, "_get_data", lambda: None)
+    monkeypatch.setattr(trading_engine, "fetch_ohlcv", fake_ohlcv)
+
+    alpha = Portfolio("alpha", capital=10000)
+    alpha.open_position("BTC/USDT", "long", 0.01, 50000.0)
+    alpha.open_position("SOL/USDT", "long", 1.0, 150.0)
+    beta = Portfolio("beta", capital=10000)
+    beta.open_position("BTC/USDT", "short", 0.01, 52000.0)
+    beta.open_position("BNB/USDT", "short", 1.0, 600.0)
+
+    summary = trading_engine.close_all_positions({"alpha": alpha, "beta": beta})
+
+    assert sorted(calls) == ["BNB/USDT", "BTC/USDT", "SOL/USDT"]
+    assert summary["total_positions_closed"] == 3
+    assert summary["total_pnl"] == pytest.approx(10.0 + 10.0 + 10.0)
+    assert "SOL/USDT" in alpha.get_open_positions()
+
+
+def test_close_all_positions_uses_one_ticker_request(monkeypatch):
+    ticker_calls = []
+
+    class _TickerClient:
+        def futures_symbol_ticker(self):
+            ticker_calls.append(1)
+            return [{"symbol": "BTCUSDT", "price": "51000"}, {"symbol": "ETHUSDT", "price": "3000"}]
+
+    def fake_ohlcv(symbol, timeframe="1m", limit=1):
+        assert symbol == "BNB/USDT"
+        return pd.DataFrame({"c": [590.0]})
+
+    monkeypatch.setattr(trading_engine, "_get_data", lambda: _TickerClient())
+    monkeypatch.setattr(trading_engine, "fetch_ohlcv", fake_ohlcv)
+
+    portfolio = Portfolio("alpha", capital=10000)
+    portfolio.open_position("BTC/USDT", "long", 0.01, 50000.0)
+    portfolio.open_position("BNB/USDT", "short", 1.0, 600.0)
+
+    summary = trading_engine.close_all_positions({"alpha": portfolio})
+
+    assert ticker_calls == [1]
+    assert summary["total_pnl"] == pytest.approx(10.0 + 10.0)
+
+
+def test_batch_ticker_respects_market_breaker(monkeypatch):
+    from core.binance_error_handler import EndpointUnavailable
+
+    endpoints = []
+
+    def breaker_open(endpoint, fn, *args, **kwargs):
+        endpoints.append(endpoint)
+        raise EndpointUnavailable("circuit open")
+
+    class _TickerClient:
+        def futures_symbol_ticker(self):
+            raise AssertionError("Binance called while the market breaker is open")
+
+    monkeypatch.setattr(trading_engine, "_get_data", lambda: _TickerClient())
+    monkeypatch.setattr(trading_engine, "guarded_call", breaker_open)
+
+    assert trading_engine._fetch_ticker_prices() == {}
+    assert endpoints == ["market"]
+
+
+def test_execute_trade_retries_rate_limited_order(monkeypatch):
+    from binance.exceptions import BinanceAPIException
+    from core import binance_error_handler
+
+    class _Response:
+        headers = {"Retry-After": "1"}
+
+    attempts = []
+
+    def throttled_place_order(**kwargs):
+        attempts.append(kwargs)
+        if len(attempts) == 1:
+            raise BinanceAPIException(_Response(), 429, '{"code": -1003, "msg": "Too many requests"}')
+        return {"orderId": 7, "side": "BUY", "origQty": "0.01", "executedQty": "0.01", "status": "FILLED"}
+
+    monkeypatch.setattr(binance_error_handler, "_ban_until", 0.0)
+    monkeypatch.setattr(binance_error_handler.time, "sleep", lambda s: None)
+    monkeypatch.setattr(trading_engine, "choose_trade_client", lambda account_type: object())
+    monkeypatch.setattr(trading_engine, "binance_place_order", throttled_place_order)
+
+    result = trading_engine.execute_trade("BTC/USDT", "buy", 0.01)
+
+    assert result.success
+    assert result.order_id == "7"
+    assert len(attempts) == 2
+
+
+def test_order_breaker_opens_after_outage_and_probes(monkeypatch):
+    from binance.exceptions import BinanceAPIException
+    from core import binance_error_handler
+
+    class _Response:
+        headers = {}
+        text = "Service Unavailable"
+
+    now = [1000.0]
+    calls = []
+    healthy = [False]
+
+    def flaky_place_order(**kwargs):
+        calls.append(kwargs)
+        if not healthy[0]:
+            raise BinanceAPIException(_Response(), 503, "Service Unavailable")
+        return {"orderId": 9, "side": "SELL", "origQty": "1", "executedQty": "1", "status": "FILLED"}
+
+    monkeypatch.setattr(binance_error_handler, "_outage_failures", {})
+    monkeypatch.setattr(binance_error_handler, "_outage_open_until", {})
+    monkeypatch.setattr(binance_error_handler, "_outage_probing", set())
+    monkeypatch.setattr(binance_error_handler.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(trading_engine, "choose_trade_client", lambda account_type: object())
+    monkeypatch.setattr(trading_engine, "binance_place_order", flaky_place_order)
+
+    for _ in range(binance_error_handler.OUTAGE_FAILURE_THRESHOLD):
+        assert not trading_engine.execute_trade("BNB/USDT", "sell", 1.0).success
+    assert len(calls) == binance_error_handler.OUTAGE_FAILURE_THRESHOLD
+
+    result = trading_engine.execute_trade("BNB/USDT", "sell", 1.0)
+    assert "circuit open" in result.error
+    assert len(calls) == binance_error_handler.OUTAGE_FAILURE_THRESHOLD
+
+    now[0] += binance_error_handler.OUTAGE_RECOVERY_SEC + 1
+    healthy[0] = True
+    assert trading_engine.execute_trade("BNB/USDT", "sell", 1.0).success
+    assert binance_error_handler._outage_open_until == {}
+
+
+def test_order_bulkhead_caps_in_flight_calls(monkeypatch):
+    import threading
+    from core import binance_error_handler
+
+    monkeypatch.setattr(binance_error_handler, "_order_slots", threading.BoundedSemaphore(2))
+    lock = threading.Lock()
+    in_flight = [0]
+    peak = [0]
+    release = threading.Event()
+
+    def slow_cancel():
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        release.wait(0.05)
+        with lock:
+            in_flight[0] -= 1
+
+    threads = [threading.Thread(target=binance_error_handler.guarded_call, args=("cancel", slow_cancel))
+               for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+
+
+def test_cancel_all_orders_cancels_per_symbol(monkeypatch):
+    cancelled = []
+
+    class _OrdersClient:
+        def futures_get_open_orders(self):
+            return [
+                {"symbol": "BTCUSDT", "orderId": 1},
+                {"symbol": "BTCUSDT", "orderId": 2},
+                {"symbol": "BNBUSDT", "orderId": 3},
+            ]
+
+        def futures_cancel_all_open_orders(self, symbol):
+            cancelled.append(symbol)
+            if symbol == "BNBUSDT":
+                raise RuntimeError("network down")
+
+        def futures_cancel_order(self, **kwargs):
+            raise AssertionError("per-order cancel")
+
+    monkeypatch.setattr(trading_engine, "choose_trade_client", lambda account_type: _OrdersClient())
+
+    result = trading_engine.cancel_all_orders()
+
+    assert result == {"status": "Cancelled all open orders"}
+    assert sorted(cancelled) == ["BNBUSDT", "BTCUSDT"]
+
+
+def test_fetch_public_ticker_prefers_stream(monkeypatch):
+    from core import market_stream
+
+    monkeypatch.setattr(market_stream, "get_last_price", lambda s: (601.5, 1700000000000) if s == "BNBUSDT" else None)
+    monkeypatch.setattr(trading_engine, "_get_data", lambda: None)
+
+    assert trading_engine.fetch_public_ticker("BNB/USDT") == {
+        "symbol": "BNB/USDT", "last": 601.5, "timestamp": 1700000000000
+    }
+    with pytest.raises(Exception):
+        trading_engine.fetch_public_ticker("BTC/USDT")
+
+
+def test_order_result_to_dict():
+    result = trading_engine.OrderResult(success=True, order_id="1", fee={"USDT": 0.02})
+
+    data = result.to_dict()
+
+    assert data["order_id"] == "1"
+    assert data["fee"] == {"USDT": 0.02}
+    assert isinstance(data["timestamp"], int) and data["timestamp"] > 0
+    assert not hasattr(result, "__dict__")
+
+
+def test_account_summary_uses_account_snapshot_for_balances(monkeypatch):
+    class _AccountClient:
+        def futures_account(self):
+            return {
+                "availableBalance": "900.5",
+                "totalInitialMargin": "99.5",
+                "assets": [{"asset": "BNB", "walletBalance": "2"}, {"asset": "USDT", "walletBalance": "1000"}],
+                "positions": [
+                    {"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000.5", "leverage": "5"},
+                    {"symbol": "ETHUSDT", "positionAmt": "0"},
+                ],
+            }
+
+        def futures_get_open_orders(self):
+            return [{"symbol": "BTCUSDT", "orderId": 1}]
+
+        def futures_account_balance(self):
+            raise AssertionError("separate balance request")
+
+    monkeypatch.setattr(trading_engine, "_get_futures", lambda: _AccountClient())
+
+    summary = trading_engine.get_account_summary()
+
+    assert summary["total_balance"] == 1000.0
+    assert summary["free_balance"] == 900.5
+    assert summary["used_balance"] == 99.5
+    assert summary["open_positions"] == [
+        {"symbol": "BTCUSDT", "positionAmt": 0.01, "entryPrice": 50000.5, "leverage": 5.0}
+    ]
+    assert summary["open_orders"] == [{"symbol": "BTCUSDT", "orderId": 1}]
+
+
+def test_get_futures_position_returns_first_open_entry(monkeypatch):
+    class _PositionClient:
+        def futures_position_information(self, symbol):
+            return [
+                {"symbol": symbol, "positionSide": "LONG", "positionAmt": "0"},
+                {"symbol": symbol, "positionSide": "SHORT", "positionAmt": "-1"},
+            ]
+
+    monkeypatch.setattr(trading_engine, "_get_futures", lambda: _PositionClient())
+
+    assert trading_engine.get_futures_position("BNB/USDT")["positionSide"] == "SHORT"
+
+
+def test_get_futures_position_reads_stream_mirror(monkeypatch):
+    from core import market_stream
+
+    mirrored = [{"symbol": "BTCUSDT", "positionAmt": "0.01", "entryPrice": "50000"}]
+    monkeypatch.setattr(market_stream, "get_positions", lambda: mirrored)
+    monkeypatch.setattr(trading_engine, "_get_futures", lambda: None)
+
+    assert trading_engine.get_futures_position("BTC/USDT") == mirrored[0]
+    assert trading_engine.get_futures_position("BNB/USDT") is None
+
+
+def test_symbol_conversion_is_normalized_and_memoized():
+    trading_engine._bn_sym.cache_clear()
+
+    assert trading_engine._bn_sym("bnb/usdt") == "BNBUSDT"
+    assert trading_engine._bn_sym("BTCUSDT") == "BTCUSDT"
+    trading_engine._bn_sym("bnb/usdt")
+    assert trading_engine._bn_sym.cache_info().hits == 1
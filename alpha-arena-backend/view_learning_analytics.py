@@ -17,6 +17,7 @@ from core.learning_memory import (
     get_recent_performance
 )
 from core.strategy_analytics import (
+    analytics_scope,
     get_strategy_performance_summary,
     recommend_strategy_adjustments
 )
@@ -123,20 +124,21 @@ def main():
         parser.print_help()
         return
     
-    # Execute requested actions
-    if args.all:
-        view_all_performance()
-        print()
-        view_recommendations()
-    
-    if args.recent:
-        view_recent_trades(args.symbol, args.hours)
-    
-    if args.recommendations:
-        view_recommendations()
-    
-    if args.raw:
-        view_raw_data()
+    # Execute requested actions (sharing one strategy-stats snapshot)
+    with analytics_scope():
+        if args.all:
+            view_all_performance()
+            print()
+            view_recommendations()
+        
+        if args.recent:
+            view_recent_trades(args.symbol, args.hours)
+        
+        if args.recommendations:
+            view_recommendations()
+        
+        if args.raw:
+            view_raw_data()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file